@@ -0,0 +1,510 @@
+"""src/turtlefunt/originreturn.py"""
+
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal
+from fractions import Fraction
+from functools import lru_cache
+import heapq
+from loguru import logger
+import math
+import numpy as np
+from sympy import factorint
+from typing import Dict, Iterable, Iterator, List, Optional, Union, Tuple
+
+from .turtlefun_quotientlist import QUOTIENT_LIST_LIMIT, generate_quotient_list, quotient_list
+
+RESIDUE_CHUNK_SIZE = 1 << 20
+# largest modulus of heading_residues that is calculated in int64
+RESIDUE_MAX_MODULUS = 1 << 62
+ESTIMATION_CHUNK_SIZE = 256
+ESTIMATION_CACHE_SIZE = 1 << 16
+VERIFY_BATCH_SIZE = 256
+VERIFY_CHUNK_SIZE = 4096
+# residue products of the verification have to stay within int64
+VERIFY_MAX_MODULUS = math.isqrt((1 << 63) - 1)
+
+
+def theta_fraction(theta:Union[str, int, float, Decimal]) -> Tuple[int, int]:
+    """Return theta / 360° as reduced fraction (numerator, denominator)"""
+    fraction = Fraction(Decimal(str(theta))) / 360
+    fraction -= fraction.numerator // fraction.denominator
+    return fraction.numerator, fraction.denominator
+
+
+def theta_scaled(theta:Union[str, int, float, Decimal]) -> Tuple[int, int]:
+    """Return theta as integer numerator and the number of decimal places k of theta * 10^k"""
+    _sign, _digits, exponent = Decimal(str(theta)).normalize().as_tuple()
+    places = max(0, -exponent)
+    return int(Decimal(str(theta)).scaleb(places)), places
+
+
+def heading_period(theta:Union[str, int, float, Decimal]) -> int:
+    """Number of steps after which the headings of the Euler spiral repeat
+
+    The heading of step k is theta * k * (k + 1) / 2. With theta / 360° = u / p
+    the headings of step k + p differ from those of step k by the constant
+    theta * p * (p + 1) / 2, which is 0° or 180°. In the latter case the
+    headings repeat after 2 * p steps.
+    """
+    numerator, denominator = theta_fraction(theta)
+    if (numerator * (denominator + 1)) % 2 == 0:
+        return denominator
+    return 2 * denominator
+
+
+def symmetry_order(theta:Union[str, int, float, Decimal]) -> int:
+    """Order of the exact rotational symmetry of the Euler spiral step sequence
+
+    If the headings repeat after 2 * p steps, the steps p + 1 to 2 * p point in
+    the opposite direction of the steps 1 to p, so the second half of the
+    path is the first half turned by 180° about the middle of its end points.
+    Any higher order symmetry, e.g. the petals around the dominant angles,
+    is only approximate and can not be composed from a sector.
+
+    Return:
+        2 for a half-turn symmetric period, else 1
+    """
+    _numerator, denominator = theta_fraction(theta)
+    return 2 if heading_period(theta) == 2 * denominator else 1
+
+
+def period_drift(theta:Union[str, int, float, Decimal]) -> Tuple[float, float]:
+    """Move of the turtle over one heading period in units of the stepsize
+
+    The steps are counted per heading residue, so every distinct heading is
+    evaluated once. If the period consists of two halves, the second half
+    cancels the first one exactly and (0, 0) is returned without counting.
+    Otherwise the cost grows with the heading period.
+
+    Return:
+        (x, y) drift
+    """
+    if symmetry_order(theta) == 2:
+        return 0.0, 0.0
+
+    period = heading_period(theta)
+    drift = 0j
+    for start in range(0, period, RESIDUE_CHUNK_SIZE):
+        residues, modulus = heading_residues(theta, start, min(start + RESIDUE_CHUNK_SIZE, period))
+        values, counts = np.unique(residues, return_counts=True)
+        drift += np.sum(counts * np.exp(2j * np.pi * values.astype(np.float64) / modulus))
+    return float(drift.real), float(drift.imag)
+
+
+def origin_return_steps(theta:Union[str, int, float, Decimal]) -> int | None:
+    """Exact number of steps after which the turtle is home again
+
+    After every heading period the turtle continues with the same headings,
+    moved by the drift of the period. With theta / 360° = u / p and p even,
+    the period consists of two halves turned by 180° against each other, so
+    the drift is exactly zero and the turtle is home after 2 * p steps. With
+    p odd, the drift is a quadratic Gauss sum of length sqrt(p) steps, so the
+    turtle moves away with every period and never returns.
+
+    Return:
+        steps until the turtle is home, None if it never returns
+    """
+    if symmetry_order(theta) == 2:
+        return heading_period(theta)
+    return None
+
+
+def heading_residues(
+    theta:Union[str, int, float, Decimal],
+    start:int,
+    stop:int,
+) -> Tuple[np.ndarray, int]:
+    """Exact headings of the steps start to stop - 1
+
+    The heading of step k is 360° * residue / modulus, with residue calculated
+    in integers, so there is no rounding error regardless of the step number.
+    Moduli beyond int64, e.g. of thetas with 19 or more decimals, are
+    calculated step by step in python integers.
+
+    Return:
+        (residues, modulus), residues of int64 or for large moduli of object dtype
+    """
+    numerator, modulus = theta_fraction(theta)
+    if modulus > RESIDUE_MAX_MODULUS:
+        residues = np.empty(max(0, stop - start), dtype=object)
+        residue = (numerator * ((start - 1) * start // 2)) % modulus
+        for step in range(start, stop):
+            residue = (residue + numerator * step) % modulus
+            residues[step - start] = residue
+        return residues, modulus
+
+    # keep the cumulative sums of one chunk within int64
+    chunk = max(1, min(1 << 16, (1 << 62) // modulus))
+
+    residues = np.empty(max(0, stop - start), dtype=np.int64)
+    residue = (numerator * ((start - 1) * start // 2)) % modulus
+    for chunk_start in range(start, stop, chunk):
+        chunk_stop = min(chunk_start + chunk, stop)
+        increments = np.arange(chunk_stop - chunk_start, dtype=np.int64) * numerator
+        increments = (increments + (numerator * chunk_start) % modulus) % modulus
+        block = (residue + np.cumsum(increments)) % modulus
+        residues[chunk_start - start:chunk_stop - start] = block
+        residue = int(block[-1])
+    return residues, modulus
+
+
+def sorted_divisors(exponents:Dict[int, int]) -> Iterator[int]:
+    """Distinct divisors of a number given by its prime exponents, in ascending order
+
+    The divisors are generated lazily from a heap. Every divisor is reached
+    exactly once, by multiplying its prime factors in ascending order, so the
+    cost follows the number of divisors taken instead of the number of prime
+    factor combinations.
+
+    Args:
+        exponents (Dict(int, int)): exponent of every prime factor
+    """
+    primes = sorted(prime for prime, exponent in exponents.items() if exponent > 0)
+    limits = [exponents[prime] for prime in primes]
+    # (divisor, index of its largest prime, exponents of the divisor)
+    heap = [(1, 0, (0,) * len(primes))]
+    while heap:
+        divisor, first, counts = heapq.heappop(heap)
+        yield divisor
+        for index in range(first, len(primes)):
+            if counts[index] < limits[index]:
+                following = counts[:index] + (counts[index] + 1,) + counts[index + 1:]
+                heapq.heappush(heap, (divisor * primes[index], index, following))
+
+
+def smooth_factorization(number:int) -> Dict[int, int]:
+    """Prime exponents of a positive integer
+
+    The step numbers of the estimation are products of the quotients
+    2^a * 3^b * 5^c and small cycle counts, so 2, 3 and 5 are divided out
+    directly and only a remaining cofactor is passed to sympy.
+    """
+    exponents = {}
+    twos = (number & -number).bit_length() - 1
+    if twos:
+        exponents[2] = twos
+        number >>= twos
+    for prime in (3, 5):
+        while number % prime == 0:
+            exponents[prime] = exponents.get(prime, 0) + 1
+            number //= prime
+    if number > 1:
+        for prime, exponent in factorint(number).items():
+            exponents[prime] = exponents.get(prime, 0) + exponent
+    return exponents
+
+
+def origin_return_candidates(theta:Union[str, int, float, Decimal], quotients:List[int]) -> List[int]:
+    """Candidate origin return steps of theta from the quotients of its dominant angles
+
+    All calculations are done in integers on theta * 10^k. The least common
+    multiple of the quotients is run for as many cycles as the angle of one
+    cycle needs to add up to full turns, which is an upper limit for the
+    origin return. Every divisor of the upper limit, whose step number turns
+    the turtle by full turns, is a candidate.
+
+    Return:
+        candidates, the upper limit first and then descending
+    """
+    numerator, places = theta_scaled(theta)
+    modulus = 360 * 10 ** places
+
+    lcm = math.lcm(*quotients)
+    cycle_angle = lcm * (lcm + 1) // 2 * numerator % modulus
+    required_cycles = modulus // math.gcd(cycle_angle, modulus)
+    steps_upper_limit = lcm * required_cycles
+
+    candidates = []
+    for divisor in sorted_divisors(smooth_factorization(steps_upper_limit)):
+        steps = steps_upper_limit // divisor
+        if divisor == 1 or steps * (steps + 1) // 2 * numerator % modulus == 0:
+            candidates.append(steps)
+    return candidates
+
+
+@lru_cache(maxsize=None)
+def _quotient_groups(limit:int) -> Dict[int, List[Tuple[int, Decimal, Decimal]]]:
+    """Entries of the quotient table up to limit grouped by the decimal places of their angle
+
+    The shipped table is used up to its own limit, larger tables are
+    generated on demand.
+
+    Return:
+        {places: [(angle * 10^places, angle, quotient), ...]}
+    """
+    entries = quotient_list() if limit <= QUOTIENT_LIST_LIMIT else generate_quotient_list(limit)
+    groups = {}
+    for angle, quotient, _alpha in entries:
+        numerator, places = theta_scaled(angle)
+        groups.setdefault(places, []).append((numerator, angle, quotient))
+    return groups
+
+
+# quotient indices by decimal places, built once per process or handed over to worker processes
+_QUOTIENT_INDICES: Dict[int, Tuple[List[int], List[Tuple[Decimal, Decimal]]]] = {}
+
+
+def _quotient_index(places:int) -> Tuple[List[int], List[Tuple[Decimal, Decimal]]]:
+    """Angles 360° / quotient with at most places decimals, as ascending integers
+
+    These are the angles down to 10^-places, so the table is extended beyond
+    the shipped one for thetas with more decimals.
+
+    Return:
+        (angles * 10^places, [(angle, quotient), ...]) in ascending order
+    """
+    if places not in _QUOTIENT_INDICES:
+        entries = sorted(
+            (numerator * 10 ** (places - group_places), angle, quotient)
+            for group_places, group in _quotient_groups(max(QUOTIENT_LIST_LIMIT, 360 * 10 ** places)).items()
+            if group_places <= places
+            for numerator, angle, quotient in group
+        )
+        _QUOTIENT_INDICES[places] = (
+            [scaled for scaled, _angle, _quotient in entries], [(angle, quotient) for _scaled, angle, quotient in entries],
+        )
+    return _QUOTIENT_INDICES[places]
+
+
+def dominant_angle_decomposition(theta:Union[str, int, float, Decimal]) -> List[Tuple[Decimal, Decimal]]:
+    """Greedy decomposition of theta into the angles 360° / quotient of the quotient table
+
+    Only angles with no more decimal places than theta are used. The largest
+    angle that fits is found by bisection and taken as often as it fits at
+    once, all in integers on theta * 10^k.
+
+    Return:
+        (angle, quotient) of every dominant angle, repeated, in descending order
+    """
+    remaining, places = theta_scaled(theta)
+    scaled, entries = _quotient_index(places)
+
+    decomposition = []
+    while remaining > 0:
+        index = bisect_right(scaled, remaining) - 1
+        if index < 0:
+            break
+        count, remaining = divmod(remaining, scaled[index])
+        decomposition.extend([entries[index]] * count)
+    return decomposition
+
+
+def normalized_theta(theta:Union[str, int, float, Decimal]) -> str:
+    """Theta as string without trailing zeros, the same for every notation of a value"""
+    numerator, places = theta_scaled(theta)
+    return str(Decimal("{}E-{}".format(numerator, places)))
+
+
+@lru_cache(maxsize=ESTIMATION_CACHE_SIZE)
+def _origin_return_estimate(theta:str) -> Tuple[Tuple[Tuple[Decimal, Decimal], ...], Tuple[int, ...]]:
+    """Dominant angle decomposition and candidates of a normalized theta, cached per process"""
+    decomposition = dominant_angle_decomposition(theta)
+    quotients = [int(quotient) for _angle, quotient in decomposition]
+    return tuple(decomposition), tuple(origin_return_candidates(theta, quotients))
+
+
+def origin_return_estimation(theta:Union[str, int, float, Decimal]) -> List[int]:
+    """Candidate origin return steps of theta, estimated from its dominant angles
+
+    The estimations are kept in a process wide cache keyed by the
+    normalized theta.
+
+    Return:
+        candidates, the upper limit first and then descending
+    """
+    return list(_origin_return_estimate(normalized_theta(theta))[1])
+
+
+def dominant_angles(theta:Union[str, int, float, Decimal]) -> List[Decimal]:
+    """Dominant angles of theta in descending order, repeated as often as they are used"""
+    return [angle for angle, _quotient in _origin_return_estimate(normalized_theta(theta))[0]]
+
+
+def _minimal_origin_return_estimation(theta:Union[str, int, float, Decimal]) -> int:
+    """Smallest candidate origin return step of theta"""
+    return origin_return_estimation(theta)[-1]
+
+
+def _origin_return_estimation_with_dominant_angles(
+    theta:Union[str, int, float, Decimal],
+) -> Tuple[List[Decimal], List[int]]:
+    """Dominant angles and candidate origin return steps of theta from a single estimation"""
+    return dominant_angles(theta), origin_return_estimation(theta)
+
+
+def _estimation_worker_init(indices:Dict[int, Tuple[List[int], List[Tuple[Decimal, Decimal]]]]) -> None:
+    """Take over the quotient indices built by the parent process in a worker process"""
+    _QUOTIENT_INDICES.update(indices)
+
+
+def estimate_origin_return(
+    thetas:Iterable[Union[str, int, float, Decimal]],
+    workers:int | None = None,
+    minimal:bool | None = False,
+    chunksize:int | None = ESTIMATION_CHUNK_SIZE,
+    with_dominant_angles:bool | None = False,
+) -> Union[List[List[int]], List[Tuple[List[Decimal], List[int]]], np.ndarray]:
+    """Estimate the origin return steps of many thetas at once
+
+    The thetas are handed to a process pool in chunks. The quotient indices
+    for the decimal places of the thetas are built once in the calling
+    process and handed to every worker on start, so the table is neither
+    prepared again for every theta nor in every worker. With a single worker
+    the estimation runs in the calling process.
+
+    Args:
+        thetas (Iterable): theta values
+        workers (int): number of worker processes, None for one per CPU
+        minimal (bool): return only the smallest candidate of every theta
+        chunksize (int): number of thetas handed to a worker at once
+        with_dominant_angles (bool): return the dominant angles of every theta along with its candidates
+
+    Return:
+        candidate lists of all thetas, (dominant angles, candidates) of all thetas,
+        or an array of the smallest candidates
+    """
+    if minimal and with_dominant_angles:
+        raise ValueError("Only the full estimation can be returned with the dominant angles")
+    thetas = [str(theta) for theta in thetas]
+    function = origin_return_estimation
+    if minimal:
+        function = _minimal_origin_return_estimation
+    elif with_dominant_angles:
+        function = _origin_return_estimation_with_dominant_angles
+
+    if workers == 1 or len(thetas) <= 1:
+        results = [function(theta) for theta in thetas]
+    else:
+        indices = {places: _quotient_index(places) for places in {theta_scaled(theta)[1] for theta in thetas}}
+        with ProcessPoolExecutor(max_workers=workers, initializer=_estimation_worker_init, initargs=(indices,)) as executor:
+            results = list(executor.map(function, thetas, chunksize=chunksize))
+
+    if minimal:
+        # step numbers beyond int64 are kept as python integers
+        return np.array(results) if results else np.array([], dtype=np.int64)
+    return results
+
+
+def verify_origin_return(
+    thetas:Iterable[Union[str, int, float, Decimal]],
+    max_steps:int | None = None,
+    tolerance:float | None = 1e-6,
+    batch_size:int | None = VERIFY_BATCH_SIZE,
+    chunk_size:int | None = VERIFY_CHUNK_SIZE,
+) -> List[Optional[int]]:
+    """Simulate the Euler spirals of many thetas and find their first return home
+
+    The turtle is home when it is back at the origin and faces the heading of
+    its first step, so the drawing closes instead of continuing mirrored. The
+    thetas are walked in batches, a chunk of steps of every theta of a
+    batch at once. The headings are exact integer residues as in
+    heading_residues, only the positions are summed in floating point, so a
+    return is detected within tolerance steps of the origin. Thetas that
+    returned leave the batch.
+
+    Args:
+        thetas (Iterable): theta values
+        max_steps (int): number of steps to simulate at most, defaults to the heading period of every theta
+        tolerance (float): distance to the origin in units of the stepsize that counts as return
+        batch_size (int): number of thetas simulated together
+        chunk_size (int): number of steps simulated at once
+
+    Return:
+        first return step of every theta, None if it did not return within the simulated steps
+    """
+    thetas = list(thetas)
+    fractions = [theta_fraction(theta) for theta in thetas]
+    if any(modulus > VERIFY_MAX_MODULUS for _numerator, modulus in fractions):
+        raise ValueError("Thetas with more than {} headings can not be verified".format(VERIFY_MAX_MODULUS))
+    limits = [heading_period(theta) if max_steps is None else max_steps for theta in thetas]
+
+    returns = [None] * len(thetas)
+    # batches of similar length, so short spirals do not wait for long ones
+    order = sorted(range(len(thetas)), key=lambda index: limits[index])
+    for batch_start in range(0, len(order), batch_size):
+        batch = np.array(order[batch_start:batch_start + batch_size], dtype=np.int64)
+        numerators = np.array([fractions[index][0] for index in batch], dtype=np.int64)
+        moduli = np.array([fractions[index][1] for index in batch], dtype=np.int64)
+        batch_limits = np.array([limits[index] for index in batch], dtype=np.int64)
+        residues = np.zeros(len(batch), dtype=np.int64)
+        positions = np.zeros(len(batch), dtype=np.complex128)
+
+        start = 0
+        while len(batch) and start < batch_limits.max():
+            steps = np.arange(start, start + chunk_size, dtype=np.int64)
+            increments = numerators[:, None] * (steps[None, :] % moduli[:, None]) % moduli[:, None]
+            # the residue of step k is the one of step k - 1 plus numerator * k
+            block = (residues[:, None] + np.cumsum(increments, axis=1)) % moduli[:, None]
+            path = positions[:, None] + np.cumsum(np.exp(2j * np.pi * block / moduli[:, None]), axis=1)
+
+            # home is at the origin, facing the heading of the first step again
+            headings = (block + numerators[:, None] * ((steps[None, :] + 1) % moduli[:, None])) % moduli[:, None]
+            home = (np.abs(path) < tolerance) & (headings == 0) & (steps[None, :] < batch_limits[:, None])
+            returned = home.any(axis=1)
+            for row in np.flatnonzero(returned):
+                returns[batch[row]] = start + int(np.argmax(home[row])) + 1
+
+            residues = block[:, -1]
+            positions = path[:, -1]
+            start += chunk_size
+            keep = ~returned & (batch_limits > start)
+            batch, numerators, moduli = batch[keep], numerators[keep], moduli[keep]
+            batch_limits, residues, positions = batch_limits[keep], residues[keep], positions[keep]
+        logger.debug("Verified {} out of {} thetas", min(batch_start + batch_size, len(order)), len(order))
+    return returns
+
+
+def origin_return_mismatches(
+    thetas:Iterable[Union[str, int, float, Decimal]],
+    max_steps:int | None = None,
+    workers:int | None = 1,
+) -> List[Tuple[str, int, List[int]]]:
+    """Compare the simulated first returns of thetas with their estimation
+
+    Args:
+        thetas (Iterable): theta values
+        max_steps (int): number of steps to simulate at most, defaults to the heading period of every theta
+        workers (int): number of worker processes of the estimation, None for one per CPU
+
+    Return:
+        (normalized theta, first return, candidates) of every theta that returned
+        after a step number that is not among its candidates
+    """
+    thetas = [normalized_theta(theta) for theta in thetas]
+    returns = verify_origin_return(thetas, max_steps)
+    mismatches = []
+    for theta, steps, candidates in zip(thetas, returns, estimate_origin_return(thetas, workers=workers)):
+        if steps is not None and steps not in candidates:
+            logger.warning("Theta {} returned after {} steps, estimated were {}", theta, steps, candidates)
+            mismatches.append((theta, steps, candidates))
+    return mismatches
+
+
+def thetas_with_return_steps(min_steps:int, max_steps:int, decimals:int | None = 4) -> Iterator[Tuple[str, int]]:
+    """Thetas between 0° and 360° with up to decimals places whose turtle is home after min_steps to max_steps
+
+    With theta / 360° = m / d reduced, theta has up to k decimal places
+    exactly when d divides 360 * 10^k = 2^(3 + k) * 3^2 * 5^(1 + k). The
+    turtle returns for even d only, after 2 * d steps. So the divisors d are
+    taken in ascending order up to max_steps / 2, and every m coprime to d
+    gives one theta, without estimating any theta of the grid.
+
+    Args:
+        min_steps (int): smallest number of steps until the turtle is home
+        max_steps (int): largest number of steps until the turtle is home
+        decimals (int): largest number of decimal places of theta
+
+    Return:
+        (normalized theta, steps) in ascending order of the steps and then of theta
+    """
+    scale = 360 * 10 ** decimals
+    for denominator in sorted_divisors({2: 3 + decimals, 3: 2, 5: 1 + decimals}):
+        steps = 2 * denominator
+        if steps > max_steps:
+            break
+        if denominator % 2 or steps < min_steps:
+            continue
+        for numerator in range(1, denominator):
+            if math.gcd(numerator, denominator) == 1:
+                yield normalized_theta("{}E-{}".format(scale // denominator * numerator, decimals)), steps
@@ -0,0 +1,169 @@
+"""src/turtlefunt/originreturnstore.py"""
+
+from decimal import Decimal
+import json
+from loguru import logger
+import sqlite3
+from typing import Dict, Iterable, List, Union
+
+from .originreturn import (
+    dominant_angles, estimate_origin_return, normalized_theta, origin_return_estimation, origin_return_steps,
+    verify_origin_return,
+)
+
+# SQL NULL marks steps that are not verified yet, the JSON null a turtle that never returns
+ORIGIN_RETURN_SCHEMA = """
+CREATE TABLE IF NOT EXISTS origin_return (
+    theta TEXT PRIMARY KEY,
+    candidates TEXT NOT NULL,
+    dominant_angles TEXT NOT NULL,
+    steps TEXT
+)
+"""
+
+
+class OriginReturnStore:
+    """Persistent SQLite store of origin return estimations keyed by the normalized theta
+
+    Step numbers can exceed 64 bit integers, so candidates and steps are
+    stored as JSON, the dominant angles as JSON list of decimal strings.
+    """
+
+    def __init__(self, filename:str | None = "turtlefun_originreturn.sqlite") -> None:
+        """Open or create the store
+
+        Args:
+            filename (str): path of the SQLite database, ":memory:" for a store of this process only
+        """
+        self.filename = filename
+        self._connection = sqlite3.connect(filename)
+        self._connection.execute(ORIGIN_RETURN_SCHEMA)
+        self._connection.commit()
+
+    def __enter__(self) -> "OriginReturnStore":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM origin_return").fetchone()[0]
+
+    def __contains__(self, theta:Union[str, int, float, Decimal]) -> bool:
+        return self._row(normalized_theta(theta)) is not None
+
+    def close(self) -> None:
+        """Commit pending changes and close the database"""
+        self._connection.commit()
+        self._connection.close()
+
+    def _row(self, key:str) -> tuple | None:
+        return self._connection.execute(
+            "SELECT candidates, dominant_angles, steps FROM origin_return WHERE theta = ?", (key,)
+        ).fetchone()
+
+    def _insert(self, key:str, candidates:List[int], angles:List[Decimal]) -> None:
+        self._connection.execute(
+            "INSERT OR IGNORE INTO origin_return (theta, candidates, dominant_angles) VALUES (?, ?, ?)",
+            (key, json.dumps(candidates), json.dumps([str(angle) for angle in angles])),
+        )
+
+    def _estimated_row(self, theta:Union[str, int, float, Decimal]) -> tuple:
+        """Row of theta, estimated and stored first if it is missing"""
+        key = normalized_theta(theta)
+        row = self._row(key)
+        if row is None:
+            self._insert(key, origin_return_estimation(key), dominant_angles(key))
+            self._connection.commit()
+            row = self._row(key)
+        return row
+
+    def estimation(self, theta:Union[str, int, float, Decimal]) -> List[int]:
+        """Candidate origin return steps of theta, the upper limit first and then descending"""
+        return json.loads(self._estimated_row(theta)[0])
+
+    def dominant_angles(self, theta:Union[str, int, float, Decimal]) -> List[Decimal]:
+        """Dominant angles of theta in descending order"""
+        return [Decimal(angle) for angle in json.loads(self._estimated_row(theta)[1])]
+
+    def return_steps(self, theta:Union[str, int, float, Decimal]) -> int | None:
+        """Number of steps until the turtle is home, None if it never returns
+
+        Verified steps are taken from the store. Without them the exact step
+        number is calculated, but not recorded, so the theta is still
+        simulated by verify.
+        """
+        key = normalized_theta(theta)
+        steps = self._estimated_row(key)[2]
+        if steps is None:
+            return origin_return_steps(key)
+        return json.loads(steps)
+
+    def set_return_steps(self, theta:Union[str, int, float, Decimal], steps:int | None) -> None:
+        """Record the verified return steps of theta, None if the turtle never returns"""
+        key = normalized_theta(theta)
+        self._estimated_row(key)
+        self._connection.execute("UPDATE origin_return SET steps = ? WHERE theta = ?", (json.dumps(steps), key))
+        self._connection.commit()
+
+    def estimate(
+        self,
+        thetas:Iterable[Union[str, int, float, Decimal]],
+        workers:int | None = None,
+    ) -> Dict[str, List[int]]:
+        """Candidates of many thetas, only the ones missing in the store are estimated
+
+        Args:
+            thetas (Iterable): theta values
+            workers (int): number of worker processes for the missing thetas, None for one per CPU
+
+        Return:
+            {normalized theta: candidates}
+        """
+        keys = list(dict.fromkeys(normalized_theta(theta) for theta in thetas))
+        estimations = {}
+        for key in keys:
+            row = self._row(key)
+            if row is not None:
+                estimations[key] = json.loads(row[0])
+
+        missing = [key for key in keys if key not in estimations]
+        logger.debug("{} out of {} thetas are missing in {}", len(missing), len(keys), self.filename)
+        if missing:
+            results = estimate_origin_return(missing, workers=workers, with_dominant_angles=True)
+            for key, (angles, candidates) in zip(missing, results):
+                self._insert(key, candidates, angles)
+                estimations[key] = candidates
+            self._connection.commit()
+        return {key: estimations[key] for key in keys}
+
+    def verify(
+        self,
+        thetas:Iterable[Union[str, int, float, Decimal]],
+        max_steps:int | None = None,
+    ) -> Dict[str, int | None]:
+        """Simulate the first return of the thetas without verified steps and record it
+
+        Args:
+            thetas (Iterable): theta values
+            max_steps (int): number of steps to simulate at most, defaults to the heading period of every theta
+
+        Return:
+            {normalized theta: first return}, None if the turtle did not return within the simulated steps
+        """
+        keys = list(dict.fromkeys(normalized_theta(theta) for theta in thetas))
+        self.estimate(keys, workers=1)
+        verified = {}
+        for key in keys:
+            steps = self._row(key)[2]
+            if steps is not None:
+                verified[key] = json.loads(steps)
+
+        missing = [key for key in keys if key not in verified]
+        for key, steps in zip(missing, verify_origin_return(missing, max_steps)):
+            # without a return there is only a verified step number when the full heading period was walked
+            if steps is not None or max_steps is None:
+                self._connection.execute("UPDATE origin_return SET steps = ? WHERE theta = ?", (json.dumps(steps), key))
+            verified[key] = steps
+        self._connection.commit()
+        return {key: verified[key] for key in keys}
@@ -0,0 +1,202 @@
+"""src/turtlefunt/pngstream.py"""
+
+from loguru import logger
+from PIL import Image
+import struct
+from typing import Iterator
+import zlib
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+PNG_COLOR_TYPES = {
+    "RGB": (2, 3),
+    "RGBA": (6, 4),
+    "P": (3, 1),
+}
+
+
+class PNGStreamWriter:
+    """Write a PNG file strip by strip, without holding the full image in memory"""
+
+    def __init__(
+        self,
+        filename:str,
+        width:int,
+        height:int,
+        mode:str | None = "RGB",
+        compresslevel:int | None = 6,
+        palette:bytes | None = None,
+        transparency:int | None = None,
+    ) -> None:
+        """Open the PNG file and write the header
+
+        Args:
+            filename (str): path of the PNG file to be written
+            width (int): width of the final image
+            height (int): height of the final image
+            mode (str): PIL image mode of the strips ("RGB", "RGBA" or "P")
+            compresslevel (int): zlib compression level
+            palette (bytes): RGB triplets of the palette entries, required for mode "P"
+            transparency (int): palette index of the transparent color in mode "P"
+        """
+        if mode not in PNG_COLOR_TYPES:
+            raise ValueError("Unsupported PNG stream mode {}".format(mode))
+        if mode == "P" and (palette is None or len(palette) % 3 != 0 or not 0 < len(palette) <= 3 * 256):
+            raise ValueError("Mode P requires a palette of 1 to 256 RGB triplets")
+
+        self.filename = filename
+        self.width = width
+        self.height = height
+        self.mode = mode
+        self._color_type, self._channels = PNG_COLOR_TYPES[mode]
+        self._rows = 0
+        self._compressor = zlib.compressobj(compresslevel)
+
+        self._file = open(filename, "wb")
+        self._file.write(PNG_SIGNATURE)
+        self._write_chunk(
+            b"IHDR",
+            struct.pack(">IIBBBBB", width, height, 8, self._color_type, 0, 0, 0),
+        )
+        if mode == "P":
+            self._write_chunk(b"PLTE", palette)
+            if transparency is not None:
+                # alpha of the palette entries up to the transparent one
+                self._write_chunk(b"tRNS", b"\xff" * transparency + b"\x00")
+
+    def __enter__(self) -> "PNGStreamWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is not None:
+            self._file.close()
+            return
+        self.close()
+
+    def _write_chunk(self, chunk_type:bytes, data:bytes) -> None:
+        """Write a single PNG chunk including length and checksum"""
+        self._file.write(struct.pack(">I", len(data)))
+        self._file.write(chunk_type)
+        self._file.write(data)
+        self._file.write(struct.pack(">I", zlib.crc32(chunk_type + data) & 0xFFFFFFFF))
+
+    def _filtered_rows(self, image:Image.Image) -> Iterator[bytes]:
+        """Rows of an image with filter type 0 (None) in front of every row"""
+        data = image.tobytes()
+        stride = self.width * self._channels
+        for row in range(image.height):
+            yield b"\x00" + data[row * stride:(row + 1) * stride]
+
+    def write(self, strip:Image.Image) -> None:
+        """Append the rows of an image strip to the PNG file
+
+        Args:
+            strip (Image): strip of full image width in the mode of the writer
+        """
+        if strip.width != self.width or strip.mode != self.mode:
+            raise ValueError(
+                "Strip of size {} and mode {} does not match {}x{} {} stream".format(
+                    strip.size, strip.mode, self.width, self.height, self.mode
+                )
+            )
+        if self._rows + strip.height > self.height:
+            raise ValueError("Strip exceeds the image height of {}".format(self.height))
+
+        compressed = b"".join(self._compressor.compress(row) for row in self._filtered_rows(strip))
+        if compressed:
+            self._write_chunk(b"IDAT", compressed)
+        self._rows += strip.height
+        logger.trace("Wrote rows {} out of {} to {}", self._rows, self.height, self.filename)
+
+    def close(self) -> None:
+        """Finish the compressed stream and close the file"""
+        if self._file.closed:
+            return
+        if self._rows != self.height:
+            self._file.close()
+            raise ValueError("Only {} out of {} rows were written".format(self._rows, self.height))
+        self._write_chunk(b"IDAT", self._compressor.flush())
+        self._write_chunk(b"IEND", b"")
+        self._file.close()
+
+
+class APNGStreamWriter(PNGStreamWriter):
+    """Write an animated PNG file frame by frame, without holding all frames in memory"""
+
+    def __init__(
+        self,
+        filename:str,
+        width:int,
+        height:int,
+        frames:int,
+        mode:str | None = "RGB",
+        duration:int | None = 40,
+        loop:int | None = 0,
+        compresslevel:int | None = 6,
+        palette:bytes | None = None,
+        transparency:int | None = None,
+    ) -> None:
+        """Open the PNG file and write the header and the animation control chunk
+
+        Args:
+            filename (str): path of the PNG file to be written
+            width (int): width of the frames
+            height (int): height of the frames
+            frames (int): number of frames that will be written
+            mode (str): PIL image mode of the frames ("RGB", "RGBA" or "P")
+            duration (int): display duration of every frame in ms
+            loop (int): number of times the animation is played, 0 for infinite
+            compresslevel (int): zlib compression level
+            palette (bytes): RGB triplets of the palette entries, required for mode "P"
+            transparency (int): palette index of the transparent color in mode "P"
+        """
+        super().__init__(filename, width, height, mode, compresslevel, palette, transparency)
+        self.frames = frames
+        self.duration = duration
+        self._compresslevel = compresslevel
+        self._frame = 0
+        self._sequence = 0
+        self._write_chunk(b"acTL", struct.pack(">II", frames, loop))
+
+    def write(self, frame:Image.Image) -> None:
+        """Append a full size frame to the animation
+
+        The first frame is stored as the default image, so viewers without
+        animation support show it.
+
+        Args:
+            frame (Image): frame of full image size in the mode of the writer
+        """
+        if frame.size != (self.width, self.height) or frame.mode != self.mode:
+            raise ValueError(
+                "Frame of size {} and mode {} does not match {}x{} {} animation".format(
+                    frame.size, frame.mode, self.width, self.height, self.mode
+                )
+            )
+        if self._frame >= self.frames:
+            raise ValueError("Animation exceeds the number of {} frames".format(self.frames))
+
+        self._write_chunk(
+            b"fcTL",
+            struct.pack(">IIIIIHHBB", self._sequence, self.width, self.height, 0, 0, self.duration, 1000, 0, 0),
+        )
+        self._sequence += 1
+        compressor = zlib.compressobj(self._compresslevel)
+        compressed = b"".join(compressor.compress(row) for row in self._filtered_rows(frame)) + compressor.flush()
+        if self._frame == 0:
+            self._write_chunk(b"IDAT", compressed)
+        else:
+            self._write_chunk(b"fdAT", struct.pack(">I", self._sequence) + compressed)
+            self._sequence += 1
+        self._frame += 1
+        logger.trace("Wrote frame {} out of {} to {}", self._frame, self.frames, self.filename)
+
+    def close(self) -> None:
+        """Finish the animation and close the file"""
+        if self._file.closed:
+            return
+        if self._frame != self.frames:
+            self._file.close()
+            raise ValueError("Only {} out of {} frames were written".format(self._frame, self.frames))
+        self._write_chunk(b"IEND", b"")
+        self._file.close()
@@ -0,0 +1,446 @@
+"""src/turtlefunt/raster.py"""
+
+import math
+import numpy as np
+from typing import Iterator, List, Tuple, Union
+
+RASTER_BATCH_SIZE = 1 << 22
+SEGMENT_GRID_CELL_SEGMENTS = 16
+
+
+def rasterize_path(
+    index_map:np.ndarray,
+    xpos:np.ndarray,
+    ypos:np.ndarray,
+    steps:np.ndarray | None = None,
+    segments:np.ndarray | None = None,
+) -> None:
+    """Rasterize a path one pixel wide into a step index map
+
+    Every pixel of segment n (position n to position n + 1) is set to the
+    step number of position n plus one, 0 is left for the background. Where
+    segments cross, the latest step wins, like drawing the segments in order.
+    The cost depends on the number of pixels touched, not on Python calls.
+
+    Args:
+        index_map (np.ndarray): unsigned integer map of shape (height, width), updated in place
+        xpos (np.ndarray): x pixel positions
+        ypos (np.ndarray): y pixel positions
+        steps (np.ndarray): turtle step of every position, defaults to the position index
+        segments (np.ndarray): indices of the segments to rasterize, defaults to all
+    """
+    for xsample, ysample, values, _xmajor in _path_samples(xpos, ypos, steps, segments, index_map.dtype):
+        _set_pixels(index_map, xsample, ysample, values)
+
+
+def rasterize_path_antialiased(
+    index_map:np.ndarray,
+    coverage:np.ndarray,
+    xpos:np.ndarray,
+    ypos:np.ndarray,
+    steps:np.ndarray | None = None,
+    segments:np.ndarray | None = None,
+) -> None:
+    """Rasterize a path one pixel wide with Wu style anti-aliasing
+
+    Every sample along the major axis of a segment splits its coverage
+    between the two pixels next to it on the minor axis. The coverage map
+    keeps the maximum coverage of every pixel, the index map the latest
+    step, as in rasterize_path. Integer coverage maps hold the coverage in
+    units of the maximum of their type, e.g. 1 / 255 for uint8.
+
+    Args:
+        index_map (np.ndarray): unsigned integer map of shape (height, width), updated in place
+        coverage (np.ndarray): float or unsigned integer map of shape (height, width), updated in place
+        xpos (np.ndarray): x pixel positions
+        ypos (np.ndarray): y pixel positions
+        steps (np.ndarray): turtle step of every position, defaults to the position index
+        segments (np.ndarray): indices of the segments to rasterize, defaults to all
+    """
+    for xsample, ysample, values, xmajor in _path_samples(xpos, ypos, steps, segments, index_map.dtype):
+        major = np.where(xmajor, xsample, ysample)
+        minor = np.where(xmajor, ysample, xsample)
+        lower = np.floor(minor)
+        fraction = minor - lower
+        for minor_pixel, weight in ((lower, 1 - fraction), (lower + 1, fraction)):
+            covered = weight > 0
+            xpixel = np.where(xmajor, major, minor_pixel)[covered]
+            ypixel = np.where(xmajor, minor_pixel, major)[covered]
+            _set_pixels(index_map, xpixel, ypixel, values[covered])
+            weight = weight[covered]
+            if np.issubdtype(coverage.dtype, np.integer):
+                weight = np.rint(weight * np.iinfo(coverage.dtype).max)
+            _set_pixels(coverage, xpixel, ypixel, weight.astype(coverage.dtype))
+
+
+def _path_samples(
+    xpos:np.ndarray,
+    ypos:np.ndarray,
+    steps:np.ndarray | None,
+    segments:np.ndarray | None,
+    dtype:np.dtype,
+) -> Iterator[Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]]:
+    """Sample the segments of a path at most one pixel apart, in batches
+
+    Return:
+        iterator over (x, y, step number + 1, x is major axis) of the samples
+    """
+    if steps is None:
+        steps = np.arange(len(xpos))
+    values = steps.astype(dtype) + 1
+
+    yield xpos[:1], ypos[:1], values[:1], np.ones(1, dtype=bool)
+
+    if segments is None:
+        segments = np.arange(len(xpos) - 1)
+    dx = xpos[segments + 1] - xpos[segments]
+    dy = ypos[segments + 1] - ypos[segments]
+    xpos = xpos[segments]
+    ypos = ypos[segments]
+    values = values[segments]
+    samples = np.ceil(np.maximum(np.abs(dx), np.abs(dy))).astype(np.int64) + 1
+    bounds = np.concatenate(([0], np.cumsum(samples)))
+
+    # split the segments in batches of roughly RASTER_BATCH_SIZE samples
+    first = 0
+    while first < len(dx):
+        last = int(np.searchsorted(bounds, bounds[first] + RASTER_BATCH_SIZE, side="right")) - 1
+        last = min(max(last, first + 1), len(dx))
+        counts = samples[first:last]
+        segment = np.repeat(np.arange(first, last), counts)
+        starts = np.repeat(bounds[first:last] - bounds[first], counts)
+        fraction = (np.arange(len(segment)) - starts) / np.maximum(samples[segment] - 1, 1)
+        yield (
+            xpos[segment] + dx[segment] * fraction,
+            ypos[segment] + dy[segment] * fraction,
+            values[segment],
+            np.abs(dx[segment]) >= np.abs(dy[segment]),
+        )
+        first = last
+
+
+def _set_pixels(
+    index_map:np.ndarray,
+    xpos:np.ndarray,
+    ypos:np.ndarray,
+    values:np.ndarray,
+) -> None:
+    """Set pixels inside the map to the maximum of their value and values"""
+    height, width = index_map.shape
+    column = np.floor(xpos + 0.5).astype(np.int64)
+    row = np.floor(ypos + 0.5).astype(np.int64)
+    inside = (column >= 0) & (column < width) & (row >= 0) & (row < height)
+    np.maximum.at(index_map.reshape(-1), row[inside] * width + column[inside], values[inside])
+
+
+def disk_offsets(linewidth:int) -> List[Tuple[int, int]]:
+    """Pixel offsets of a disk with diameter linewidth"""
+    radius = linewidth / 2
+    reach = int(math.ceil(radius))
+    return [
+        (dx, dy)
+        for dy in range(-reach, reach + 1)
+        for dx in range(-reach, reach + 1)
+        if dx * dx + dy * dy < radius * radius
+    ] or [(0, 0)]
+
+
+def dilate(index_map:np.ndarray, linewidth:int) -> np.ndarray:
+    """Grow a one pixel path to linewidth with a disk in a single pass
+
+    Every pixel takes the maximum of the disk around it, so overlapping lines
+    keep the latest step, the same way as round joins drawn in order.
+    """
+    height, width = index_map.shape
+    dilated = index_map.copy()
+    for dx, dy in disk_offsets(linewidth):
+        if dx == 0 and dy == 0:
+            continue
+        target = dilated[max(dy, 0):height + min(dy, 0), max(dx, 0):width + min(dx, 0)]
+        source = index_map[max(-dy, 0):height + min(-dy, 0), max(-dx, 0):width + min(-dx, 0)]
+        np.maximum(target, source, out=target)
+    return dilated
+
+
+def dilate_coverage(coverage:np.ndarray, linewidth:int) -> np.ndarray:
+    """Grow an anti-aliased one pixel path to linewidth in a single pass
+
+    The disk has full weight inside linewidth / 2 and falls off linearly over
+    one pixel, so the edges of the thick line stay anti-aliased.
+    """
+    height, width = coverage.shape
+    radius = linewidth / 2
+    reach = int(math.ceil(radius + 0.5))
+    dilated = coverage.copy()
+    for dy in range(-reach, reach + 1):
+        for dx in range(-reach, reach + 1):
+            weight = min(1.0, radius + 0.5 - math.hypot(dx, dy))
+            if weight <= 0 or (dx == 0 and dy == 0):
+                continue
+            target = dilated[max(dy, 0):height + min(dy, 0), max(dx, 0):width + min(dx, 0)]
+            source = coverage[max(-dy, 0):height + min(-dy, 0), max(-dx, 0):width + min(-dx, 0)]
+            np.maximum(target, source * weight, out=target)
+    return dilated
+
+
+def dilate_coverage_mask(coverage:np.ndarray, linewidth:int, threshold:float) -> np.ndarray:
+    """Pixels where the coverage grown by dilate_coverage reaches threshold
+
+    Every offset of the disk only compares the coverage to the threshold over
+    its weight, so no float map of the full size is needed. Integer coverage
+    maps hold the coverage in units of the maximum of their type.
+    """
+    height, width = coverage.shape
+    unit = np.iinfo(coverage.dtype).max if np.issubdtype(coverage.dtype, np.integer) else 1.0
+    radius = linewidth / 2
+    reach = int(math.ceil(radius + 0.5))
+    mask = coverage >= threshold * unit
+    for dy in range(-reach, reach + 1):
+        for dx in range(-reach, reach + 1):
+            weight = min(1.0, radius + 0.5 - math.hypot(dx, dy))
+            if weight <= 0 or (dx == 0 and dy == 0):
+                continue
+            bound = threshold * unit / weight
+            if bound > unit:
+                continue
+            if unit != 1.0:
+                bound = math.ceil(bound)
+            target = mask[max(dy, 0):height + min(dy, 0), max(dx, 0):width + min(dx, 0)]
+            source = coverage[max(-dy, 0):height + min(-dy, 0), max(-dx, 0):width + min(-dx, 0)]
+            target |= source >= bound
+    return mask
+
+
+def rotate_half_turn(pixels:np.ndarray, center:Tuple[int, int]) -> np.ndarray:
+    """Turn a map by 180° about a pixel or pixel corner
+
+    Pixel (column, row) of the result is taken from (cx - column, cy - row) of
+    pixels, with center = (cx, cy) being twice the center of rotation. Pixels
+    rotated in from outside the map are 0.
+
+    Args:
+        pixels (np.ndarray): map of shape (height, width)
+        center (Tuple(int, int)): doubled pixel coordinates of the center of rotation
+    """
+    height, width = pixels.shape[:2]
+    flipped = pixels[::-1, ::-1]
+    rotated = np.zeros_like(pixels)
+    shift_x = width - 1 - center[0]
+    shift_y = height - 1 - center[1]
+    rows = slice(max(-shift_y, 0), height + min(-shift_y, 0))
+    columns = slice(max(-shift_x, 0), width + min(-shift_x, 0))
+    if rows.start < rows.stop and columns.start < columns.stop:
+        rotated[rows, columns] = flipped[
+            rows.start + shift_y:rows.stop + shift_y,
+            columns.start + shift_x:columns.stop + shift_x,
+        ]
+    return rotated
+
+
+def simplify_path(
+    xpos:np.ndarray,
+    ypos:np.ndarray,
+    keep:np.ndarray | None = None,
+) -> np.ndarray:
+    """Positions needed to draw a path at pixel resolution
+
+    Positions that stay on the pixel of their predecessor are dropped, and
+    runs of segments with the same direction between pixel centers are
+    merged into one segment, so the number of segments falls to the number
+    of distinct pixel moves. Decisions are taken on the pixel grid, the
+    remaining positions keep their sub-pixel coordinates.
+
+    Args:
+        xpos (np.ndarray): x pixel positions
+        ypos (np.ndarray): y pixel positions
+        keep (np.ndarray): boolean mask of positions that must not be dropped,
+                e.g. where the color changes
+
+    Return:
+        indices of the remaining positions, including first and last
+    """
+    column = np.floor(xpos + 0.5).astype(np.int64)
+    row = np.floor(ypos + 0.5).astype(np.int64)
+
+    moved = np.ones(len(column), dtype=bool)
+    moved[1:] = (column[1:] != column[:-1]) | (row[1:] != row[:-1])
+    if keep is not None:
+        moved |= keep
+    moved[-1] = True
+    index = np.nonzero(moved)[0]
+
+    dx = np.diff(column[index])
+    dy = np.diff(row[index])
+    divisor = np.gcd(dx, dy)
+    divisor[divisor == 0] = 1
+    dx //= divisor
+    dy //= divisor
+    corner = np.ones(len(index), dtype=bool)
+    corner[1:-1] = (dx[1:] != dx[:-1]) | (dy[1:] != dy[:-1])
+    if keep is not None:
+        corner |= keep[index]
+    return index[corner]
+
+
+def collapse_pixel_runs(
+    xpos:np.ndarray,
+    ypos:np.ndarray,
+    keep:np.ndarray | None = None,
+    centered:bool | None = True,
+    ends:bool | None = False,
+) -> np.ndarray:
+    """Positions left after dropping moves that stay within one pixel
+
+    Unlike simplify_path, the result draws exactly the same pixels as the
+    full path. With ends=False every position on the pixel of its predecessor
+    is dropped, which is exact where drawing only depends on the pixel of the
+    end points, like PIL truncating coordinates. With ends=True only the
+    interior positions of a run on one pixel are dropped, so the segments
+    leaving and entering the pixel keep their sub-pixel end points, as needed
+    for paths sampled by rasterize_path. Positions marked in keep, and with
+    ends=False their successors, are not dropped, so every drawn segment keeps
+    its color.
+
+    Args:
+        xpos (np.ndarray): x pixel positions
+        ypos (np.ndarray): y pixel positions
+        keep (np.ndarray): boolean mask of positions that must not be dropped,
+                e.g. where the color changes
+        centered (bool): pixels are centered on integer coordinates as in
+                rasterize_path, otherwise they start there as in PIL
+        ends (bool): keep the first and last position of every run on one pixel
+
+    Return:
+        indices of the remaining positions, including first and last
+    """
+    shift = 0.5 if centered else 0.0
+    column = np.floor(xpos + shift).astype(np.int64)
+    row = np.floor(ypos + shift).astype(np.int64)
+    if keep is None:
+        keep = np.zeros(len(column), dtype=bool)
+
+    same = np.zeros(len(column), dtype=bool)
+    same[1:] = (column[1:] == column[:-1]) & (row[1:] == row[:-1])
+    drop = same & ~keep
+    if ends:
+        drop[:-1] &= same[1:]
+    else:
+        drop[1:] &= ~keep[:-1]
+    drop[0] = False
+    drop[-1] = False
+    return np.nonzero(~drop)[0]
+
+
+def unique_segments(
+    xpos:np.ndarray,
+    ypos:np.ndarray,
+    last:bool | None = False,
+) -> np.ndarray:
+    """Indices of the segments of a path that connect distinct pixel pairs
+
+    Segments are identified by their end points rounded to pixels, regardless
+    of their direction. Of every group of identical segments only the first,
+    or with last=True the latest one is kept, in drawing order.
+
+    Args:
+        xpos (np.ndarray): x pixel positions
+        ypos (np.ndarray): y pixel positions
+        last (bool): keep the latest instead of the first drawn segment
+    """
+    column = np.floor(xpos + 0.5).astype(np.int64)
+    row = np.floor(ypos + 0.5).astype(np.int64)
+    start = np.stack((column[:-1], row[:-1]), axis=1)
+    end = np.stack((column[1:], row[1:]), axis=1)
+    swap = (start[:, 0] > end[:, 0]) | ((start[:, 0] == end[:, 0]) & (start[:, 1] > end[:, 1]))
+    keys = np.concatenate((np.where(swap[:, np.newaxis], end, start), np.where(swap[:, np.newaxis], start, end)), axis=1)
+    keys -= keys.min(axis=0)
+    span = int(keys.max()) + 1
+    if span ** 4 < 1 << 63:
+        # one integer per segment sorts much faster than rows
+        keys = ((keys[:, 0] * span + keys[:, 1]) * span + keys[:, 2]) * span + keys[:, 3]
+
+    if last:
+        _keys, index = np.unique(keys[::-1], axis=0, return_index=True)
+        index = len(keys) - 1 - index
+    else:
+        _keys, index = np.unique(keys, axis=0, return_index=True)
+    return np.sort(index)
+
+
+class SegmentGrid:
+    """Uniform grid over the segments of a path to find the segments within a rectangle"""
+
+    def __init__(
+        self,
+        xpos:np.ndarray,
+        ypos:np.ndarray,
+        cell_size:float | None = None,
+    ) -> None:
+        """Register every segment in the grid cells covered by its bounding box
+
+        The segment indices are stored per cell in one array, ordered by cell
+        and by segment index, with the start of every cell in a second one.
+
+        Args:
+            xpos (np.ndarray): x positions of the path
+            ypos (np.ndarray): y positions of the path
+            cell_size (float): edge length of the square cells, defaults to a size
+                    with about SEGMENT_GRID_CELL_SEGMENTS segments per cell
+        """
+        self.xpos = xpos
+        self.ypos = ypos
+        self.xmin, self.xmax = float(xpos.min()), float(xpos.max())
+        self.ymin, self.ymax = float(ypos.min()), float(ypos.max())
+        width = self.xmax - self.xmin
+        height = self.ymax - self.ymin
+
+        if cell_size is None:
+            cells = max(1, (len(xpos) - 1) // SEGMENT_GRID_CELL_SEGMENTS)
+            cell_size = math.sqrt(width * height / cells) if width * height > 0 else max(width, height) / cells
+        self.cell_size = cell_size if cell_size > 0 else 1.0
+        self.columns = int(width // self.cell_size) + 1
+        self.rows = int(height // self.cell_size) + 1
+
+        column0, column1 = self._cells(np.minimum(xpos[:-1], xpos[1:]), np.maximum(xpos[:-1], xpos[1:]), self.xmin, self.columns)
+        row0, row1 = self._cells(np.minimum(ypos[:-1], ypos[1:]), np.maximum(ypos[:-1], ypos[1:]), self.ymin, self.rows)
+        spans = column1 - column0 + 1
+        counts = spans * (row1 - row0 + 1)
+        segment = np.repeat(np.arange(len(counts)), counts)
+        local = np.arange(len(segment)) - np.repeat(np.cumsum(counts) - counts, counts)
+        cell = (row0[segment] + local // spans[segment]) * self.columns + column0[segment] + local % spans[segment]
+
+        self._segments = segment[np.argsort(cell, kind="stable")]
+        self._starts = np.concatenate(([0], np.cumsum(np.bincount(cell, minlength=self.rows * self.columns))))
+
+    def __len__(self) -> int:
+        """Number of segments in the grid"""
+        return len(self.xpos) - 1
+
+    def _cells(
+        self,
+        low:Union[np.ndarray, float],
+        high:Union[np.ndarray, float],
+        origin:float,
+        count:int,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """First and last cell index of the ranges low to high along one axis"""
+        first = np.clip(np.floor((low - origin) / self.cell_size), 0, count - 1).astype(np.int64)
+        last = np.clip(np.floor((high - origin) / self.cell_size), 0, count - 1).astype(np.int64)
+        return first, last
+
+    def query(self, xmin:float, ymin:float, xmax:float, ymax:float) -> np.ndarray:
+        """Indices of the segments in the grid cells that intersect a rectangle
+
+        Return:
+            sorted segment indices, a superset of the segments within the rectangle
+        """
+        if xmax < self.xmin or xmin > self.xmax or ymax < self.ymin or ymin > self.ymax:
+            return np.zeros(0, dtype=np.int64)
+        column0, column1 = self._cells(xmin, xmax, self.xmin, self.columns)
+        row0, row1 = self._cells(ymin, ymax, self.ymin, self.rows)
+        # the cells of one grid row are stored next to each other
+        chunks = [
+            self._segments[self._starts[row * self.columns + column0]:self._starts[row * self.columns + column1 + 1]]
+            for row in range(int(row0), int(row1) + 1)
+        ]
+        return np.unique(np.concatenate(chunks))
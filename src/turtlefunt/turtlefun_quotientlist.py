@@ -1,1566 +1,190 @@
 """Quotient list for calculating euler spiral dominant angle sums"""
 
-from decimal import Decimal, getcontext
-from loguru import logger
+from decimal import Decimal
+from functools import lru_cache
+import heapq
+import numpy as np
+from typing import Iterator, List, Tuple
 
-def generate_quotient_list(depth:int=200,limit:Decimal=Decimal('360000000000000')):
-    """Generation of the quotient list
-    
-    We are looking for numbers where 360/number results in a finite decimal.
-    
-    For a fraction to form finate decimals, the denominator must only have primefactors 2 or 5,
-    as all other prime factors lead to infinite decimal representations.
-    
-    As 360 = 2**3 * 3**2 * 5**1 our numbers can have up to 2 threes in their primefactors.
-    
-    Here we generate all numbers 2**(0->depth-1) * 5**(0->depth-1) * 3**(0->2), sort them
-    and put them in the list up to the given limit.
-    
-    With a depth of 200 we generate 120.000 numbers and only use 1.515; the difficult choice is
-    how many more two's than five's to we need to savely hit every number in the range.
+# largest quotient of the shipped table, the angles go down to 1E-12
+QUOTIENT_LIST_LIMIT = 360000000000000
+
+# exponents (a, b, c) of the quotients 2^a * 3^b * 5^c of the quotient list,
+# one byte each, in ascending order of the quotient
+TURTLEFUN_QUOTIENT_EXPONENTS = bytes.fromhex(
+    "000000010000000100020000000001010100030000000200010001020100000101040000010200020001030100000002"
+    "010101050000020200030001000201040100010002020101060000030200000102040001010201050100020002030101"
+    "000003070000040200010102050001020201060100030002000202040101010003080000050200020102060001030201"
+    "000103070100040002010202050101020003090000060200030102000004070001040201010103080100050002020202"
+    "0601010300030a0000000203070200040102010004080001050201020103090100060002030202000104070101040003"
+    "0b00000102030802000501020200040900010602010301030a01000000050700020402020101040801010500030c0000"
+    "0202030902000601020300040a00010002040702010401030b01000100050800020502020201040901010600030d0000"
+    "0302030a02000001050701020400040b00010102040802010501030c01000200050900020602020301040a0101000006"
+    "0700030e00000402030b02000101050801020500040c00010202040902010601030d01000300050a0002000205070202"
+    "0401040b01010100060800030f00000502030c02000201050901020600040d00010302040a02010001060701030e0100"
+    "0400050b00020102050802020501040c01010200060900031000000602030d02000301050a01020000070700040e0001"
+    "0402040b02010101060801030f01000500050c00020202050902020601040d01010300060a0003110000000206070203"
+    "0e02000401050b01020100070800040f00010502040c02010201060901031001000600050d00020302050a0202000107"
+    "0701040e01010400060b00031200000102060802030f02000501050c01020200070900041000010602040d0201030106"
+    "0a01030000081101000700050e00020402050b02020101070801040f01010500060c0003130000020206090203100200"
+    "0601050d01020300070a00041100010002070702040e02010401060b01030100081201000800050f00020502050c0202"
+    "0201070901041001010600060d00031400000302060a02030001081102000701050e01020400070b0004120001010207"
+    "0802040f02010501060c01030200081301000900051000020602050d02020301070a01040000091101010700060e0003"
+    "1500000402060b02030101081202000801050f01020500070c00041300010202070902041002010601060d0103030008"
+    "1401000a00051100020002080702050e02020401070b01040100091201010800060f00031600000502060c0203020108"
+    "1302000901051001020600070d00041400010302070a02040001091102010701060e01030400081501000b0005120002"
+    "0102080802050f02020501070c01040200091301010900061000031700000602060d02030301081402000a010500000a"
+    "1101020700070e00041500010402070b02040101091202010801060f01030500081601000c0005130002020208090205"
+    "1002020601070d01040300091401010a00061100031800000002090702060e02030401081502000b010501000a120102"
+    "0800070f00041600010502070c02040201091302010901061001030600081701000d00051400020302080a020500010a"
+    "1102020701070e01040400091501010b00061200031900000102090802060f02030501081602000c010502000a130102"
+    "0900071000041700010602070d02040301091402010a010600000b1101030700081801000e00051500020402080b0205"
+    "01010a1202020801070f01040500091601010c00061300031a00000202090902061002030601081702000d010503000a"
+    "1401020a000711000418000100020a0702070e02040401091502010b010601000b1201030800081901000f0005160002"
+    "0502080c020502010a1302020901071001040600091701010d00061400031b00000302090a020600010b110203070108"
+    "1802000e010504000a1501020b000712000419000101020a0802070f02040501091602010c010602000b130103090008"
+    "1a01001000051700020602080d020503010a1402020a010700000c1101040700091801010e00061500031c0000040209"
+    "0b020601010b1202030801081902000f010505000a1601020c00071300041a000102020a090207100204060109170201"
+    "0d010603000b1401030a00081b010011000518000200020b0702080e020504010a1502020b010701000c120104080009"
+    "1901010f00061600031d00000502090c020602010b1302030901081a020010010506000a1701020d00071400041b0001"
+    "03020a0a020700010c1102040701091802010e010604000b1501030b00081c010012000519000201020b0802080f0205"
+    "05010a1602020c010702000c1301040900091a01011000061700031e00000602090d020603010b1402030a01081b0200"
+    "00000d11010507000a1801020e00071500041c000104020a0b020701010c1202040801091902010f010605000b160103"
+    "0c00081d01001300051a000202020b09020810020506010a1702020d010703000c1401040a00091b0101110006180003"
+    "1f000000020c0702090e020604010b1502030b01081c020001000d12010508000a1901020f00071600041d000105020a"
+    "0c020702010c1302040901091a020110010606000b1701030d00081e01001400051b000203020b0a020800010d110205"
+    "07010a1802020e010704000c1501040b00091c010112000619000320000001020c0802090f020605010b1602030c0108"
+    "1d020002000d13010509000a1a01021000071700041e000106020a0d020703010c1402040a01091b020100000e110106"
+    "07000b1801030e00081f01001500051c000204020b0b020801010d12020508010a1902020f010705000c1601040c0009"
+    "1d01011300061a000321000002020c09020910020606010b1702030d01081e020003000d1401050a000a1b0102110007"
+    "1800041f000100020d07020a0e020704010c1502040b01091c020101000e12010608000b1901030f0008200100160005"
+    "1d000205020b0c020802010d13020509010a1a020210010706000c1701040d00091e01011400061b000322000003020c"
+    "0a020900010e11020607010b1802030e01081f020004000d1501050b000a1c010212000719000420000101020d08020a"
+    "0f020705010c1602040c01091d020102000e13010609000b1a01031000082101001700051e000206020b0d020803010d"
+    "1402050a010a1b020200000f11010707000c1801040e00091f01011500061c000323000004020c0b020901010e120206"
+    "08010b1902030f010820020005000d1601050c000a1d01021300071a000421000102020d09020a10020706010c170204"
+    "0d01091e020103000e1401060a000b1b01031100082201001800051f000200020e07020b0e020804010d1502050b010a"
+    "1c020201000f12010708000c1901040f00092001011600061d000324000005020c0c020902010e13020609010b1a0203"
+    "10010821020006000d1701050d000a1e01021400071b000422000103020d0a020a00010f11020707010c1802040e0109"
+    "1f020104000e1501060b000b1c010312000823010019000520000201020e08020b0f020805010d1602050c010a1d0202"
+    "02000f13010709000c1a01041000092101011700061e000325000006020c0d020903010e1402060a010b1b0203000010"
+    "11010822020007000d1801050e000a1f01021500071c000423000104020d0b020a01010f12020708010c1902040f0109"
+    "20020105000e1601060c000b1d01031300082401001a000521000202020e09020b10020806010d1702050d010a1e0202"
+    "03000f1401070a000c1b01041100092201011800061f000300020f26000007020c0e020904010e1502060b010b1c0203"
+    "01001012010823020008000d1901050f000a2001021600071d000424000105020d0c020a02010f13020709010c1a0204"
+    "10010921020106000e1701060d000b1e01031400082501001b000522000203020e0a020b00011011020807010d180205"
+    "0e010a1f020204000f1501070b000c1c010412000923010119000620000301020f27000008020c0f020905010e160206"
+    "0c010b1d020302001013010824020009000d1a010510000a2101021700071e000425000106020d0d020a03010f140207"
+    "0a010c1b020400001111010922020107000e1801060e000b1f01031500082601001c000523000204020e0b020b010110"
+    "12020808010d1902050f010a20020205000f1601070c000c1d01041300092401011a000621000302020f28000009020c"
+    "10020906010e1702060d010b1e02030300101401082502000a000d1b010511000a2201021800071f0004000210260001"
+    "07020d0e020a04010f1502070b010c1c020401001112010923020108000e1901060f000b2001031600082701001d0005"
+    "24000205020e0c020b02011013020809010d1a020510010a21020206000f1701070d000c1e01041400092501011b0006"
+    "22000303020f2900000a020c00011111020907010e1802060e010b1f02030400101501082602000b000d1c010512000a"
+    "23010219000720000401021027000108020d0f020a05010f1602070c010c1d020402001113010924020109000e1a0106"
+    "10000b2101031700082801001e000525000206020e0d020b0301101402080a010d1b020500001211010a22020207000f"
+    "1801070e000c1f01041500092601011c000623000304020f2a00000b020c01011112020908010e1902060f010b200203"
+    "0500101601082702000c000d1d010513000a2401021a000721000402021028000109020d10020a06010f1702070d010c"
+    "1e02040300111401092502010a000e1b010611000b2201031800082901001f000500021126000207020e0e020b040110"
+    "1502080b010d1c020501001212010a23020208000f1901070f000c2001041600092701011d000624000305020f2b0000"
+    "0c020c02011113020909010e1a020610010b2102030600101701082802000d000d1e010514000a2501021b0007220004"
+    "0302102900010a020d00011211020a07010f1802070e010c1f02040400111501092602010b000e1c010612000b230103"
+    "1900082a010020000501021127000208020e0f020b0501101602080c010d1d020502001213010a24020209000f1a0107"
+    "10000c2101041700092801011e000625000306020f2c00000d020c0301111402090a010e1b020600001311010b220203"
+    "0700101801082902000e000d1f010515000a2601021c00072300040402102a00010b020d01011212020a08010f190207"
+    "0f010c2002040500111601092702010c000e1d010613000b2401031a00082b010021000502021128000209020e10020b"
+    "0601101702080d010d1e020503001214010a2502020a000f1b010711000c2201041800092901011f0006000212260003"
+    "07020f2d00000e020c0401111502090b010e1c020601001312010b2302030800101901082a02000f000d20010516000a"
+    "2701021d00072400040502102b00010c020d02011213020a09010f1a020710010c2102040600111701092802010d000e"
+    "1e010614000b2501031b00082c01002200050302112900020a020e00011311020b0701101802080e010d1f0205040012"
+    "15010a2602020b000f1c010712000c2301041900092a010120000601021227000308020f2e00000f020c050111160209"
+    "0c010e1d020602001313010b2402030900101a01082b020010000d21010517000a2801021e00072500040602102c0001"
+    "0d020d03011214020a0a010f1b020700001411010c2202040700111801092902010e000e1f010615000b2601031c0008"
+    "2d01002300050402112a00020b020e01011312020b0801101902080f010d20020505001216010a2702020c000f1d0107"
+    "13000c2401041a00092b010121000602021228000309020f2f000010020c0601111702090d010e1e020603001314010b"
+    "2502030a00101b01082c020011000d22010518000a2901021f00070002132600040702102d00010e020d04011215020a"
+    "0b010f1c020701001412010c2302040800111901092a02010f000e20010616000b2701031d00082e0100240005050211"
+    "2b00020c020e02011313020b0901101a020810010d21020506001217010a2802020d000f1e010714000c2501041b0009"
+    "2c01012200060302122900030a020f30000000011411020c0701111802090e010e1f020604001315010b2602030b0010"
+    "1c01082d020012000d23010519000a2a01022000070102132700040802102e00010f020d"
+)
+
+
+def quotient_exponents() -> np.ndarray:
+    """Exponents (a, b, c) of the quotients 2^a * 3^b * 5^c as read-only array of shape (n, 3)"""
+    return np.frombuffer(TURTLEFUN_QUOTIENT_EXPONENTS, dtype=np.uint8).reshape(-1, 3)
+
+
+def quotient_entry(two:int, three:int, five:int) -> Tuple[Decimal, Decimal, Decimal]:
+    """Entry (angle, quotient, alpha) of the quotient 2^two * 3^three * 5^five
+
+    As 360 = 2^3 * 3^2 * 5, the angle 360 / quotient is an integer times a
+    power of ten and is built exactly, independent of the decimal context.
+    alpha is the angle the turtle turns by over quotient steps, which is 180
+    for an even and 0 for an odd quotient, written with the decimal places of
+    the angle as (quotient * (quotient + 1) * angle / 2) % 360 would give it.
+    """
+    quotient = 2 ** two * 3 ** three * 5 ** five
+    # 1 / 2^n = 5^n / 10^n and 1 / 5^n = 2^n / 10^n
+    mantissa = 2 ** max(3 - two, 0) * 3 ** (2 - three) * 5 ** max(1 - five, 0) * 5 ** max(two - 3, 0) * 2 ** max(five - 1, 0)
+    places = max(two - 3, 0) + max(five - 1, 0)
+    while places and mantissa % 10 == 0:
+        mantissa //= 10
+        places -= 1
+    alpha = 180 if quotient % 2 == 0 else 0
+    return Decimal("{}E-{}".format(mantissa, places)), Decimal(quotient), Decimal("{}E-{}".format(alpha * 10 ** places, places))
+
+
+def smooth_quotients(limit:int | None = QUOTIENT_LIST_LIMIT) -> Iterator[Tuple[int, int, int, int]]:
+    """Stream the quotients 2^a * 3^b * 5^c with b <= 2 up to limit in ascending order
+
+    We are looking for numbers where 360 / number results in a finite decimal.
+    As 360 = 2^3 * 3^2 * 5 and only the prime factors 2 and 5 give finite
+    decimals, the numbers can have up to two threes in their prime factors.
+
+    The numbers are taken from a heap like Hamming numbers. Every number is
+    reached exactly once, by multiplying its prime factors in ascending
+    order, so the cost follows the number of quotients up to limit.
+
+    Return:
+        (quotient, a, b, c)
+    """
+    heap = [(1, 0, 0, 0, 0)] if limit >= 1 else []
+    while heap:
+        quotient, first, two, three, five = heapq.heappop(heap)
+        yield quotient, two, three, five
+        if first == 0 and quotient * 2 <= limit:
+            heapq.heappush(heap, (quotient * 2, 0, two + 1, three, five))
+        if first <= 1 and three < 2 and quotient * 3 <= limit:
+            heapq.heappush(heap, (quotient * 3, 1, two, three + 1, five))
+        if quotient * 5 <= limit:
+            heapq.heappush(heap, (quotient * 5, 2, two, three, five + 1))
+
+
+def generate_quotient_list(limit:int | None = QUOTIENT_LIST_LIMIT) -> List[Tuple[Decimal, Decimal, Decimal]]:
+    """Generate the quotient list for all quotients up to limit
+
+    The angles 360 / quotient go down to 360 / limit, so a limit of
+    360 * 10^k covers every angle with up to k decimal places.
+
+    Return:
+        [(angle, quotient, alpha), ...] in descending order of the angle
     """
-    getcontext().prec = 200
-        
-    numberlist = []
-    for five in range(depth):
-        logger.debug("five = {}", five)
-        for two in range(depth):
-            for three in range(3):
-                num = Decimal('5')**Decimal(five) * Decimal('2')**Decimal(two) * Decimal('3')**Decimal(three)
-                if num not in numberlist:
-                    numberlist.append(num)
-    numberlist.sort()
-    logger.debug("Created numberlist with {} entries", len(numberlist))
-    
-    quotientlist = []
-    with open("turtlefun_quotients_from_exponents.py", "w") as file:
-        file.write('"""Quotient list for calculating euler spiral quotients from exponents of 2 and five up to ' + str(int(depth)) + '"""' + "\n\n")
-        file.write("from decimal import Decimal\n\n")          
-        file.write("TURTLEFUN_QUOTIENT_LIST = [\n")
-        for num in numberlist:
-            if num <= limit:
-                fraction = Decimal('360') / num
-                alpha = ((num * (num + Decimal('1')) * fraction / Decimal('2')) % Decimal('360'))
-                entry = (fraction, num, alpha)
-                quotientlist.append(entry)
-                file.write("    " + str(entry) + ",\n")
-        file.write("    ]\n")
+    return [quotient_entry(two, three, five) for _quotient, two, three, five in smooth_quotients(limit)]
+
+
+@lru_cache(maxsize=None)
+def quotient_list() -> List[Tuple[Decimal, Decimal, Decimal]]:
+    """The quotient list as (angle, quotient, alpha) in descending order of the angle
+
+    The Decimal entries are built from the exponent table on first use and
+    cached, so importing the module stays cheap.
+    """
+    return [quotient_entry(int(two), int(three), int(five)) for two, three, five in quotient_exponents()]
+
 
-TURTLEFUN_QUOTIENT_LIST = [
-    (Decimal('360'), Decimal('1'), Decimal('0')),
-    (Decimal('180'), Decimal('2'), Decimal('180')),
-    (Decimal('120'), Decimal('3'), Decimal('0')),
-    (Decimal('90'), Decimal('4'), Decimal('180')),
-    (Decimal('72'), Decimal('5'), Decimal('0')),
-    (Decimal('60'), Decimal('6'), Decimal('180')),
-    (Decimal('45'), Decimal('8'), Decimal('180')),
-    (Decimal('40'), Decimal('9'), Decimal('0')),
-    (Decimal('36'), Decimal('10'), Decimal('180')),
-    (Decimal('30'), Decimal('12'), Decimal('180')),
-    (Decimal('24'), Decimal('15'), Decimal('0')),
-    (Decimal('22.5'), Decimal('16'), Decimal('180.0')),
-    (Decimal('20'), Decimal('18'), Decimal('180')),
-    (Decimal('18'), Decimal('20'), Decimal('180')),
-    (Decimal('15'), Decimal('24'), Decimal('180')),
-    (Decimal('14.4'), Decimal('25'), Decimal('0.0')),
-    (Decimal('12'), Decimal('30'), Decimal('180')),
-    (Decimal('11.25'), Decimal('32'), Decimal('180.00')),
-    (Decimal('10'), Decimal('36'), Decimal('180')),
-    (Decimal('9'), Decimal('40'), Decimal('180')),
-    (Decimal('8'), Decimal('45'), Decimal('0')),
-    (Decimal('7.5'), Decimal('48'), Decimal('180.0')),
-    (Decimal('7.2'), Decimal('50'), Decimal('180.0')),
-    (Decimal('6'), Decimal('60'), Decimal('180')),
-    (Decimal('5.625'), Decimal('64'), Decimal('180.000')),
-    (Decimal('5'), Decimal('72'), Decimal('180')),
-    (Decimal('4.8'), Decimal('75'), Decimal('0.0')),
-    (Decimal('4.5'), Decimal('80'), Decimal('180.0')),
-    (Decimal('4'), Decimal('90'), Decimal('180')),
-    (Decimal('3.75'), Decimal('96'), Decimal('180.00')),
-    (Decimal('3.6'), Decimal('100'), Decimal('180.0')),
-    (Decimal('3'), Decimal('120'), Decimal('180')),
-    (Decimal('2.88'), Decimal('125'), Decimal('0.00')),
-    (Decimal('2.8125'), Decimal('128'), Decimal('180.0000')),
-    (Decimal('2.5'), Decimal('144'), Decimal('180.0')),
-    (Decimal('2.4'), Decimal('150'), Decimal('180.0')),
-    (Decimal('2.25'), Decimal('160'), Decimal('180.00')),
-    (Decimal('2'), Decimal('180'), Decimal('180')),
-    (Decimal('1.875'), Decimal('192'), Decimal('180.000')),
-    (Decimal('1.8'), Decimal('200'), Decimal('180.0')),
-    (Decimal('1.6'), Decimal('225'), Decimal('0.0')),
-    (Decimal('1.5'), Decimal('240'), Decimal('180.0')),
-    (Decimal('1.44'), Decimal('250'), Decimal('180.00')),
-    (Decimal('1.40625'), Decimal('256'), Decimal('180.00000')),
-    (Decimal('1.25'), Decimal('288'), Decimal('180.00')),
-    (Decimal('1.2'), Decimal('300'), Decimal('180.0')),
-    (Decimal('1.125'), Decimal('320'), Decimal('180.000')),
-    (Decimal('1'), Decimal('360'), Decimal('180')),
-    (Decimal('0.96'), Decimal('375'), Decimal('0.00')),
-    (Decimal('0.9375'), Decimal('384'), Decimal('180.0000')),
-    (Decimal('0.9'), Decimal('400'), Decimal('180.0')),
-    (Decimal('0.8'), Decimal('450'), Decimal('180.0')),
-    (Decimal('0.75'), Decimal('480'), Decimal('180.00')),
-    (Decimal('0.72'), Decimal('500'), Decimal('180.00')),
-    (Decimal('0.703125'), Decimal('512'), Decimal('180.000000')),
-    (Decimal('0.625'), Decimal('576'), Decimal('180.000')),
-    (Decimal('0.6'), Decimal('600'), Decimal('180.0')),
-    (Decimal('0.576'), Decimal('625'), Decimal('0.000')),
-    (Decimal('0.5625'), Decimal('640'), Decimal('180.0000')),
-    (Decimal('0.5'), Decimal('720'), Decimal('180.0')),
-    (Decimal('0.48'), Decimal('750'), Decimal('180.00')),
-    (Decimal('0.46875'), Decimal('768'), Decimal('180.00000')),
-    (Decimal('0.45'), Decimal('800'), Decimal('180.00')),
-    (Decimal('0.4'), Decimal('900'), Decimal('180.0')),
-    (Decimal('0.375'), Decimal('960'), Decimal('180.000')),
-    (Decimal('0.36'), Decimal('1000'), Decimal('180.00')),
-    (Decimal('0.3515625'), Decimal('1024'), Decimal('180.0000000')),
-    (Decimal('0.32'), Decimal('1125'), Decimal('0.00')),
-    (Decimal('0.3125'), Decimal('1152'), Decimal('180.0000')),
-    (Decimal('0.3'), Decimal('1200'), Decimal('180.0')),
-    (Decimal('0.288'), Decimal('1250'), Decimal('180.000')),
-    (Decimal('0.28125'), Decimal('1280'), Decimal('180.00000')),
-    (Decimal('0.25'), Decimal('1440'), Decimal('180.00')),
-    (Decimal('0.24'), Decimal('1500'), Decimal('180.00')),
-    (Decimal('0.234375'), Decimal('1536'), Decimal('180.000000')),
-    (Decimal('0.225'), Decimal('1600'), Decimal('180.000')),
-    (Decimal('0.2'), Decimal('1800'), Decimal('180.0')),
-    (Decimal('0.192'), Decimal('1875'), Decimal('0.000')),
-    (Decimal('0.1875'), Decimal('1920'), Decimal('180.0000')),
-    (Decimal('0.18'), Decimal('2000'), Decimal('180.00')),
-    (Decimal('0.17578125'), Decimal('2048'), Decimal('180.00000000')),
-    (Decimal('0.16'), Decimal('2250'), Decimal('180.00')),
-    (Decimal('0.15625'), Decimal('2304'), Decimal('180.00000')),
-    (Decimal('0.15'), Decimal('2400'), Decimal('180.00')),
-    (Decimal('0.144'), Decimal('2500'), Decimal('180.000')),
-    (Decimal('0.140625'), Decimal('2560'), Decimal('180.000000')),
-    (Decimal('0.125'), Decimal('2880'), Decimal('180.000')),
-    (Decimal('0.12'), Decimal('3000'), Decimal('180.00')),
-    (Decimal('0.1171875'), Decimal('3072'), Decimal('180.0000000')),
-    (Decimal('0.1152'), Decimal('3125'), Decimal('0.0000')),
-    (Decimal('0.1125'), Decimal('3200'), Decimal('180.0000')),
-    (Decimal('0.1'), Decimal('3600'), Decimal('180.0')),
-    (Decimal('0.096'), Decimal('3750'), Decimal('180.000')),
-    (Decimal('0.09375'), Decimal('3840'), Decimal('180.00000')),
-    (Decimal('0.09'), Decimal('4000'), Decimal('180.00')),
-    (Decimal('0.087890625'), Decimal('4096'), Decimal('180.000000000')),
-    (Decimal('0.08'), Decimal('4500'), Decimal('180.00')),
-    (Decimal('0.078125'), Decimal('4608'), Decimal('180.000000')),
-    (Decimal('0.075'), Decimal('4800'), Decimal('180.000')),
-    (Decimal('0.072'), Decimal('5000'), Decimal('180.000')),
-    (Decimal('0.0703125'), Decimal('5120'), Decimal('180.0000000')),
-    (Decimal('0.064'), Decimal('5625'), Decimal('0.000')),
-    (Decimal('0.0625'), Decimal('5760'), Decimal('180.0000')),
-    (Decimal('0.06'), Decimal('6000'), Decimal('180.00')),
-    (Decimal('0.05859375'), Decimal('6144'), Decimal('180.00000000')),
-    (Decimal('0.0576'), Decimal('6250'), Decimal('180.0000')),
-    (Decimal('0.05625'), Decimal('6400'), Decimal('180.00000')),
-    (Decimal('0.05'), Decimal('7200'), Decimal('180.00')),
-    (Decimal('0.048'), Decimal('7500'), Decimal('180.000')),
-    (Decimal('0.046875'), Decimal('7680'), Decimal('180.000000')),
-    (Decimal('0.045'), Decimal('8000'), Decimal('180.000')),
-    (Decimal('0.0439453125'), Decimal('8192'), Decimal('180.0000000000')),
-    (Decimal('0.04'), Decimal('9000'), Decimal('180.00')),
-    (Decimal('0.0390625'), Decimal('9216'), Decimal('180.0000000')),
-    (Decimal('0.0384'), Decimal('9375'), Decimal('0.0000')),
-    (Decimal('0.0375'), Decimal('9600'), Decimal('180.0000')),
-    (Decimal('0.036'), Decimal('10000'), Decimal('180.000')),
-    (Decimal('0.03515625'), Decimal('10240'), Decimal('180.00000000')),
-    (Decimal('0.032'), Decimal('11250'), Decimal('180.000')),
-    (Decimal('0.03125'), Decimal('11520'), Decimal('180.00000')),
-    (Decimal('0.03'), Decimal('12000'), Decimal('180.00')),
-    (Decimal('0.029296875'), Decimal('12288'), Decimal('180.000000000')),
-    (Decimal('0.0288'), Decimal('12500'), Decimal('180.0000')),
-    (Decimal('0.028125'), Decimal('12800'), Decimal('180.000000')),
-    (Decimal('0.025'), Decimal('14400'), Decimal('180.000')),
-    (Decimal('0.024'), Decimal('15000'), Decimal('180.000')),
-    (Decimal('0.0234375'), Decimal('15360'), Decimal('180.0000000')),
-    (Decimal('0.02304'), Decimal('15625'), Decimal('0.00000')),
-    (Decimal('0.0225'), Decimal('16000'), Decimal('180.0000')),
-    (Decimal('0.02197265625'), Decimal('16384'), Decimal('180.00000000000')),
-    (Decimal('0.02'), Decimal('18000'), Decimal('180.00')),
-    (Decimal('0.01953125'), Decimal('18432'), Decimal('180.00000000')),
-    (Decimal('0.0192'), Decimal('18750'), Decimal('180.0000')),
-    (Decimal('0.01875'), Decimal('19200'), Decimal('180.00000')),
-    (Decimal('0.018'), Decimal('20000'), Decimal('180.000')),
-    (Decimal('0.017578125'), Decimal('20480'), Decimal('180.000000000')),
-    (Decimal('0.016'), Decimal('22500'), Decimal('180.000')),
-    (Decimal('0.015625'), Decimal('23040'), Decimal('180.000000')),
-    (Decimal('0.015'), Decimal('24000'), Decimal('180.000')),
-    (Decimal('0.0146484375'), Decimal('24576'), Decimal('180.0000000000')),
-    (Decimal('0.0144'), Decimal('25000'), Decimal('180.0000')),
-    (Decimal('0.0140625'), Decimal('25600'), Decimal('180.0000000')),
-    (Decimal('0.0128'), Decimal('28125'), Decimal('0.0000')),
-    (Decimal('0.0125'), Decimal('28800'), Decimal('180.0000')),
-    (Decimal('0.012'), Decimal('30000'), Decimal('180.000')),
-    (Decimal('0.01171875'), Decimal('30720'), Decimal('180.00000000')),
-    (Decimal('0.01152'), Decimal('31250'), Decimal('180.00000')),
-    (Decimal('0.01125'), Decimal('32000'), Decimal('180.00000')),
-    (Decimal('0.010986328125'), Decimal('32768'), Decimal('180.000000000000')),
-    (Decimal('0.01'), Decimal('36000'), Decimal('180.00')),
-    (Decimal('0.009765625'), Decimal('36864'), Decimal('180.000000000')),
-    (Decimal('0.0096'), Decimal('37500'), Decimal('180.0000')),
-    (Decimal('0.009375'), Decimal('38400'), Decimal('180.000000')),
-    (Decimal('0.009'), Decimal('40000'), Decimal('180.000')),
-    (Decimal('0.0087890625'), Decimal('40960'), Decimal('180.0000000000')),
-    (Decimal('0.008'), Decimal('45000'), Decimal('180.000')),
-    (Decimal('0.0078125'), Decimal('46080'), Decimal('180.0000000')),
-    (Decimal('0.00768'), Decimal('46875'), Decimal('0.00000')),
-    (Decimal('0.0075'), Decimal('48000'), Decimal('180.0000')),
-    (Decimal('0.00732421875'), Decimal('49152'), Decimal('180.00000000000')),
-    (Decimal('0.0072'), Decimal('50000'), Decimal('180.0000')),
-    (Decimal('0.00703125'), Decimal('51200'), Decimal('180.00000000')),
-    (Decimal('0.0064'), Decimal('56250'), Decimal('180.0000')),
-    (Decimal('0.00625'), Decimal('57600'), Decimal('180.00000')),
-    (Decimal('0.006'), Decimal('60000'), Decimal('180.000')),
-    (Decimal('0.005859375'), Decimal('61440'), Decimal('180.000000000')),
-    (Decimal('0.00576'), Decimal('62500'), Decimal('180.00000')),
-    (Decimal('0.005625'), Decimal('64000'), Decimal('180.000000')),
-    (Decimal('0.0054931640625'), Decimal('65536'), Decimal('180.0000000000000')),
-    (Decimal('0.005'), Decimal('72000'), Decimal('180.000')),
-    (Decimal('0.0048828125'), Decimal('73728'), Decimal('180.0000000000')),
-    (Decimal('0.0048'), Decimal('75000'), Decimal('180.0000')),
-    (Decimal('0.0046875'), Decimal('76800'), Decimal('180.0000000')),
-    (Decimal('0.004608'), Decimal('78125'), Decimal('0.000000')),
-    (Decimal('0.0045'), Decimal('80000'), Decimal('180.0000')),
-    (Decimal('0.00439453125'), Decimal('81920'), Decimal('180.00000000000')),
-    (Decimal('0.004'), Decimal('90000'), Decimal('180.000')),
-    (Decimal('0.00390625'), Decimal('92160'), Decimal('180.00000000')),
-    (Decimal('0.00384'), Decimal('93750'), Decimal('180.00000')),
-    (Decimal('0.00375'), Decimal('96000'), Decimal('180.00000')),
-    (Decimal('0.003662109375'), Decimal('98304'), Decimal('180.000000000000')),
-    (Decimal('0.0036'), Decimal('100000'), Decimal('180.0000')),
-    (Decimal('0.003515625'), Decimal('102400'), Decimal('180.000000000')),
-    (Decimal('0.0032'), Decimal('112500'), Decimal('180.0000')),
-    (Decimal('0.003125'), Decimal('115200'), Decimal('180.000000')),
-    (Decimal('0.003'), Decimal('120000'), Decimal('180.000')),
-    (Decimal('0.0029296875'), Decimal('122880'), Decimal('180.0000000000')),
-    (Decimal('0.00288'), Decimal('125000'), Decimal('180.00000')),
-    (Decimal('0.0028125'), Decimal('128000'), Decimal('180.0000000')),
-    (Decimal('0.00274658203125'), Decimal('131072'), Decimal('180.00000000000000')),
-    (Decimal('0.00256'), Decimal('140625'), Decimal('0.00000')),
-    (Decimal('0.0025'), Decimal('144000'), Decimal('180.0000')),
-    (Decimal('0.00244140625'), Decimal('147456'), Decimal('180.00000000000')),
-    (Decimal('0.0024'), Decimal('150000'), Decimal('180.0000')),
-    (Decimal('0.00234375'), Decimal('153600'), Decimal('180.00000000')),
-    (Decimal('0.002304'), Decimal('156250'), Decimal('180.000000')),
-    (Decimal('0.00225'), Decimal('160000'), Decimal('180.00000')),
-    (Decimal('0.002197265625'), Decimal('163840'), Decimal('180.000000000000')),
-    (Decimal('0.002'), Decimal('180000'), Decimal('180.000')),
-    (Decimal('0.001953125'), Decimal('184320'), Decimal('180.000000000')),
-    (Decimal('0.00192'), Decimal('187500'), Decimal('180.00000')),
-    (Decimal('0.001875'), Decimal('192000'), Decimal('180.000000')),
-    (Decimal('0.0018310546875'), Decimal('196608'), Decimal('180.0000000000000')),
-    (Decimal('0.0018'), Decimal('200000'), Decimal('180.0000')),
-    (Decimal('0.0017578125'), Decimal('204800'), Decimal('180.0000000000')),
-    (Decimal('0.0016'), Decimal('225000'), Decimal('180.0000')),
-    (Decimal('0.0015625'), Decimal('230400'), Decimal('180.0000000')),
-    (Decimal('0.001536'), Decimal('234375'), Decimal('0.000000')),
-    (Decimal('0.0015'), Decimal('240000'), Decimal('180.0000')),
-    (Decimal('0.00146484375'), Decimal('245760'), Decimal('180.00000000000')),
-    (Decimal('0.00144'), Decimal('250000'), Decimal('180.00000')),
-    (Decimal('0.00140625'), Decimal('256000'), Decimal('180.00000000')),
-    (Decimal('0.001373291015625'), Decimal('262144'), Decimal('180.000000000000000')),
-    (Decimal('0.00128'), Decimal('281250'), Decimal('180.00000')),
-    (Decimal('0.00125'), Decimal('288000'), Decimal('180.00000')),
-    (Decimal('0.001220703125'), Decimal('294912'), Decimal('180.000000000000')),
-    (Decimal('0.0012'), Decimal('300000'), Decimal('180.0000')),
-    (Decimal('0.001171875'), Decimal('307200'), Decimal('180.000000000')),
-    (Decimal('0.001152'), Decimal('312500'), Decimal('180.000000')),
-    (Decimal('0.001125'), Decimal('320000'), Decimal('180.000000')),
-    (Decimal('0.0010986328125'), Decimal('327680'), Decimal('180.0000000000000')),
-    (Decimal('0.001'), Decimal('360000'), Decimal('180.000')),
-    (Decimal('0.0009765625'), Decimal('368640'), Decimal('180.0000000000')),
-    (Decimal('0.00096'), Decimal('375000'), Decimal('180.00000')),
-    (Decimal('0.0009375'), Decimal('384000'), Decimal('180.0000000')),
-    (Decimal('0.0009216'), Decimal('390625'), Decimal('0E-7')),
-    (Decimal('0.00091552734375'), Decimal('393216'), Decimal('180.00000000000000')),
-    (Decimal('0.0009'), Decimal('400000'), Decimal('180.0000')),
-    (Decimal('0.00087890625'), Decimal('409600'), Decimal('180.00000000000')),
-    (Decimal('0.0008'), Decimal('450000'), Decimal('180.0000')),
-    (Decimal('0.00078125'), Decimal('460800'), Decimal('180.00000000')),
-    (Decimal('0.000768'), Decimal('468750'), Decimal('180.000000')),
-    (Decimal('0.00075'), Decimal('480000'), Decimal('180.00000')),
-    (Decimal('0.000732421875'), Decimal('491520'), Decimal('180.000000000000')),
-    (Decimal('0.00072'), Decimal('500000'), Decimal('180.00000')),
-    (Decimal('0.000703125'), Decimal('512000'), Decimal('180.000000000')),
-    (Decimal('0.0006866455078125'), Decimal('524288'), Decimal('180.0000000000000000')),
-    (Decimal('0.00064'), Decimal('562500'), Decimal('180.00000')),
-    (Decimal('0.000625'), Decimal('576000'), Decimal('180.000000')),
-    (Decimal('0.0006103515625'), Decimal('589824'), Decimal('180.0000000000000')),
-    (Decimal('0.0006'), Decimal('600000'), Decimal('180.0000')),
-    (Decimal('0.0005859375'), Decimal('614400'), Decimal('180.0000000000')),
-    (Decimal('0.000576'), Decimal('625000'), Decimal('180.000000')),
-    (Decimal('0.0005625'), Decimal('640000'), Decimal('180.0000000')),
-    (Decimal('0.00054931640625'), Decimal('655360'), Decimal('180.00000000000000')),
-    (Decimal('0.000512'), Decimal('703125'), Decimal('0.000000')),
-    (Decimal('0.0005'), Decimal('720000'), Decimal('180.0000')),
-    (Decimal('0.00048828125'), Decimal('737280'), Decimal('180.00000000000')),
-    (Decimal('0.00048'), Decimal('750000'), Decimal('180.00000')),
-    (Decimal('0.00046875'), Decimal('768000'), Decimal('180.00000000')),
-    (Decimal('0.0004608'), Decimal('781250'), Decimal('180.0000000')),
-    (Decimal('0.000457763671875'), Decimal('786432'), Decimal('180.000000000000000')),
-    (Decimal('0.00045'), Decimal('800000'), Decimal('180.00000')),
-    (Decimal('0.000439453125'), Decimal('819200'), Decimal('180.000000000000')),
-    (Decimal('0.0004'), Decimal('900000'), Decimal('180.0000')),
-    (Decimal('0.000390625'), Decimal('921600'), Decimal('180.000000000')),
-    (Decimal('0.000384'), Decimal('937500'), Decimal('180.000000')),
-    (Decimal('0.000375'), Decimal('960000'), Decimal('180.000000')),
-    (Decimal('0.0003662109375'), Decimal('983040'), Decimal('180.0000000000000')),
-    (Decimal('0.00036'), Decimal('1000000'), Decimal('180.00000')),
-    (Decimal('0.0003515625'), Decimal('1024000'), Decimal('180.0000000000')),
-    (Decimal('0.00034332275390625'), Decimal('1048576'), Decimal('180.00000000000000000')),
-    (Decimal('0.00032'), Decimal('1125000'), Decimal('180.00000')),
-    (Decimal('0.0003125'), Decimal('1152000'), Decimal('180.0000000')),
-    (Decimal('0.0003072'), Decimal('1171875'), Decimal('0E-7')),
-    (Decimal('0.00030517578125'), Decimal('1179648'), Decimal('180.00000000000000')),
-    (Decimal('0.0003'), Decimal('1200000'), Decimal('180.0000')),
-    (Decimal('0.00029296875'), Decimal('1228800'), Decimal('180.00000000000')),
-    (Decimal('0.000288'), Decimal('1250000'), Decimal('180.000000')),
-    (Decimal('0.00028125'), Decimal('1280000'), Decimal('180.00000000')),
-    (Decimal('0.000274658203125'), Decimal('1310720'), Decimal('180.000000000000000')),
-    (Decimal('0.000256'), Decimal('1406250'), Decimal('180.000000')),
-    (Decimal('0.00025'), Decimal('1440000'), Decimal('180.00000')),
-    (Decimal('0.000244140625'), Decimal('1474560'), Decimal('180.000000000000')),
-    (Decimal('0.00024'), Decimal('1500000'), Decimal('180.00000')),
-    (Decimal('0.000234375'), Decimal('1536000'), Decimal('180.000000000')),
-    (Decimal('0.0002304'), Decimal('1562500'), Decimal('180.0000000')),
-    (Decimal('0.0002288818359375'), Decimal('1572864'), Decimal('180.0000000000000000')),
-    (Decimal('0.000225'), Decimal('1600000'), Decimal('180.000000')),
-    (Decimal('0.0002197265625'), Decimal('1638400'), Decimal('180.0000000000000')),
-    (Decimal('0.0002'), Decimal('1800000'), Decimal('180.0000')),
-    (Decimal('0.0001953125'), Decimal('1843200'), Decimal('180.0000000000')),
-    (Decimal('0.000192'), Decimal('1875000'), Decimal('180.000000')),
-    (Decimal('0.0001875'), Decimal('1920000'), Decimal('180.0000000')),
-    (Decimal('0.00018432'), Decimal('1953125'), Decimal('0E-8')),
-    (Decimal('0.00018310546875'), Decimal('1966080'), Decimal('180.00000000000000')),
-    (Decimal('0.00018'), Decimal('2000000'), Decimal('180.00000')),
-    (Decimal('0.00017578125'), Decimal('2048000'), Decimal('180.00000000000')),
-    (Decimal('0.000171661376953125'), Decimal('2097152'), Decimal('180.000000000000000000')),
-    (Decimal('0.00016'), Decimal('2250000'), Decimal('180.00000')),
-    (Decimal('0.00015625'), Decimal('2304000'), Decimal('180.00000000')),
-    (Decimal('0.0001536'), Decimal('2343750'), Decimal('180.0000000')),
-    (Decimal('0.000152587890625'), Decimal('2359296'), Decimal('180.000000000000000')),
-    (Decimal('0.00015'), Decimal('2400000'), Decimal('180.00000')),
-    (Decimal('0.000146484375'), Decimal('2457600'), Decimal('180.000000000000')),
-    (Decimal('0.000144'), Decimal('2500000'), Decimal('180.000000')),
-    (Decimal('0.000140625'), Decimal('2560000'), Decimal('180.000000000')),
-    (Decimal('0.0001373291015625'), Decimal('2621440'), Decimal('180.0000000000000000')),
-    (Decimal('0.000128'), Decimal('2812500'), Decimal('180.000000')),
-    (Decimal('0.000125'), Decimal('2880000'), Decimal('180.000000')),
-    (Decimal('0.0001220703125'), Decimal('2949120'), Decimal('180.0000000000000')),
-    (Decimal('0.00012'), Decimal('3000000'), Decimal('180.00000')),
-    (Decimal('0.0001171875'), Decimal('3072000'), Decimal('180.0000000000')),
-    (Decimal('0.0001152'), Decimal('3125000'), Decimal('180.0000000')),
-    (Decimal('0.00011444091796875'), Decimal('3145728'), Decimal('180.00000000000000000')),
-    (Decimal('0.0001125'), Decimal('3200000'), Decimal('180.0000000')),
-    (Decimal('0.00010986328125'), Decimal('3276800'), Decimal('180.00000000000000')),
-    (Decimal('0.0001024'), Decimal('3515625'), Decimal('0E-7')),
-    (Decimal('0.0001'), Decimal('3600000'), Decimal('180.0000')),
-    (Decimal('0.00009765625'), Decimal('3686400'), Decimal('180.00000000000')),
-    (Decimal('0.000096'), Decimal('3750000'), Decimal('180.000000')),
-    (Decimal('0.00009375'), Decimal('3840000'), Decimal('180.00000000')),
-    (Decimal('0.00009216'), Decimal('3906250'), Decimal('180.00000000')),
-    (Decimal('0.000091552734375'), Decimal('3932160'), Decimal('180.000000000000000')),
-    (Decimal('0.00009'), Decimal('4000000'), Decimal('180.00000')),
-    (Decimal('0.000087890625'), Decimal('4096000'), Decimal('180.000000000000')),
-    (Decimal('0.0000858306884765625'), Decimal('4194304'), Decimal('180.0000000000000000000')),
-    (Decimal('0.00008'), Decimal('4500000'), Decimal('180.00000')),
-    (Decimal('0.000078125'), Decimal('4608000'), Decimal('180.000000000')),
-    (Decimal('0.0000768'), Decimal('4687500'), Decimal('180.0000000')),
-    (Decimal('0.0000762939453125'), Decimal('4718592'), Decimal('180.0000000000000000')),
-    (Decimal('0.000075'), Decimal('4800000'), Decimal('180.000000')),
-    (Decimal('0.0000732421875'), Decimal('4915200'), Decimal('180.0000000000000')),
-    (Decimal('0.000072'), Decimal('5000000'), Decimal('180.000000')),
-    (Decimal('0.0000703125'), Decimal('5120000'), Decimal('180.0000000000')),
-    (Decimal('0.00006866455078125'), Decimal('5242880'), Decimal('180.00000000000000000')),
-    (Decimal('0.000064'), Decimal('5625000'), Decimal('180.000000')),
-    (Decimal('0.0000625'), Decimal('5760000'), Decimal('180.0000000')),
-    (Decimal('0.00006144'), Decimal('5859375'), Decimal('0E-8')),
-    (Decimal('0.00006103515625'), Decimal('5898240'), Decimal('180.00000000000000')),
-    (Decimal('0.00006'), Decimal('6000000'), Decimal('180.00000')),
-    (Decimal('0.00005859375'), Decimal('6144000'), Decimal('180.00000000000')),
-    (Decimal('0.0000576'), Decimal('6250000'), Decimal('180.0000000')),
-    (Decimal('0.000057220458984375'), Decimal('6291456'), Decimal('180.000000000000000000')),
-    (Decimal('0.00005625'), Decimal('6400000'), Decimal('180.00000000')),
-    (Decimal('0.000054931640625'), Decimal('6553600'), Decimal('180.000000000000000')),
-    (Decimal('0.0000512'), Decimal('7031250'), Decimal('180.0000000')),
-    (Decimal('0.00005'), Decimal('7200000'), Decimal('180.00000')),
-    (Decimal('0.000048828125'), Decimal('7372800'), Decimal('180.000000000000')),
-    (Decimal('0.000048'), Decimal('7500000'), Decimal('180.000000')),
-    (Decimal('0.000046875'), Decimal('7680000'), Decimal('180.000000000')),
-    (Decimal('0.00004608'), Decimal('7812500'), Decimal('180.00000000')),
-    (Decimal('0.0000457763671875'), Decimal('7864320'), Decimal('180.0000000000000000')),
-    (Decimal('0.000045'), Decimal('8000000'), Decimal('180.000000')),
-    (Decimal('0.0000439453125'), Decimal('8192000'), Decimal('180.0000000000000')),
-    (Decimal('0.00004291534423828125'), Decimal('8388608'), Decimal('180.00000000000000000000')),
-    (Decimal('0.00004'), Decimal('9000000'), Decimal('180.00000')),
-    (Decimal('0.0000390625'), Decimal('9216000'), Decimal('180.0000000000')),
-    (Decimal('0.0000384'), Decimal('9375000'), Decimal('180.0000000')),
-    (Decimal('0.00003814697265625'), Decimal('9437184'), Decimal('180.00000000000000000')),
-    (Decimal('0.0000375'), Decimal('9600000'), Decimal('180.0000000')),
-    (Decimal('0.000036864'), Decimal('9765625'), Decimal('0E-9')),
-    (Decimal('0.00003662109375'), Decimal('9830400'), Decimal('180.00000000000000')),
-    (Decimal('0.000036'), Decimal('10000000'), Decimal('180.000000')),
-    (Decimal('0.00003515625'), Decimal('10240000'), Decimal('180.00000000000')),
-    (Decimal('0.000034332275390625'), Decimal('10485760'), Decimal('180.000000000000000000')),
-    (Decimal('0.000032'), Decimal('11250000'), Decimal('180.000000')),
-    (Decimal('0.00003125'), Decimal('11520000'), Decimal('180.00000000')),
-    (Decimal('0.00003072'), Decimal('11718750'), Decimal('180.00000000')),
-    (Decimal('0.000030517578125'), Decimal('11796480'), Decimal('180.000000000000000')),
-    (Decimal('0.00003'), Decimal('12000000'), Decimal('180.00000')),
-    (Decimal('0.000029296875'), Decimal('12288000'), Decimal('180.000000000000')),
-    (Decimal('0.0000288'), Decimal('12500000'), Decimal('180.0000000')),
-    (Decimal('0.0000286102294921875'), Decimal('12582912'), Decimal('180.0000000000000000000')),
-    (Decimal('0.000028125'), Decimal('12800000'), Decimal('180.000000000')),
-    (Decimal('0.0000274658203125'), Decimal('13107200'), Decimal('180.0000000000000000')),
-    (Decimal('0.0000256'), Decimal('14062500'), Decimal('180.0000000')),
-    (Decimal('0.000025'), Decimal('14400000'), Decimal('180.000000')),
-    (Decimal('0.0000244140625'), Decimal('14745600'), Decimal('180.0000000000000')),
-    (Decimal('0.000024'), Decimal('15000000'), Decimal('180.000000')),
-    (Decimal('0.0000234375'), Decimal('15360000'), Decimal('180.0000000000')),
-    (Decimal('0.00002304'), Decimal('15625000'), Decimal('180.00000000')),
-    (Decimal('0.00002288818359375'), Decimal('15728640'), Decimal('180.00000000000000000')),
-    (Decimal('0.0000225'), Decimal('16000000'), Decimal('180.0000000')),
-    (Decimal('0.00002197265625'), Decimal('16384000'), Decimal('180.00000000000000')),
-    (Decimal('0.000021457672119140625'), Decimal('16777216'), Decimal('180.000000000000000000000')),
-    (Decimal('0.00002048'), Decimal('17578125'), Decimal('0E-8')),
-    (Decimal('0.00002'), Decimal('18000000'), Decimal('180.00000')),
-    (Decimal('0.00001953125'), Decimal('18432000'), Decimal('180.00000000000')),
-    (Decimal('0.0000192'), Decimal('18750000'), Decimal('180.0000000')),
-    (Decimal('0.000019073486328125'), Decimal('18874368'), Decimal('180.000000000000000000')),
-    (Decimal('0.00001875'), Decimal('19200000'), Decimal('180.00000000')),
-    (Decimal('0.000018432'), Decimal('19531250'), Decimal('180.000000000')),
-    (Decimal('0.000018310546875'), Decimal('19660800'), Decimal('180.000000000000000')),
-    (Decimal('0.000018'), Decimal('20000000'), Decimal('180.000000')),
-    (Decimal('0.000017578125'), Decimal('20480000'), Decimal('180.000000000000')),
-    (Decimal('0.0000171661376953125'), Decimal('20971520'), Decimal('180.0000000000000000000')),
-    (Decimal('0.000016'), Decimal('22500000'), Decimal('180.000000')),
-    (Decimal('0.000015625'), Decimal('23040000'), Decimal('180.000000000')),
-    (Decimal('0.00001536'), Decimal('23437500'), Decimal('180.00000000')),
-    (Decimal('0.0000152587890625'), Decimal('23592960'), Decimal('180.0000000000000000')),
-    (Decimal('0.000015'), Decimal('24000000'), Decimal('180.000000')),
-    (Decimal('0.0000146484375'), Decimal('24576000'), Decimal('180.0000000000000')),
-    (Decimal('0.0000144'), Decimal('25000000'), Decimal('180.0000000')),
-    (Decimal('0.00001430511474609375'), Decimal('25165824'), Decimal('180.00000000000000000000')),
-    (Decimal('0.0000140625'), Decimal('25600000'), Decimal('180.0000000000')),
-    (Decimal('0.00001373291015625'), Decimal('26214400'), Decimal('180.00000000000000000')),
-    (Decimal('0.0000128'), Decimal('28125000'), Decimal('180.0000000')),
-    (Decimal('0.0000125'), Decimal('28800000'), Decimal('180.0000000')),
-    (Decimal('0.000012288'), Decimal('29296875'), Decimal('0E-9')),
-    (Decimal('0.00001220703125'), Decimal('29491200'), Decimal('180.00000000000000')),
-    (Decimal('0.000012'), Decimal('30000000'), Decimal('180.000000')),
-    (Decimal('0.00001171875'), Decimal('30720000'), Decimal('180.00000000000')),
-    (Decimal('0.00001152'), Decimal('31250000'), Decimal('180.00000000')),
-    (Decimal('0.000011444091796875'), Decimal('31457280'), Decimal('180.000000000000000000')),
-    (Decimal('0.00001125'), Decimal('32000000'), Decimal('180.00000000')),
-    (Decimal('0.000010986328125'), Decimal('32768000'), Decimal('180.000000000000000')),
-    (Decimal('0.0000107288360595703125'), Decimal('33554432'), Decimal('180.0000000000000000000000')),
-    (Decimal('0.00001024'), Decimal('35156250'), Decimal('180.00000000')),
-    (Decimal('0.00001'), Decimal('36000000'), Decimal('180.00000')),
-    (Decimal('0.000009765625'), Decimal('36864000'), Decimal('180.000000000000')),
-    (Decimal('0.0000096'), Decimal('37500000'), Decimal('180.0000000')),
-    (Decimal('0.0000095367431640625'), Decimal('37748736'), Decimal('180.0000000000000000000')),
-    (Decimal('0.000009375'), Decimal('38400000'), Decimal('180.000000000')),
-    (Decimal('0.000009216'), Decimal('39062500'), Decimal('180.000000000')),
-    (Decimal('0.0000091552734375'), Decimal('39321600'), Decimal('180.0000000000000000')),
-    (Decimal('0.000009'), Decimal('40000000'), Decimal('180.000000')),
-    (Decimal('0.0000087890625'), Decimal('40960000'), Decimal('180.0000000000000')),
-    (Decimal('0.00000858306884765625'), Decimal('41943040'), Decimal('180.00000000000000000000')),
-    (Decimal('0.000008'), Decimal('45000000'), Decimal('180.000000')),
-    (Decimal('0.0000078125'), Decimal('46080000'), Decimal('180.0000000000')),
-    (Decimal('0.00000768'), Decimal('46875000'), Decimal('180.00000000')),
-    (Decimal('0.00000762939453125'), Decimal('47185920'), Decimal('180.00000000000000000')),
-    (Decimal('0.0000075'), Decimal('48000000'), Decimal('180.0000000')),
-    (Decimal('0.0000073728'), Decimal('48828125'), Decimal('0E-10')),
-    (Decimal('0.00000732421875'), Decimal('49152000'), Decimal('180.00000000000000')),
-    (Decimal('0.0000072'), Decimal('50000000'), Decimal('180.0000000')),
-    (Decimal('0.000007152557373046875'), Decimal('50331648'), Decimal('180.000000000000000000000')),
-    (Decimal('0.00000703125'), Decimal('51200000'), Decimal('180.00000000000')),
-    (Decimal('0.000006866455078125'), Decimal('52428800'), Decimal('180.000000000000000000')),
-    (Decimal('0.0000064'), Decimal('56250000'), Decimal('180.0000000')),
-    (Decimal('0.00000625'), Decimal('57600000'), Decimal('180.00000000')),
-    (Decimal('0.000006144'), Decimal('58593750'), Decimal('180.000000000')),
-    (Decimal('0.000006103515625'), Decimal('58982400'), Decimal('180.000000000000000')),
-    (Decimal('0.000006'), Decimal('60000000'), Decimal('180.000000')),
-    (Decimal('0.000005859375'), Decimal('61440000'), Decimal('180.000000000000')),
-    (Decimal('0.00000576'), Decimal('62500000'), Decimal('180.00000000')),
-    (Decimal('0.0000057220458984375'), Decimal('62914560'), Decimal('180.0000000000000000000')),
-    (Decimal('0.000005625'), Decimal('64000000'), Decimal('180.000000000')),
-    (Decimal('0.0000054931640625'), Decimal('65536000'), Decimal('180.0000000000000000')),
-    (Decimal('0.00000536441802978515625'), Decimal('67108864'), Decimal('180.00000000000000000000000')),
-    (Decimal('0.00000512'), Decimal('70312500'), Decimal('180.00000000')),
-    (Decimal('0.000005'), Decimal('72000000'), Decimal('180.000000')),
-    (Decimal('0.0000048828125'), Decimal('73728000'), Decimal('180.0000000000000')),
-    (Decimal('0.0000048'), Decimal('75000000'), Decimal('180.0000000')),
-    (Decimal('0.00000476837158203125'), Decimal('75497472'), Decimal('180.00000000000000000000')),
-    (Decimal('0.0000046875'), Decimal('76800000'), Decimal('180.0000000000')),
-    (Decimal('0.000004608'), Decimal('78125000'), Decimal('180.000000000')),
-    (Decimal('0.00000457763671875'), Decimal('78643200'), Decimal('180.00000000000000000')),
-    (Decimal('0.0000045'), Decimal('80000000'), Decimal('180.0000000')),
-    (Decimal('0.00000439453125'), Decimal('81920000'), Decimal('180.00000000000000')),
-    (Decimal('0.000004291534423828125'), Decimal('83886080'), Decimal('180.000000000000000000000')),
-    (Decimal('0.000004096'), Decimal('87890625'), Decimal('0E-9')),
-    (Decimal('0.000004'), Decimal('90000000'), Decimal('180.000000')),
-    (Decimal('0.00000390625'), Decimal('92160000'), Decimal('180.00000000000')),
-    (Decimal('0.00000384'), Decimal('93750000'), Decimal('180.00000000')),
-    (Decimal('0.000003814697265625'), Decimal('94371840'), Decimal('180.000000000000000000')),
-    (Decimal('0.00000375'), Decimal('96000000'), Decimal('180.00000000')),
-    (Decimal('0.0000036864'), Decimal('97656250'), Decimal('180.0000000000')),
-    (Decimal('0.000003662109375'), Decimal('98304000'), Decimal('180.000000000000000')),
-    (Decimal('0.0000036'), Decimal('100000000'), Decimal('180.0000000')),
-    (Decimal('0.0000035762786865234375'), Decimal('100663296'), Decimal('180.0000000000000000000000')),
-    (Decimal('0.000003515625'), Decimal('102400000'), Decimal('180.000000000000')),
-    (Decimal('0.0000034332275390625'), Decimal('104857600'), Decimal('180.0000000000000000000')),
-    (Decimal('0.0000032'), Decimal('112500000'), Decimal('180.0000000')),
-    (Decimal('0.000003125'), Decimal('115200000'), Decimal('180.000000000')),
-    (Decimal('0.000003072'), Decimal('117187500'), Decimal('180.000000000')),
-    (Decimal('0.0000030517578125'), Decimal('117964800'), Decimal('180.0000000000000000')),
-    (Decimal('0.000003'), Decimal('120000000'), Decimal('180.000000')),
-    (Decimal('0.0000029296875'), Decimal('122880000'), Decimal('180.0000000000000')),
-    (Decimal('0.00000288'), Decimal('125000000'), Decimal('180.00000000')),
-    (Decimal('0.00000286102294921875'), Decimal('125829120'), Decimal('180.00000000000000000000')),
-    (Decimal('0.0000028125'), Decimal('128000000'), Decimal('180.0000000000')),
-    (Decimal('0.00000274658203125'), Decimal('131072000'), Decimal('180.00000000000000000')),
-    (Decimal('0.000002682209014892578125'), Decimal('134217728'), Decimal('180.000000000000000000000000')),
-    (Decimal('0.00000256'), Decimal('140625000'), Decimal('180.00000000')),
-    (Decimal('0.0000025'), Decimal('144000000'), Decimal('180.0000000')),
-    (Decimal('0.0000024576'), Decimal('146484375'), Decimal('0E-10')),
-    (Decimal('0.00000244140625'), Decimal('147456000'), Decimal('180.00000000000000')),
-    (Decimal('0.0000024'), Decimal('150000000'), Decimal('180.0000000')),
-    (Decimal('0.000002384185791015625'), Decimal('150994944'), Decimal('180.000000000000000000000')),
-    (Decimal('0.00000234375'), Decimal('153600000'), Decimal('180.00000000000')),
-    (Decimal('0.000002304'), Decimal('156250000'), Decimal('180.000000000')),
-    (Decimal('0.000002288818359375'), Decimal('157286400'), Decimal('180.000000000000000000')),
-    (Decimal('0.00000225'), Decimal('160000000'), Decimal('180.00000000')),
-    (Decimal('0.000002197265625'), Decimal('163840000'), Decimal('180.000000000000000')),
-    (Decimal('0.0000021457672119140625'), Decimal('167772160'), Decimal('180.0000000000000000000000')),
-    (Decimal('0.000002048'), Decimal('175781250'), Decimal('180.000000000')),
-    (Decimal('0.000002'), Decimal('180000000'), Decimal('180.000000')),
-    (Decimal('0.000001953125'), Decimal('184320000'), Decimal('180.000000000000')),
-    (Decimal('0.00000192'), Decimal('187500000'), Decimal('180.00000000')),
-    (Decimal('0.0000019073486328125'), Decimal('188743680'), Decimal('180.0000000000000000000')),
-    (Decimal('0.000001875'), Decimal('192000000'), Decimal('180.000000000')),
-    (Decimal('0.0000018432'), Decimal('195312500'), Decimal('180.0000000000')),
-    (Decimal('0.0000018310546875'), Decimal('196608000'), Decimal('180.0000000000000000')),
-    (Decimal('0.0000018'), Decimal('200000000'), Decimal('180.0000000')),
-    (Decimal('0.00000178813934326171875'), Decimal('201326592'), Decimal('180.00000000000000000000000')),
-    (Decimal('0.0000017578125'), Decimal('204800000'), Decimal('180.0000000000000')),
-    (Decimal('0.00000171661376953125'), Decimal('209715200'), Decimal('180.00000000000000000000')),
-    (Decimal('0.0000016'), Decimal('225000000'), Decimal('180.0000000')),
-    (Decimal('0.0000015625'), Decimal('230400000'), Decimal('180.0000000000')),
-    (Decimal('0.000001536'), Decimal('234375000'), Decimal('180.000000000')),
-    (Decimal('0.00000152587890625'), Decimal('235929600'), Decimal('180.00000000000000000')),
-    (Decimal('0.0000015'), Decimal('240000000'), Decimal('180.0000000')),
-    (Decimal('0.00000147456'), Decimal('244140625'), Decimal('0E-11')),
-    (Decimal('0.00000146484375'), Decimal('245760000'), Decimal('180.00000000000000')),
-    (Decimal('0.00000144'), Decimal('250000000'), Decimal('180.00000000')),
-    (Decimal('0.000001430511474609375'), Decimal('251658240'), Decimal('180.000000000000000000000')),
-    (Decimal('0.00000140625'), Decimal('256000000'), Decimal('180.00000000000')),
-    (Decimal('0.000001373291015625'), Decimal('262144000'), Decimal('180.000000000000000000')),
-    (Decimal('0.0000013411045074462890625'), Decimal('268435456'), Decimal('180.0000000000000000000000000')),
-    (Decimal('0.00000128'), Decimal('281250000'), Decimal('180.00000000')),
-    (Decimal('0.00000125'), Decimal('288000000'), Decimal('180.00000000')),
-    (Decimal('0.0000012288'), Decimal('292968750'), Decimal('180.0000000000')),
-    (Decimal('0.000001220703125'), Decimal('294912000'), Decimal('180.000000000000000')),
-    (Decimal('0.0000012'), Decimal('300000000'), Decimal('180.0000000')),
-    (Decimal('0.0000011920928955078125'), Decimal('301989888'), Decimal('180.0000000000000000000000')),
-    (Decimal('0.000001171875'), Decimal('307200000'), Decimal('180.000000000000')),
-    (Decimal('0.000001152'), Decimal('312500000'), Decimal('180.000000000')),
-    (Decimal('0.0000011444091796875'), Decimal('314572800'), Decimal('180.0000000000000000000')),
-    (Decimal('0.000001125'), Decimal('320000000'), Decimal('180.000000000')),
-    (Decimal('0.0000010986328125'), Decimal('327680000'), Decimal('180.0000000000000000')),
-    (Decimal('0.00000107288360595703125'), Decimal('335544320'), Decimal('180.00000000000000000000000')),
-    (Decimal('0.000001024'), Decimal('351562500'), Decimal('180.000000000')),
-    (Decimal('0.000001'), Decimal('360000000'), Decimal('180.000000')),
-    (Decimal('9.765625E-7'), Decimal('368640000'), Decimal('180.0000000000000')),
-    (Decimal('9.6E-7'), Decimal('375000000'), Decimal('180.00000000')),
-    (Decimal('9.5367431640625E-7'), Decimal('377487360'), Decimal('180.00000000000000000000')),
-    (Decimal('9.375E-7'), Decimal('384000000'), Decimal('180.0000000000')),
-    (Decimal('9.216E-7'), Decimal('390625000'), Decimal('180.0000000000')),
-    (Decimal('9.1552734375E-7'), Decimal('393216000'), Decimal('180.00000000000000000')),
-    (Decimal('9E-7'), Decimal('400000000'), Decimal('180.0000000')),
-    (Decimal('8.94069671630859375E-7'), Decimal('402653184'), Decimal('180.000000000000000000000000')),
-    (Decimal('8.7890625E-7'), Decimal('409600000'), Decimal('180.00000000000000')),
-    (Decimal('8.58306884765625E-7'), Decimal('419430400'), Decimal('180.000000000000000000000')),
-    (Decimal('8.192E-7'), Decimal('439453125'), Decimal('0E-10')),
-    (Decimal('8E-7'), Decimal('450000000'), Decimal('180.0000000')),
-    (Decimal('7.8125E-7'), Decimal('460800000'), Decimal('180.00000000000')),
-    (Decimal('7.68E-7'), Decimal('468750000'), Decimal('180.000000000')),
-    (Decimal('7.62939453125E-7'), Decimal('471859200'), Decimal('180.000000000000000000')),
-    (Decimal('7.5E-7'), Decimal('480000000'), Decimal('180.00000000')),
-    (Decimal('7.3728E-7'), Decimal('488281250'), Decimal('180.00000000000')),
-    (Decimal('7.32421875E-7'), Decimal('491520000'), Decimal('180.000000000000000')),
-    (Decimal('7.2E-7'), Decimal('500000000'), Decimal('180.00000000')),
-    (Decimal('7.152557373046875E-7'), Decimal('503316480'), Decimal('180.0000000000000000000000')),
-    (Decimal('7.03125E-7'), Decimal('512000000'), Decimal('180.000000000000')),
-    (Decimal('6.866455078125E-7'), Decimal('524288000'), Decimal('180.0000000000000000000')),
-    (Decimal('6.7055225372314453125E-7'), Decimal('536870912'), Decimal('180.00000000000000000000000000')),
-    (Decimal('6.4E-7'), Decimal('562500000'), Decimal('180.00000000')),
-    (Decimal('6.25E-7'), Decimal('576000000'), Decimal('180.000000000')),
-    (Decimal('6.144E-7'), Decimal('585937500'), Decimal('180.0000000000')),
-    (Decimal('6.103515625E-7'), Decimal('589824000'), Decimal('180.0000000000000000')),
-    (Decimal('6E-7'), Decimal('600000000'), Decimal('180.0000000')),
-    (Decimal('5.9604644775390625E-7'), Decimal('603979776'), Decimal('180.00000000000000000000000')),
-    (Decimal('5.859375E-7'), Decimal('614400000'), Decimal('180.0000000000000')),
-    (Decimal('5.76E-7'), Decimal('625000000'), Decimal('180.000000000')),
-    (Decimal('5.7220458984375E-7'), Decimal('629145600'), Decimal('180.00000000000000000000')),
-    (Decimal('5.625E-7'), Decimal('640000000'), Decimal('180.0000000000')),
-    (Decimal('5.4931640625E-7'), Decimal('655360000'), Decimal('180.00000000000000000')),
-    (Decimal('5.36441802978515625E-7'), Decimal('671088640'), Decimal('180.000000000000000000000000')),
-    (Decimal('5.12E-7'), Decimal('703125000'), Decimal('180.000000000')),
-    (Decimal('5E-7'), Decimal('720000000'), Decimal('180.0000000')),
-    (Decimal('4.9152E-7'), Decimal('732421875'), Decimal('0E-11')),
-    (Decimal('4.8828125E-7'), Decimal('737280000'), Decimal('180.00000000000000')),
-    (Decimal('4.8E-7'), Decimal('750000000'), Decimal('180.00000000')),
-    (Decimal('4.76837158203125E-7'), Decimal('754974720'), Decimal('180.000000000000000000000')),
-    (Decimal('4.6875E-7'), Decimal('768000000'), Decimal('180.00000000000')),
-    (Decimal('4.608E-7'), Decimal('781250000'), Decimal('180.0000000000')),
-    (Decimal('4.57763671875E-7'), Decimal('786432000'), Decimal('180.000000000000000000')),
-    (Decimal('4.5E-7'), Decimal('800000000'), Decimal('180.00000000')),
-    (Decimal('4.470348358154296875E-7'), Decimal('805306368'), Decimal('180.0000000000000000000000000')),
-    (Decimal('4.39453125E-7'), Decimal('819200000'), Decimal('180.000000000000000')),
-    (Decimal('4.291534423828125E-7'), Decimal('838860800'), Decimal('180.0000000000000000000000')),
-    (Decimal('4.096E-7'), Decimal('878906250'), Decimal('180.0000000000')),
-    (Decimal('4E-7'), Decimal('900000000'), Decimal('180.0000000')),
-    (Decimal('3.90625E-7'), Decimal('921600000'), Decimal('180.000000000000')),
-    (Decimal('3.84E-7'), Decimal('937500000'), Decimal('180.000000000')),
-    (Decimal('3.814697265625E-7'), Decimal('943718400'), Decimal('180.0000000000000000000')),
-    (Decimal('3.75E-7'), Decimal('960000000'), Decimal('180.000000000')),
-    (Decimal('3.6864E-7'), Decimal('976562500'), Decimal('180.00000000000')),
-    (Decimal('3.662109375E-7'), Decimal('983040000'), Decimal('180.0000000000000000')),
-    (Decimal('3.6E-7'), Decimal('1000000000'), Decimal('180.00000000')),
-    (Decimal('3.5762786865234375E-7'), Decimal('1006632960'), Decimal('180.00000000000000000000000')),
-    (Decimal('3.515625E-7'), Decimal('1024000000'), Decimal('180.0000000000000')),
-    (Decimal('3.4332275390625E-7'), Decimal('1048576000'), Decimal('180.00000000000000000000')),
-    (Decimal('3.35276126861572265625E-7'), Decimal('1073741824'), Decimal('180.000000000000000000000000000')),
-    (Decimal('3.2E-7'), Decimal('1125000000'), Decimal('180.00000000')),
-    (Decimal('3.125E-7'), Decimal('1152000000'), Decimal('180.0000000000')),
-    (Decimal('3.072E-7'), Decimal('1171875000'), Decimal('180.0000000000')),
-    (Decimal('3.0517578125E-7'), Decimal('1179648000'), Decimal('180.00000000000000000')),
-    (Decimal('3E-7'), Decimal('1200000000'), Decimal('180.0000000')),
-    (Decimal('2.98023223876953125E-7'), Decimal('1207959552'), Decimal('180.000000000000000000000000')),
-    (Decimal('2.94912E-7'), Decimal('1220703125'), Decimal('0E-12')),
-    (Decimal('2.9296875E-7'), Decimal('1228800000'), Decimal('180.00000000000000')),
-    (Decimal('2.88E-7'), Decimal('1250000000'), Decimal('180.000000000')),
-    (Decimal('2.86102294921875E-7'), Decimal('1258291200'), Decimal('180.000000000000000000000')),
-    (Decimal('2.8125E-7'), Decimal('1280000000'), Decimal('180.00000000000')),
-    (Decimal('2.74658203125E-7'), Decimal('1310720000'), Decimal('180.000000000000000000')),
-    (Decimal('2.682209014892578125E-7'), Decimal('1342177280'), Decimal('180.0000000000000000000000000')),
-    (Decimal('2.56E-7'), Decimal('1406250000'), Decimal('180.000000000')),
-    (Decimal('2.5E-7'), Decimal('1440000000'), Decimal('180.00000000')),
-    (Decimal('2.4576E-7'), Decimal('1464843750'), Decimal('180.00000000000')),
-    (Decimal('2.44140625E-7'), Decimal('1474560000'), Decimal('180.000000000000000')),
-    (Decimal('2.4E-7'), Decimal('1500000000'), Decimal('180.00000000')),
-    (Decimal('2.384185791015625E-7'), Decimal('1509949440'), Decimal('180.0000000000000000000000')),
-    (Decimal('2.34375E-7'), Decimal('1536000000'), Decimal('180.000000000000')),
-    (Decimal('2.304E-7'), Decimal('1562500000'), Decimal('180.0000000000')),
-    (Decimal('2.288818359375E-7'), Decimal('1572864000'), Decimal('180.0000000000000000000')),
-    (Decimal('2.25E-7'), Decimal('1600000000'), Decimal('180.000000000')),
-    (Decimal('2.2351741790771484375E-7'), Decimal('1610612736'), Decimal('180.00000000000000000000000000')),
-    (Decimal('2.197265625E-7'), Decimal('1638400000'), Decimal('180.0000000000000000')),
-    (Decimal('2.1457672119140625E-7'), Decimal('1677721600'), Decimal('180.00000000000000000000000')),
-    (Decimal('2.048E-7'), Decimal('1757812500'), Decimal('180.0000000000')),
-    (Decimal('2E-7'), Decimal('1800000000'), Decimal('180.0000000')),
-    (Decimal('1.953125E-7'), Decimal('1843200000'), Decimal('180.0000000000000')),
-    (Decimal('1.92E-7'), Decimal('1875000000'), Decimal('180.000000000')),
-    (Decimal('1.9073486328125E-7'), Decimal('1887436800'), Decimal('180.00000000000000000000')),
-    (Decimal('1.875E-7'), Decimal('1920000000'), Decimal('180.0000000000')),
-    (Decimal('1.8432E-7'), Decimal('1953125000'), Decimal('180.00000000000')),
-    (Decimal('1.8310546875E-7'), Decimal('1966080000'), Decimal('180.00000000000000000')),
-    (Decimal('1.8E-7'), Decimal('2000000000'), Decimal('180.00000000')),
-    (Decimal('1.78813934326171875E-7'), Decimal('2013265920'), Decimal('180.000000000000000000000000')),
-    (Decimal('1.7578125E-7'), Decimal('2048000000'), Decimal('180.00000000000000')),
-    (Decimal('1.71661376953125E-7'), Decimal('2097152000'), Decimal('180.000000000000000000000')),
-    (Decimal('1.676380634307861328125E-7'), Decimal('2147483648'), Decimal('180.0000000000000000000000000000')),
-    (Decimal('1.6384E-7'), Decimal('2197265625'), Decimal('0E-11')),
-    (Decimal('1.6E-7'), Decimal('2250000000'), Decimal('180.00000000')),
-    (Decimal('1.5625E-7'), Decimal('2304000000'), Decimal('180.00000000000')),
-    (Decimal('1.536E-7'), Decimal('2343750000'), Decimal('180.0000000000')),
-    (Decimal('1.52587890625E-7'), Decimal('2359296000'), Decimal('180.000000000000000000')),
-    (Decimal('1.5E-7'), Decimal('2400000000'), Decimal('180.00000000')),
-    (Decimal('1.490116119384765625E-7'), Decimal('2415919104'), Decimal('180.0000000000000000000000000')),
-    (Decimal('1.47456E-7'), Decimal('2441406250'), Decimal('180.000000000000')),
-    (Decimal('1.46484375E-7'), Decimal('2457600000'), Decimal('180.000000000000000')),
-    (Decimal('1.44E-7'), Decimal('2500000000'), Decimal('180.000000000')),
-    (Decimal('1.430511474609375E-7'), Decimal('2516582400'), Decimal('180.0000000000000000000000')),
-    (Decimal('1.40625E-7'), Decimal('2560000000'), Decimal('180.000000000000')),
-    (Decimal('1.373291015625E-7'), Decimal('2621440000'), Decimal('180.0000000000000000000')),
-    (Decimal('1.3411045074462890625E-7'), Decimal('2684354560'), Decimal('180.00000000000000000000000000')),
-    (Decimal('1.28E-7'), Decimal('2812500000'), Decimal('180.000000000')),
-    (Decimal('1.25E-7'), Decimal('2880000000'), Decimal('180.000000000')),
-    (Decimal('1.2288E-7'), Decimal('2929687500'), Decimal('180.00000000000')),
-    (Decimal('1.220703125E-7'), Decimal('2949120000'), Decimal('180.0000000000000000')),
-    (Decimal('1.2E-7'), Decimal('3000000000'), Decimal('180.00000000')),
-    (Decimal('1.1920928955078125E-7'), Decimal('3019898880'), Decimal('180.00000000000000000000000')),
-    (Decimal('1.171875E-7'), Decimal('3072000000'), Decimal('180.0000000000000')),
-    (Decimal('1.152E-7'), Decimal('3125000000'), Decimal('180.0000000000')),
-    (Decimal('1.1444091796875E-7'), Decimal('3145728000'), Decimal('180.00000000000000000000')),
-    (Decimal('1.125E-7'), Decimal('3200000000'), Decimal('180.0000000000')),
-    (Decimal('1.11758708953857421875E-7'), Decimal('3221225472'), Decimal('180.000000000000000000000000000')),
-    (Decimal('1.0986328125E-7'), Decimal('3276800000'), Decimal('180.00000000000000000')),
-    (Decimal('1.07288360595703125E-7'), Decimal('3355443200'), Decimal('180.000000000000000000000000')),
-    (Decimal('1.024E-7'), Decimal('3515625000'), Decimal('180.0000000000')),
-    (Decimal('1E-7'), Decimal('3600000000'), Decimal('180.0000000')),
-    (Decimal('9.8304E-8'), Decimal('3662109375'), Decimal('0E-12')),
-    (Decimal('9.765625E-8'), Decimal('3686400000'), Decimal('180.00000000000000')),
-    (Decimal('9.6E-8'), Decimal('3750000000'), Decimal('180.000000000')),
-    (Decimal('9.5367431640625E-8'), Decimal('3774873600'), Decimal('180.000000000000000000000')),
-    (Decimal('9.375E-8'), Decimal('3840000000'), Decimal('180.00000000000')),
-    (Decimal('9.216E-8'), Decimal('3906250000'), Decimal('180.00000000000')),
-    (Decimal('9.1552734375E-8'), Decimal('3932160000'), Decimal('180.000000000000000000')),
-    (Decimal('9E-8'), Decimal('4000000000'), Decimal('180.00000000')),
-    (Decimal('8.94069671630859375E-8'), Decimal('4026531840'), Decimal('180.0000000000000000000000000')),
-    (Decimal('8.7890625E-8'), Decimal('4096000000'), Decimal('180.000000000000000')),
-    (Decimal('8.58306884765625E-8'), Decimal('4194304000'), Decimal('180.0000000000000000000000')),
-    (Decimal('8.381903171539306640625E-8'), Decimal('4294967296'), Decimal('180.00000000000000000000000000000')),
-    (Decimal('8.192E-8'), Decimal('4394531250'), Decimal('180.00000000000')),
-    (Decimal('8E-8'), Decimal('4500000000'), Decimal('180.00000000')),
-    (Decimal('7.8125E-8'), Decimal('4608000000'), Decimal('180.000000000000')),
-    (Decimal('7.68E-8'), Decimal('4687500000'), Decimal('180.0000000000')),
-    (Decimal('7.62939453125E-8'), Decimal('4718592000'), Decimal('180.0000000000000000000')),
-    (Decimal('7.5E-8'), Decimal('4800000000'), Decimal('180.000000000')),
-    (Decimal('7.450580596923828125E-8'), Decimal('4831838208'), Decimal('180.00000000000000000000000000')),
-    (Decimal('7.3728E-8'), Decimal('4882812500'), Decimal('180.000000000000')),
-    (Decimal('7.32421875E-8'), Decimal('4915200000'), Decimal('180.0000000000000000')),
-    (Decimal('7.2E-8'), Decimal('5000000000'), Decimal('180.000000000')),
-    (Decimal('7.152557373046875E-8'), Decimal('5033164800'), Decimal('180.00000000000000000000000')),
-    (Decimal('7.03125E-8'), Decimal('5120000000'), Decimal('180.0000000000000')),
-    (Decimal('6.866455078125E-8'), Decimal('5242880000'), Decimal('180.00000000000000000000')),
-    (Decimal('6.7055225372314453125E-8'), Decimal('5368709120'), Decimal('180.000000000000000000000000000')),
-    (Decimal('6.4E-8'), Decimal('5625000000'), Decimal('180.000000000')),
-    (Decimal('6.25E-8'), Decimal('5760000000'), Decimal('180.0000000000')),
-    (Decimal('6.144E-8'), Decimal('5859375000'), Decimal('180.00000000000')),
-    (Decimal('6.103515625E-8'), Decimal('5898240000'), Decimal('180.00000000000000000')),
-    (Decimal('6E-8'), Decimal('6000000000'), Decimal('180.00000000')),
-    (Decimal('5.9604644775390625E-8'), Decimal('6039797760'), Decimal('180.000000000000000000000000')),
-    (Decimal('5.89824E-8'), Decimal('6103515625'), Decimal('0E-13')),
-    (Decimal('5.859375E-8'), Decimal('6144000000'), Decimal('180.00000000000000')),
-    (Decimal('5.76E-8'), Decimal('6250000000'), Decimal('180.0000000000')),
-    (Decimal('5.7220458984375E-8'), Decimal('6291456000'), Decimal('180.000000000000000000000')),
-    (Decimal('5.625E-8'), Decimal('6400000000'), Decimal('180.00000000000')),
-    (Decimal('5.58793544769287109375E-8'), Decimal('6442450944'), Decimal('180.0000000000000000000000000000')),
-    (Decimal('5.4931640625E-8'), Decimal('6553600000'), Decimal('180.000000000000000000')),
-    (Decimal('5.36441802978515625E-8'), Decimal('6710886400'), Decimal('180.0000000000000000000000000')),
-    (Decimal('5.12E-8'), Decimal('7031250000'), Decimal('180.0000000000')),
-    (Decimal('5E-8'), Decimal('7200000000'), Decimal('180.00000000')),
-    (Decimal('4.9152E-8'), Decimal('7324218750'), Decimal('180.000000000000')),
-    (Decimal('4.8828125E-8'), Decimal('7372800000'), Decimal('180.000000000000000')),
-    (Decimal('4.8E-8'), Decimal('7500000000'), Decimal('180.000000000')),
-    (Decimal('4.76837158203125E-8'), Decimal('7549747200'), Decimal('180.0000000000000000000000')),
-    (Decimal('4.6875E-8'), Decimal('7680000000'), Decimal('180.000000000000')),
-    (Decimal('4.608E-8'), Decimal('7812500000'), Decimal('180.00000000000')),
-    (Decimal('4.57763671875E-8'), Decimal('7864320000'), Decimal('180.0000000000000000000')),
-    (Decimal('4.5E-8'), Decimal('8000000000'), Decimal('180.000000000')),
-    (Decimal('4.470348358154296875E-8'), Decimal('8053063680'), Decimal('180.00000000000000000000000000')),
-    (Decimal('4.39453125E-8'), Decimal('8192000000'), Decimal('180.0000000000000000')),
-    (Decimal('4.291534423828125E-8'), Decimal('8388608000'), Decimal('180.00000000000000000000000')),
-    (Decimal('4.1909515857696533203125E-8'), Decimal('8589934592'), Decimal('180.000000000000000000000000000000')),
-    (Decimal('4.096E-8'), Decimal('8789062500'), Decimal('180.00000000000')),
-    (Decimal('4E-8'), Decimal('9000000000'), Decimal('180.00000000')),
-    (Decimal('3.90625E-8'), Decimal('9216000000'), Decimal('180.0000000000000')),
-    (Decimal('3.84E-8'), Decimal('9375000000'), Decimal('180.0000000000')),
-    (Decimal('3.814697265625E-8'), Decimal('9437184000'), Decimal('180.00000000000000000000')),
-    (Decimal('3.75E-8'), Decimal('9600000000'), Decimal('180.0000000000')),
-    (Decimal('3.7252902984619140625E-8'), Decimal('9663676416'), Decimal('180.000000000000000000000000000')),
-    (Decimal('3.6864E-8'), Decimal('9765625000'), Decimal('180.000000000000')),
-    (Decimal('3.662109375E-8'), Decimal('9830400000'), Decimal('180.00000000000000000')),
-    (Decimal('3.6E-8'), Decimal('10000000000'), Decimal('180.000000000')),
-    (Decimal('3.5762786865234375E-8'), Decimal('10066329600'), Decimal('180.000000000000000000000000')),
-    (Decimal('3.515625E-8'), Decimal('10240000000'), Decimal('180.00000000000000')),
-    (Decimal('3.4332275390625E-8'), Decimal('10485760000'), Decimal('180.000000000000000000000')),
-    (Decimal('3.35276126861572265625E-8'), Decimal('10737418240'), Decimal('180.0000000000000000000000000000')),
-    (Decimal('3.2768E-8'), Decimal('10986328125'), Decimal('0E-12')),
-    (Decimal('3.2E-8'), Decimal('11250000000'), Decimal('180.000000000')),
-    (Decimal('3.125E-8'), Decimal('11520000000'), Decimal('180.00000000000')),
-    (Decimal('3.072E-8'), Decimal('11718750000'), Decimal('180.00000000000')),
-    (Decimal('3.0517578125E-8'), Decimal('11796480000'), Decimal('180.000000000000000000')),
-    (Decimal('3E-8'), Decimal('12000000000'), Decimal('180.00000000')),
-    (Decimal('2.98023223876953125E-8'), Decimal('12079595520'), Decimal('180.0000000000000000000000000')),
-    (Decimal('2.94912E-8'), Decimal('12207031250'), Decimal('180.0000000000000')),
-    (Decimal('2.9296875E-8'), Decimal('12288000000'), Decimal('180.000000000000000')),
-    (Decimal('2.88E-8'), Decimal('12500000000'), Decimal('180.0000000000')),
-    (Decimal('2.86102294921875E-8'), Decimal('12582912000'), Decimal('180.0000000000000000000000')),
-    (Decimal('2.8125E-8'), Decimal('12800000000'), Decimal('180.000000000000')),
-    (Decimal('2.793967723846435546875E-8'), Decimal('12884901888'), Decimal('180.00000000000000000000000000000')),
-    (Decimal('2.74658203125E-8'), Decimal('13107200000'), Decimal('180.0000000000000000000')),
-    (Decimal('2.682209014892578125E-8'), Decimal('13421772800'), Decimal('180.00000000000000000000000000')),
-    (Decimal('2.56E-8'), Decimal('14062500000'), Decimal('180.0000000000')),
-    (Decimal('2.5E-8'), Decimal('14400000000'), Decimal('180.000000000')),
-    (Decimal('2.4576E-8'), Decimal('14648437500'), Decimal('180.000000000000')),
-    (Decimal('2.44140625E-8'), Decimal('14745600000'), Decimal('180.0000000000000000')),
-    (Decimal('2.4E-8'), Decimal('15000000000'), Decimal('180.000000000')),
-    (Decimal('2.384185791015625E-8'), Decimal('15099494400'), Decimal('180.00000000000000000000000')),
-    (Decimal('2.34375E-8'), Decimal('15360000000'), Decimal('180.0000000000000')),
-    (Decimal('2.304E-8'), Decimal('15625000000'), Decimal('180.00000000000')),
-    (Decimal('2.288818359375E-8'), Decimal('15728640000'), Decimal('180.00000000000000000000')),
-    (Decimal('2.25E-8'), Decimal('16000000000'), Decimal('180.0000000000')),
-    (Decimal('2.2351741790771484375E-8'), Decimal('16106127360'), Decimal('180.000000000000000000000000000')),
-    (Decimal('2.197265625E-8'), Decimal('16384000000'), Decimal('180.00000000000000000')),
-    (Decimal('2.1457672119140625E-8'), Decimal('16777216000'), Decimal('180.000000000000000000000000')),
-    (Decimal('2.09547579288482666015625E-8'), Decimal('17179869184'), Decimal('180.0000000000000000000000000000000')),
-    (Decimal('2.048E-8'), Decimal('17578125000'), Decimal('180.00000000000')),
-    (Decimal('2E-8'), Decimal('18000000000'), Decimal('180.00000000')),
-    (Decimal('1.96608E-8'), Decimal('18310546875'), Decimal('0E-13')),
-    (Decimal('1.953125E-8'), Decimal('18432000000'), Decimal('180.00000000000000')),
-    (Decimal('1.92E-8'), Decimal('18750000000'), Decimal('180.0000000000')),
-    (Decimal('1.9073486328125E-8'), Decimal('18874368000'), Decimal('180.000000000000000000000')),
-    (Decimal('1.875E-8'), Decimal('19200000000'), Decimal('180.00000000000')),
-    (Decimal('1.86264514923095703125E-8'), Decimal('19327352832'), Decimal('180.0000000000000000000000000000')),
-    (Decimal('1.8432E-8'), Decimal('19531250000'), Decimal('180.000000000000')),
-    (Decimal('1.8310546875E-8'), Decimal('19660800000'), Decimal('180.000000000000000000')),
-    (Decimal('1.8E-8'), Decimal('20000000000'), Decimal('180.000000000')),
-    (Decimal('1.78813934326171875E-8'), Decimal('20132659200'), Decimal('180.0000000000000000000000000')),
-    (Decimal('1.7578125E-8'), Decimal('20480000000'), Decimal('180.000000000000000')),
-    (Decimal('1.71661376953125E-8'), Decimal('20971520000'), Decimal('180.0000000000000000000000')),
-    (Decimal('1.676380634307861328125E-8'), Decimal('21474836480'), Decimal('180.00000000000000000000000000000')),
-    (Decimal('1.6384E-8'), Decimal('21972656250'), Decimal('180.000000000000')),
-    (Decimal('1.6E-8'), Decimal('22500000000'), Decimal('180.000000000')),
-    (Decimal('1.5625E-8'), Decimal('23040000000'), Decimal('180.000000000000')),
-    (Decimal('1.536E-8'), Decimal('23437500000'), Decimal('180.00000000000')),
-    (Decimal('1.52587890625E-8'), Decimal('23592960000'), Decimal('180.0000000000000000000')),
-    (Decimal('1.5E-8'), Decimal('24000000000'), Decimal('180.000000000')),
-    (Decimal('1.490116119384765625E-8'), Decimal('24159191040'), Decimal('180.00000000000000000000000000')),
-    (Decimal('1.47456E-8'), Decimal('24414062500'), Decimal('180.0000000000000')),
-    (Decimal('1.46484375E-8'), Decimal('24576000000'), Decimal('180.0000000000000000')),
-    (Decimal('1.44E-8'), Decimal('25000000000'), Decimal('180.0000000000')),
-    (Decimal('1.430511474609375E-8'), Decimal('25165824000'), Decimal('180.00000000000000000000000')),
-    (Decimal('1.40625E-8'), Decimal('25600000000'), Decimal('180.0000000000000')),
-    (Decimal('1.3969838619232177734375E-8'), Decimal('25769803776'), Decimal('180.000000000000000000000000000000')),
-    (Decimal('1.373291015625E-8'), Decimal('26214400000'), Decimal('180.00000000000000000000')),
-    (Decimal('1.3411045074462890625E-8'), Decimal('26843545600'), Decimal('180.000000000000000000000000000')),
-    (Decimal('1.28E-8'), Decimal('28125000000'), Decimal('180.0000000000')),
-    (Decimal('1.25E-8'), Decimal('28800000000'), Decimal('180.0000000000')),
-    (Decimal('1.2288E-8'), Decimal('29296875000'), Decimal('180.000000000000')),
-    (Decimal('1.220703125E-8'), Decimal('29491200000'), Decimal('180.00000000000000000')),
-    (Decimal('1.2E-8'), Decimal('30000000000'), Decimal('180.000000000')),
-    (Decimal('1.1920928955078125E-8'), Decimal('30198988800'), Decimal('180.000000000000000000000000')),
-    (Decimal('1.179648E-8'), Decimal('30517578125'), Decimal('0E-14')),
-    (Decimal('1.171875E-8'), Decimal('30720000000'), Decimal('180.00000000000000')),
-    (Decimal('1.152E-8'), Decimal('31250000000'), Decimal('180.00000000000')),
-    (Decimal('1.1444091796875E-8'), Decimal('31457280000'), Decimal('180.000000000000000000000')),
-    (Decimal('1.125E-8'), Decimal('32000000000'), Decimal('180.00000000000')),
-    (Decimal('1.11758708953857421875E-8'), Decimal('32212254720'), Decimal('180.0000000000000000000000000000')),
-    (Decimal('1.0986328125E-8'), Decimal('32768000000'), Decimal('180.000000000000000000')),
-    (Decimal('1.07288360595703125E-8'), Decimal('33554432000'), Decimal('180.0000000000000000000000000')),
-    (Decimal('1.047737896442413330078125E-8'), Decimal('34359738368'), Decimal('180.00000000000000000000000000000000')),
-    (Decimal('1.024E-8'), Decimal('35156250000'), Decimal('180.00000000000')),
-    (Decimal('1E-8'), Decimal('36000000000'), Decimal('180.00000000')),
-    (Decimal('9.8304E-9'), Decimal('36621093750'), Decimal('180.0000000000000')),
-    (Decimal('9.765625E-9'), Decimal('36864000000'), Decimal('180.000000000000000')),
-    (Decimal('9.6E-9'), Decimal('37500000000'), Decimal('180.0000000000')),
-    (Decimal('9.5367431640625E-9'), Decimal('37748736000'), Decimal('180.0000000000000000000000')),
-    (Decimal('9.375E-9'), Decimal('38400000000'), Decimal('180.000000000000')),
-    (Decimal('9.31322574615478515625E-9'), Decimal('38654705664'), Decimal('180.00000000000000000000000000000')),
-    (Decimal('9.216E-9'), Decimal('39062500000'), Decimal('180.000000000000')),
-    (Decimal('9.1552734375E-9'), Decimal('39321600000'), Decimal('180.0000000000000000000')),
-    (Decimal('9E-9'), Decimal('40000000000'), Decimal('180.000000000')),
-    (Decimal('8.94069671630859375E-9'), Decimal('40265318400'), Decimal('180.00000000000000000000000000')),
-    (Decimal('8.7890625E-9'), Decimal('40960000000'), Decimal('180.0000000000000000')),
-    (Decimal('8.58306884765625E-9'), Decimal('41943040000'), Decimal('180.00000000000000000000000')),
-    (Decimal('8.381903171539306640625E-9'), Decimal('42949672960'), Decimal('180.000000000000000000000000000000')),
-    (Decimal('8.192E-9'), Decimal('43945312500'), Decimal('180.000000000000')),
-    (Decimal('8E-9'), Decimal('45000000000'), Decimal('180.000000000')),
-    (Decimal('7.8125E-9'), Decimal('46080000000'), Decimal('180.0000000000000')),
-    (Decimal('7.68E-9'), Decimal('46875000000'), Decimal('180.00000000000')),
-    (Decimal('7.62939453125E-9'), Decimal('47185920000'), Decimal('180.00000000000000000000')),
-    (Decimal('7.5E-9'), Decimal('48000000000'), Decimal('180.0000000000')),
-    (Decimal('7.450580596923828125E-9'), Decimal('48318382080'), Decimal('180.000000000000000000000000000')),
-    (Decimal('7.3728E-9'), Decimal('48828125000'), Decimal('180.0000000000000')),
-    (Decimal('7.32421875E-9'), Decimal('49152000000'), Decimal('180.00000000000000000')),
-    (Decimal('7.2E-9'), Decimal('50000000000'), Decimal('180.0000000000')),
-    (Decimal('7.152557373046875E-9'), Decimal('50331648000'), Decimal('180.000000000000000000000000')),
-    (Decimal('7.03125E-9'), Decimal('51200000000'), Decimal('180.00000000000000')),
-    (Decimal('6.9849193096160888671875E-9'), Decimal('51539607552'), Decimal('180.0000000000000000000000000000000')),
-    (Decimal('6.866455078125E-9'), Decimal('52428800000'), Decimal('180.000000000000000000000')),
-    (Decimal('6.7055225372314453125E-9'), Decimal('53687091200'), Decimal('180.0000000000000000000000000000')),
-    (Decimal('6.5536E-9'), Decimal('54931640625'), Decimal('0E-13')),
-    (Decimal('6.4E-9'), Decimal('56250000000'), Decimal('180.0000000000')),
-    (Decimal('6.25E-9'), Decimal('57600000000'), Decimal('180.00000000000')),
-    (Decimal('6.144E-9'), Decimal('58593750000'), Decimal('180.000000000000')),
-    (Decimal('6.103515625E-9'), Decimal('58982400000'), Decimal('180.000000000000000000')),
-    (Decimal('6E-9'), Decimal('60000000000'), Decimal('180.000000000')),
-    (Decimal('5.9604644775390625E-9'), Decimal('60397977600'), Decimal('180.0000000000000000000000000')),
-    (Decimal('5.89824E-9'), Decimal('61035156250'), Decimal('180.00000000000000')),
-    (Decimal('5.859375E-9'), Decimal('61440000000'), Decimal('180.000000000000000')),
-    (Decimal('5.76E-9'), Decimal('62500000000'), Decimal('180.00000000000')),
-    (Decimal('5.7220458984375E-9'), Decimal('62914560000'), Decimal('180.0000000000000000000000')),
-    (Decimal('5.625E-9'), Decimal('64000000000'), Decimal('180.000000000000')),
-    (Decimal('5.58793544769287109375E-9'), Decimal('64424509440'), Decimal('180.00000000000000000000000000000')),
-    (Decimal('5.4931640625E-9'), Decimal('65536000000'), Decimal('180.0000000000000000000')),
-    (Decimal('5.36441802978515625E-9'), Decimal('67108864000'), Decimal('180.00000000000000000000000000')),
-    (Decimal('5.238689482212066650390625E-9'), Decimal('68719476736'), Decimal('180.000000000000000000000000000000000')),
-    (Decimal('5.12E-9'), Decimal('70312500000'), Decimal('180.00000000000')),
-    (Decimal('5E-9'), Decimal('72000000000'), Decimal('180.000000000')),
-    (Decimal('4.9152E-9'), Decimal('73242187500'), Decimal('180.0000000000000')),
-    (Decimal('4.8828125E-9'), Decimal('73728000000'), Decimal('180.0000000000000000')),
-    (Decimal('4.8E-9'), Decimal('75000000000'), Decimal('180.0000000000')),
-    (Decimal('4.76837158203125E-9'), Decimal('75497472000'), Decimal('180.00000000000000000000000')),
-    (Decimal('4.6875E-9'), Decimal('76800000000'), Decimal('180.0000000000000')),
-    (Decimal('4.656612873077392578125E-9'), Decimal('77309411328'), Decimal('180.000000000000000000000000000000')),
-    (Decimal('4.608E-9'), Decimal('78125000000'), Decimal('180.000000000000')),
-    (Decimal('4.57763671875E-9'), Decimal('78643200000'), Decimal('180.00000000000000000000')),
-    (Decimal('4.5E-9'), Decimal('80000000000'), Decimal('180.0000000000')),
-    (Decimal('4.470348358154296875E-9'), Decimal('80530636800'), Decimal('180.000000000000000000000000000')),
-    (Decimal('4.39453125E-9'), Decimal('81920000000'), Decimal('180.00000000000000000')),
-    (Decimal('4.291534423828125E-9'), Decimal('83886080000'), Decimal('180.000000000000000000000000')),
-    (Decimal('4.1909515857696533203125E-9'), Decimal('85899345920'), Decimal('180.0000000000000000000000000000000')),
-    (Decimal('4.096E-9'), Decimal('87890625000'), Decimal('180.000000000000')),
-    (Decimal('4E-9'), Decimal('90000000000'), Decimal('180.000000000')),
-    (Decimal('3.93216E-9'), Decimal('91552734375'), Decimal('0E-14')),
-    (Decimal('3.90625E-9'), Decimal('92160000000'), Decimal('180.00000000000000')),
-    (Decimal('3.84E-9'), Decimal('93750000000'), Decimal('180.00000000000')),
-    (Decimal('3.814697265625E-9'), Decimal('94371840000'), Decimal('180.000000000000000000000')),
-    (Decimal('3.75E-9'), Decimal('96000000000'), Decimal('180.00000000000')),
-    (Decimal('3.7252902984619140625E-9'), Decimal('96636764160'), Decimal('180.0000000000000000000000000000')),
-    (Decimal('3.6864E-9'), Decimal('97656250000'), Decimal('180.0000000000000')),
-    (Decimal('3.662109375E-9'), Decimal('98304000000'), Decimal('180.000000000000000000')),
-    (Decimal('3.6E-9'), Decimal('100000000000'), Decimal('180.0000000000')),
-    (Decimal('3.5762786865234375E-9'), Decimal('100663296000'), Decimal('180.0000000000000000000000000')),
-    (Decimal('3.515625E-9'), Decimal('102400000000'), Decimal('180.000000000000000')),
-    (Decimal('3.49245965480804443359375E-9'), Decimal('103079215104'), Decimal('180.00000000000000000000000000000000')),
-    (Decimal('3.4332275390625E-9'), Decimal('104857600000'), Decimal('180.0000000000000000000000')),
-    (Decimal('3.35276126861572265625E-9'), Decimal('107374182400'), Decimal('180.00000000000000000000000000000')),
-    (Decimal('3.2768E-9'), Decimal('109863281250'), Decimal('180.0000000000000')),
-    (Decimal('3.2E-9'), Decimal('112500000000'), Decimal('180.0000000000')),
-    (Decimal('3.125E-9'), Decimal('115200000000'), Decimal('180.000000000000')),
-    (Decimal('3.072E-9'), Decimal('117187500000'), Decimal('180.000000000000')),
-    (Decimal('3.0517578125E-9'), Decimal('117964800000'), Decimal('180.0000000000000000000')),
-    (Decimal('3E-9'), Decimal('120000000000'), Decimal('180.000000000')),
-    (Decimal('2.98023223876953125E-9'), Decimal('120795955200'), Decimal('180.00000000000000000000000000')),
-    (Decimal('2.94912E-9'), Decimal('122070312500'), Decimal('180.00000000000000')),
-    (Decimal('2.9296875E-9'), Decimal('122880000000'), Decimal('180.0000000000000000')),
-    (Decimal('2.88E-9'), Decimal('125000000000'), Decimal('180.00000000000')),
-    (Decimal('2.86102294921875E-9'), Decimal('125829120000'), Decimal('180.00000000000000000000000')),
-    (Decimal('2.8125E-9'), Decimal('128000000000'), Decimal('180.0000000000000')),
-    (Decimal('2.793967723846435546875E-9'), Decimal('128849018880'), Decimal('180.000000000000000000000000000000')),
-    (Decimal('2.74658203125E-9'), Decimal('131072000000'), Decimal('180.00000000000000000000')),
-    (Decimal('2.682209014892578125E-9'), Decimal('134217728000'), Decimal('180.000000000000000000000000000')),
-    (Decimal('2.6193447411060333251953125E-9'), Decimal('137438953472'), Decimal('180.0000000000000000000000000000000000')),
-    (Decimal('2.56E-9'), Decimal('140625000000'), Decimal('180.00000000000')),
-    (Decimal('2.5E-9'), Decimal('144000000000'), Decimal('180.0000000000')),
-    (Decimal('2.4576E-9'), Decimal('146484375000'), Decimal('180.0000000000000')),
-    (Decimal('2.44140625E-9'), Decimal('147456000000'), Decimal('180.00000000000000000')),
-    (Decimal('2.4E-9'), Decimal('150000000000'), Decimal('180.0000000000')),
-    (Decimal('2.384185791015625E-9'), Decimal('150994944000'), Decimal('180.000000000000000000000000')),
-    (Decimal('2.359296E-9'), Decimal('152587890625'), Decimal('0E-15')),
-    (Decimal('2.34375E-9'), Decimal('153600000000'), Decimal('180.00000000000000')),
-    (Decimal('2.3283064365386962890625E-9'), Decimal('154618822656'), Decimal('180.0000000000000000000000000000000')),
-    (Decimal('2.304E-9'), Decimal('156250000000'), Decimal('180.000000000000')),
-    (Decimal('2.288818359375E-9'), Decimal('157286400000'), Decimal('180.000000000000000000000')),
-    (Decimal('2.25E-9'), Decimal('160000000000'), Decimal('180.00000000000')),
-    (Decimal('2.2351741790771484375E-9'), Decimal('161061273600'), Decimal('180.0000000000000000000000000000')),
-    (Decimal('2.197265625E-9'), Decimal('163840000000'), Decimal('180.000000000000000000')),
-    (Decimal('2.1457672119140625E-9'), Decimal('167772160000'), Decimal('180.0000000000000000000000000')),
-    (Decimal('2.09547579288482666015625E-9'), Decimal('171798691840'), Decimal('180.00000000000000000000000000000000')),
-    (Decimal('2.048E-9'), Decimal('175781250000'), Decimal('180.000000000000')),
-    (Decimal('2E-9'), Decimal('180000000000'), Decimal('180.000000000')),
-    (Decimal('1.96608E-9'), Decimal('183105468750'), Decimal('180.00000000000000')),
-    (Decimal('1.953125E-9'), Decimal('184320000000'), Decimal('180.000000000000000')),
-    (Decimal('1.92E-9'), Decimal('187500000000'), Decimal('180.00000000000')),
-    (Decimal('1.9073486328125E-9'), Decimal('188743680000'), Decimal('180.0000000000000000000000')),
-    (Decimal('1.875E-9'), Decimal('192000000000'), Decimal('180.000000000000')),
-    (Decimal('1.86264514923095703125E-9'), Decimal('193273528320'), Decimal('180.00000000000000000000000000000')),
-    (Decimal('1.8432E-9'), Decimal('195312500000'), Decimal('180.0000000000000')),
-    (Decimal('1.8310546875E-9'), Decimal('196608000000'), Decimal('180.0000000000000000000')),
-    (Decimal('1.8E-9'), Decimal('200000000000'), Decimal('180.0000000000')),
-    (Decimal('1.78813934326171875E-9'), Decimal('201326592000'), Decimal('180.00000000000000000000000000')),
-    (Decimal('1.7578125E-9'), Decimal('204800000000'), Decimal('180.0000000000000000')),
-    (Decimal('1.746229827404022216796875E-9'), Decimal('206158430208'), Decimal('180.000000000000000000000000000000000')),
-    (Decimal('1.71661376953125E-9'), Decimal('209715200000'), Decimal('180.00000000000000000000000')),
-    (Decimal('1.676380634307861328125E-9'), Decimal('214748364800'), Decimal('180.000000000000000000000000000000')),
-    (Decimal('1.6384E-9'), Decimal('219726562500'), Decimal('180.0000000000000')),
-    (Decimal('1.6E-9'), Decimal('225000000000'), Decimal('180.0000000000')),
-    (Decimal('1.5625E-9'), Decimal('230400000000'), Decimal('180.0000000000000')),
-    (Decimal('1.536E-9'), Decimal('234375000000'), Decimal('180.000000000000')),
-    (Decimal('1.52587890625E-9'), Decimal('235929600000'), Decimal('180.00000000000000000000')),
-    (Decimal('1.5E-9'), Decimal('240000000000'), Decimal('180.0000000000')),
-    (Decimal('1.490116119384765625E-9'), Decimal('241591910400'), Decimal('180.000000000000000000000000000')),
-    (Decimal('1.47456E-9'), Decimal('244140625000'), Decimal('180.00000000000000')),
-    (Decimal('1.46484375E-9'), Decimal('245760000000'), Decimal('180.00000000000000000')),
-    (Decimal('1.44E-9'), Decimal('250000000000'), Decimal('180.00000000000')),
-    (Decimal('1.430511474609375E-9'), Decimal('251658240000'), Decimal('180.000000000000000000000000')),
-    (Decimal('1.40625E-9'), Decimal('256000000000'), Decimal('180.00000000000000')),
-    (Decimal('1.3969838619232177734375E-9'), Decimal('257698037760'), Decimal('180.0000000000000000000000000000000')),
-    (Decimal('1.373291015625E-9'), Decimal('262144000000'), Decimal('180.000000000000000000000')),
-    (Decimal('1.3411045074462890625E-9'), Decimal('268435456000'), Decimal('180.0000000000000000000000000000')),
-    (Decimal('1.31072E-9'), Decimal('274658203125'), Decimal('0E-14')),
-    (Decimal('1.30967237055301666259765625E-9'), Decimal('274877906944'), Decimal('180.00000000000000000000000000000000000')),
-    (Decimal('1.28E-9'), Decimal('281250000000'), Decimal('180.00000000000')),
-    (Decimal('1.25E-9'), Decimal('288000000000'), Decimal('180.00000000000')),
-    (Decimal('1.2288E-9'), Decimal('292968750000'), Decimal('180.0000000000000')),
-    (Decimal('1.220703125E-9'), Decimal('294912000000'), Decimal('180.000000000000000000')),
-    (Decimal('1.2E-9'), Decimal('300000000000'), Decimal('180.0000000000')),
-    (Decimal('1.1920928955078125E-9'), Decimal('301989888000'), Decimal('180.0000000000000000000000000')),
-    (Decimal('1.179648E-9'), Decimal('305175781250'), Decimal('180.000000000000000')),
-    (Decimal('1.171875E-9'), Decimal('307200000000'), Decimal('180.000000000000000')),
-    (Decimal('1.16415321826934814453125E-9'), Decimal('309237645312'), Decimal('180.00000000000000000000000000000000')),
-    (Decimal('1.152E-9'), Decimal('312500000000'), Decimal('180.000000000000')),
-    (Decimal('1.1444091796875E-9'), Decimal('314572800000'), Decimal('180.0000000000000000000000')),
-    (Decimal('1.125E-9'), Decimal('320000000000'), Decimal('180.000000000000')),
-    (Decimal('1.11758708953857421875E-9'), Decimal('322122547200'), Decimal('180.00000000000000000000000000000')),
-    (Decimal('1.0986328125E-9'), Decimal('327680000000'), Decimal('180.0000000000000000000')),
-    (Decimal('1.07288360595703125E-9'), Decimal('335544320000'), Decimal('180.00000000000000000000000000')),
-    (Decimal('1.047737896442413330078125E-9'), Decimal('343597383680'), Decimal('180.000000000000000000000000000000000')),
-    (Decimal('1.024E-9'), Decimal('351562500000'), Decimal('180.000000000000')),
-    (Decimal('1E-9'), Decimal('360000000000'), Decimal('180.000000000')),
-    (Decimal('9.8304E-10'), Decimal('366210937500'), Decimal('180.00000000000000')),
-    (Decimal('9.765625E-10'), Decimal('368640000000'), Decimal('180.0000000000000000')),
-    (Decimal('9.6E-10'), Decimal('375000000000'), Decimal('180.00000000000')),
-    (Decimal('9.5367431640625E-10'), Decimal('377487360000'), Decimal('180.00000000000000000000000')),
-    (Decimal('9.375E-10'), Decimal('384000000000'), Decimal('180.0000000000000')),
-    (Decimal('9.31322574615478515625E-10'), Decimal('386547056640'), Decimal('180.000000000000000000000000000000')),
-    (Decimal('9.216E-10'), Decimal('390625000000'), Decimal('180.0000000000000')),
-    (Decimal('9.1552734375E-10'), Decimal('393216000000'), Decimal('180.00000000000000000000')),
-    (Decimal('9E-10'), Decimal('400000000000'), Decimal('180.0000000000')),
-    (Decimal('8.94069671630859375E-10'), Decimal('402653184000'), Decimal('180.000000000000000000000000000')),
-    (Decimal('8.7890625E-10'), Decimal('409600000000'), Decimal('180.00000000000000000')),
-    (Decimal('8.731149137020111083984375E-10'), Decimal('412316860416'), Decimal('180.0000000000000000000000000000000000')),
-    (Decimal('8.58306884765625E-10'), Decimal('419430400000'), Decimal('180.000000000000000000000000')),
-    (Decimal('8.381903171539306640625E-10'), Decimal('429496729600'), Decimal('180.0000000000000000000000000000000')),
-    (Decimal('8.192E-10'), Decimal('439453125000'), Decimal('180.0000000000000')),
-    (Decimal('8E-10'), Decimal('450000000000'), Decimal('180.0000000000')),
-    (Decimal('7.86432E-10'), Decimal('457763671875'), Decimal('0E-15')),
-    (Decimal('7.8125E-10'), Decimal('460800000000'), Decimal('180.00000000000000')),
-    (Decimal('7.68E-10'), Decimal('468750000000'), Decimal('180.000000000000')),
-    (Decimal('7.62939453125E-10'), Decimal('471859200000'), Decimal('180.000000000000000000000')),
-    (Decimal('7.5E-10'), Decimal('480000000000'), Decimal('180.00000000000')),
-    (Decimal('7.450580596923828125E-10'), Decimal('483183820800'), Decimal('180.0000000000000000000000000000')),
-    (Decimal('7.3728E-10'), Decimal('488281250000'), Decimal('180.00000000000000')),
-    (Decimal('7.32421875E-10'), Decimal('491520000000'), Decimal('180.000000000000000000')),
-    (Decimal('7.2E-10'), Decimal('500000000000'), Decimal('180.00000000000')),
-    (Decimal('7.152557373046875E-10'), Decimal('503316480000'), Decimal('180.0000000000000000000000000')),
-    (Decimal('7.03125E-10'), Decimal('512000000000'), Decimal('180.000000000000000')),
-    (Decimal('6.9849193096160888671875E-10'), Decimal('515396075520'), Decimal('180.00000000000000000000000000000000')),
-    (Decimal('6.866455078125E-10'), Decimal('524288000000'), Decimal('180.0000000000000000000000')),
-    (Decimal('6.7055225372314453125E-10'), Decimal('536870912000'), Decimal('180.00000000000000000000000000000')),
-    (Decimal('6.5536E-10'), Decimal('549316406250'), Decimal('180.00000000000000')),
-    (Decimal('6.54836185276508331298828125E-10'), Decimal('549755813888'), Decimal('180.000000000000000000000000000000000000')),
-    (Decimal('6.4E-10'), Decimal('562500000000'), Decimal('180.00000000000')),
-    (Decimal('6.25E-10'), Decimal('576000000000'), Decimal('180.000000000000')),
-    (Decimal('6.144E-10'), Decimal('585937500000'), Decimal('180.0000000000000')),
-    (Decimal('6.103515625E-10'), Decimal('589824000000'), Decimal('180.0000000000000000000')),
-    (Decimal('6E-10'), Decimal('600000000000'), Decimal('180.0000000000')),
-    (Decimal('5.9604644775390625E-10'), Decimal('603979776000'), Decimal('180.00000000000000000000000000')),
-    (Decimal('5.89824E-10'), Decimal('610351562500'), Decimal('180.000000000000000')),
-    (Decimal('5.859375E-10'), Decimal('614400000000'), Decimal('180.0000000000000000')),
-    (Decimal('5.82076609134674072265625E-10'), Decimal('618475290624'), Decimal('180.000000000000000000000000000000000')),
-    (Decimal('5.76E-10'), Decimal('625000000000'), Decimal('180.000000000000')),
-    (Decimal('5.7220458984375E-10'), Decimal('629145600000'), Decimal('180.00000000000000000000000')),
-    (Decimal('5.625E-10'), Decimal('640000000000'), Decimal('180.0000000000000')),
-    (Decimal('5.58793544769287109375E-10'), Decimal('644245094400'), Decimal('180.000000000000000000000000000000')),
-    (Decimal('5.4931640625E-10'), Decimal('655360000000'), Decimal('180.00000000000000000000')),
-    (Decimal('5.36441802978515625E-10'), Decimal('671088640000'), Decimal('180.000000000000000000000000000')),
-    (Decimal('5.238689482212066650390625E-10'), Decimal('687194767360'), Decimal('180.0000000000000000000000000000000000')),
-    (Decimal('5.12E-10'), Decimal('703125000000'), Decimal('180.000000000000')),
-    (Decimal('5E-10'), Decimal('720000000000'), Decimal('180.0000000000')),
-    (Decimal('4.9152E-10'), Decimal('732421875000'), Decimal('180.00000000000000')),
-    (Decimal('4.8828125E-10'), Decimal('737280000000'), Decimal('180.00000000000000000')),
-    (Decimal('4.8E-10'), Decimal('750000000000'), Decimal('180.00000000000')),
-    (Decimal('4.76837158203125E-10'), Decimal('754974720000'), Decimal('180.000000000000000000000000')),
-    (Decimal('4.718592E-10'), Decimal('762939453125'), Decimal('0E-16')),
-    (Decimal('4.6875E-10'), Decimal('768000000000'), Decimal('180.00000000000000')),
-    (Decimal('4.656612873077392578125E-10'), Decimal('773094113280'), Decimal('180.0000000000000000000000000000000')),
-    (Decimal('4.608E-10'), Decimal('781250000000'), Decimal('180.0000000000000')),
-    (Decimal('4.57763671875E-10'), Decimal('786432000000'), Decimal('180.000000000000000000000')),
-    (Decimal('4.5E-10'), Decimal('800000000000'), Decimal('180.00000000000')),
-    (Decimal('4.470348358154296875E-10'), Decimal('805306368000'), Decimal('180.0000000000000000000000000000')),
-    (Decimal('4.39453125E-10'), Decimal('819200000000'), Decimal('180.000000000000000000')),
-    (Decimal('4.3655745685100555419921875E-10'), Decimal('824633720832'), Decimal('180.00000000000000000000000000000000000')),
-    (Decimal('4.291534423828125E-10'), Decimal('838860800000'), Decimal('180.0000000000000000000000000')),
-    (Decimal('4.1909515857696533203125E-10'), Decimal('858993459200'), Decimal('180.00000000000000000000000000000000')),
-    (Decimal('4.096E-10'), Decimal('878906250000'), Decimal('180.0000000000000')),
-    (Decimal('4E-10'), Decimal('900000000000'), Decimal('180.0000000000')),
-    (Decimal('3.93216E-10'), Decimal('915527343750'), Decimal('180.000000000000000')),
-    (Decimal('3.90625E-10'), Decimal('921600000000'), Decimal('180.000000000000000')),
-    (Decimal('3.84E-10'), Decimal('937500000000'), Decimal('180.000000000000')),
-    (Decimal('3.814697265625E-10'), Decimal('943718400000'), Decimal('180.0000000000000000000000')),
-    (Decimal('3.75E-10'), Decimal('960000000000'), Decimal('180.000000000000')),
-    (Decimal('3.7252902984619140625E-10'), Decimal('966367641600'), Decimal('180.00000000000000000000000000000')),
-    (Decimal('3.6864E-10'), Decimal('976562500000'), Decimal('180.00000000000000')),
-    (Decimal('3.662109375E-10'), Decimal('983040000000'), Decimal('180.0000000000000000000')),
-    (Decimal('3.6E-10'), Decimal('1000000000000'), Decimal('180.00000000000')),
-    (Decimal('3.5762786865234375E-10'), Decimal('1006632960000'), Decimal('180.00000000000000000000000000')),
-    (Decimal('3.515625E-10'), Decimal('1024000000000'), Decimal('180.0000000000000000')),
-    (Decimal('3.49245965480804443359375E-10'), Decimal('1030792151040'), Decimal('180.000000000000000000000000000000000')),
-    (Decimal('3.4332275390625E-10'), Decimal('1048576000000'), Decimal('180.00000000000000000000000')),
-    (Decimal('3.35276126861572265625E-10'), Decimal('1073741824000'), Decimal('180.000000000000000000000000000000')),
-    (Decimal('3.2768E-10'), Decimal('1098632812500'), Decimal('180.00000000000000')),
-    (Decimal('3.274180926382541656494140625E-10'), Decimal('1099511627776'), Decimal('180.0000000000000000000000000000000000000')),
-    (Decimal('3.2E-10'), Decimal('1125000000000'), Decimal('180.00000000000')),
-    (Decimal('3.125E-10'), Decimal('1152000000000'), Decimal('180.0000000000000')),
-    (Decimal('3.072E-10'), Decimal('1171875000000'), Decimal('180.0000000000000')),
-    (Decimal('3.0517578125E-10'), Decimal('1179648000000'), Decimal('180.00000000000000000000')),
-    (Decimal('3E-10'), Decimal('1200000000000'), Decimal('180.0000000000')),
-    (Decimal('2.98023223876953125E-10'), Decimal('1207959552000'), Decimal('180.000000000000000000000000000')),
-    (Decimal('2.94912E-10'), Decimal('1220703125000'), Decimal('180.000000000000000')),
-    (Decimal('2.9296875E-10'), Decimal('1228800000000'), Decimal('180.00000000000000000')),
-    (Decimal('2.910383045673370361328125E-10'), Decimal('1236950581248'), Decimal('180.0000000000000000000000000000000000')),
-    (Decimal('2.88E-10'), Decimal('1250000000000'), Decimal('180.000000000000')),
-    (Decimal('2.86102294921875E-10'), Decimal('1258291200000'), Decimal('180.000000000000000000000000')),
-    (Decimal('2.8125E-10'), Decimal('1280000000000'), Decimal('180.00000000000000')),
-    (Decimal('2.793967723846435546875E-10'), Decimal('1288490188800'), Decimal('180.0000000000000000000000000000000')),
-    (Decimal('2.74658203125E-10'), Decimal('1310720000000'), Decimal('180.000000000000000000000')),
-    (Decimal('2.682209014892578125E-10'), Decimal('1342177280000'), Decimal('180.0000000000000000000000000000')),
-    (Decimal('2.62144E-10'), Decimal('1373291015625'), Decimal('0E-15')),
-    (Decimal('2.6193447411060333251953125E-10'), Decimal('1374389534720'), Decimal('180.00000000000000000000000000000000000')),
-    (Decimal('2.56E-10'), Decimal('1406250000000'), Decimal('180.000000000000')),
-    (Decimal('2.5E-10'), Decimal('1440000000000'), Decimal('180.00000000000')),
-    (Decimal('2.4576E-10'), Decimal('1464843750000'), Decimal('180.00000000000000')),
-    (Decimal('2.44140625E-10'), Decimal('1474560000000'), Decimal('180.000000000000000000')),
-    (Decimal('2.4E-10'), Decimal('1500000000000'), Decimal('180.00000000000')),
-    (Decimal('2.384185791015625E-10'), Decimal('1509949440000'), Decimal('180.0000000000000000000000000')),
-    (Decimal('2.359296E-10'), Decimal('1525878906250'), Decimal('180.0000000000000000')),
-    (Decimal('2.34375E-10'), Decimal('1536000000000'), Decimal('180.000000000000000')),
-    (Decimal('2.3283064365386962890625E-10'), Decimal('1546188226560'), Decimal('180.00000000000000000000000000000000')),
-    (Decimal('2.304E-10'), Decimal('1562500000000'), Decimal('180.0000000000000')),
-    (Decimal('2.288818359375E-10'), Decimal('1572864000000'), Decimal('180.0000000000000000000000')),
-    (Decimal('2.25E-10'), Decimal('1600000000000'), Decimal('180.000000000000')),
-    (Decimal('2.2351741790771484375E-10'), Decimal('1610612736000'), Decimal('180.00000000000000000000000000000')),
-    (Decimal('2.197265625E-10'), Decimal('1638400000000'), Decimal('180.0000000000000000000')),
-    (Decimal('2.18278728425502777099609375E-10'), Decimal('1649267441664'), Decimal('180.000000000000000000000000000000000000')),
-    (Decimal('2.1457672119140625E-10'), Decimal('1677721600000'), Decimal('180.00000000000000000000000000')),
-    (Decimal('2.09547579288482666015625E-10'), Decimal('1717986918400'), Decimal('180.000000000000000000000000000000000')),
-    (Decimal('2.048E-10'), Decimal('1757812500000'), Decimal('180.0000000000000')),
-    (Decimal('2E-10'), Decimal('1800000000000'), Decimal('180.0000000000')),
-    (Decimal('1.96608E-10'), Decimal('1831054687500'), Decimal('180.000000000000000')),
-    (Decimal('1.953125E-10'), Decimal('1843200000000'), Decimal('180.0000000000000000')),
-    (Decimal('1.92E-10'), Decimal('1875000000000'), Decimal('180.000000000000')),
-    (Decimal('1.9073486328125E-10'), Decimal('1887436800000'), Decimal('180.00000000000000000000000')),
-    (Decimal('1.875E-10'), Decimal('1920000000000'), Decimal('180.0000000000000')),
-    (Decimal('1.86264514923095703125E-10'), Decimal('1932735283200'), Decimal('180.000000000000000000000000000000')),
-    (Decimal('1.8432E-10'), Decimal('1953125000000'), Decimal('180.00000000000000')),
-    (Decimal('1.8310546875E-10'), Decimal('1966080000000'), Decimal('180.00000000000000000000')),
-    (Decimal('1.8E-10'), Decimal('2000000000000'), Decimal('180.00000000000')),
-    (Decimal('1.78813934326171875E-10'), Decimal('2013265920000'), Decimal('180.000000000000000000000000000')),
-    (Decimal('1.7578125E-10'), Decimal('2048000000000'), Decimal('180.00000000000000000')),
-    (Decimal('1.746229827404022216796875E-10'), Decimal('2061584302080'), Decimal('180.0000000000000000000000000000000000')),
-    (Decimal('1.71661376953125E-10'), Decimal('2097152000000'), Decimal('180.000000000000000000000000')),
-    (Decimal('1.676380634307861328125E-10'), Decimal('2147483648000'), Decimal('180.0000000000000000000000000000000')),
-    (Decimal('1.6384E-10'), Decimal('2197265625000'), Decimal('180.00000000000000')),
-    (Decimal('1.6370904631912708282470703125E-10'), Decimal('2199023255552'), Decimal('180.00000000000000000000000000000000000000')),
-    (Decimal('1.6E-10'), Decimal('2250000000000'), Decimal('180.00000000000')),
-    (Decimal('1.572864E-10'), Decimal('2288818359375'), Decimal('0E-16')),
-    (Decimal('1.5625E-10'), Decimal('2304000000000'), Decimal('180.00000000000000')),
-    (Decimal('1.536E-10'), Decimal('2343750000000'), Decimal('180.0000000000000')),
-    (Decimal('1.52587890625E-10'), Decimal('2359296000000'), Decimal('180.000000000000000000000')),
-    (Decimal('1.5E-10'), Decimal('2400000000000'), Decimal('180.00000000000')),
-    (Decimal('1.490116119384765625E-10'), Decimal('2415919104000'), Decimal('180.0000000000000000000000000000')),
-    (Decimal('1.47456E-10'), Decimal('2441406250000'), Decimal('180.000000000000000')),
-    (Decimal('1.46484375E-10'), Decimal('2457600000000'), Decimal('180.000000000000000000')),
-    (Decimal('1.4551915228366851806640625E-10'), Decimal('2473901162496'), Decimal('180.00000000000000000000000000000000000')),
-    (Decimal('1.44E-10'), Decimal('2500000000000'), Decimal('180.000000000000')),
-    (Decimal('1.430511474609375E-10'), Decimal('2516582400000'), Decimal('180.0000000000000000000000000')),
-    (Decimal('1.40625E-10'), Decimal('2560000000000'), Decimal('180.000000000000000')),
-    (Decimal('1.3969838619232177734375E-10'), Decimal('2576980377600'), Decimal('180.00000000000000000000000000000000')),
-    (Decimal('1.373291015625E-10'), Decimal('2621440000000'), Decimal('180.0000000000000000000000')),
-    (Decimal('1.3411045074462890625E-10'), Decimal('2684354560000'), Decimal('180.00000000000000000000000000000')),
-    (Decimal('1.31072E-10'), Decimal('2746582031250'), Decimal('180.000000000000000')),
-    (Decimal('1.30967237055301666259765625E-10'), Decimal('2748779069440'), Decimal('180.000000000000000000000000000000000000')),
-    (Decimal('1.28E-10'), Decimal('2812500000000'), Decimal('180.000000000000')),
-    (Decimal('1.25E-10'), Decimal('2880000000000'), Decimal('180.000000000000')),
-    (Decimal('1.2288E-10'), Decimal('2929687500000'), Decimal('180.00000000000000')),
-    (Decimal('1.220703125E-10'), Decimal('2949120000000'), Decimal('180.0000000000000000000')),
-    (Decimal('1.2E-10'), Decimal('3000000000000'), Decimal('180.00000000000')),
-    (Decimal('1.1920928955078125E-10'), Decimal('3019898880000'), Decimal('180.00000000000000000000000000')),
-    (Decimal('1.179648E-10'), Decimal('3051757812500'), Decimal('180.0000000000000000')),
-    (Decimal('1.171875E-10'), Decimal('3072000000000'), Decimal('180.0000000000000000')),
-    (Decimal('1.16415321826934814453125E-10'), Decimal('3092376453120'), Decimal('180.000000000000000000000000000000000')),
-    (Decimal('1.152E-10'), Decimal('3125000000000'), Decimal('180.0000000000000')),
-    (Decimal('1.1444091796875E-10'), Decimal('3145728000000'), Decimal('180.00000000000000000000000')),
-    (Decimal('1.125E-10'), Decimal('3200000000000'), Decimal('180.0000000000000')),
-    (Decimal('1.11758708953857421875E-10'), Decimal('3221225472000'), Decimal('180.000000000000000000000000000000')),
-    (Decimal('1.0986328125E-10'), Decimal('3276800000000'), Decimal('180.00000000000000000000')),
-    (Decimal('1.091393642127513885498046875E-10'), Decimal('3298534883328'), Decimal('180.0000000000000000000000000000000000000')),
-    (Decimal('1.07288360595703125E-10'), Decimal('3355443200000'), Decimal('180.000000000000000000000000000')),
-    (Decimal('1.047737896442413330078125E-10'), Decimal('3435973836800'), Decimal('180.0000000000000000000000000000000000')),
-    (Decimal('1.024E-10'), Decimal('3515625000000'), Decimal('180.0000000000000')),
-    (Decimal('1E-10'), Decimal('3600000000000'), Decimal('180.0000000000')),
-    (Decimal('9.8304E-11'), Decimal('3662109375000'), Decimal('180.000000000000000')),
-    (Decimal('9.765625E-11'), Decimal('3686400000000'), Decimal('180.00000000000000000')),
-    (Decimal('9.6E-11'), Decimal('3750000000000'), Decimal('180.000000000000')),
-    (Decimal('9.5367431640625E-11'), Decimal('3774873600000'), Decimal('180.000000000000000000000000')),
-    (Decimal('9.437184E-11'), Decimal('3814697265625'), Decimal('0E-17')),
-    (Decimal('9.375E-11'), Decimal('3840000000000'), Decimal('180.00000000000000')),
-    (Decimal('9.31322574615478515625E-11'), Decimal('3865470566400'), Decimal('180.0000000000000000000000000000000')),
-    (Decimal('9.216E-11'), Decimal('3906250000000'), Decimal('180.00000000000000')),
-    (Decimal('9.1552734375E-11'), Decimal('3932160000000'), Decimal('180.000000000000000000000')),
-    (Decimal('9E-11'), Decimal('4000000000000'), Decimal('180.00000000000')),
-    (Decimal('8.94069671630859375E-11'), Decimal('4026531840000'), Decimal('180.0000000000000000000000000000')),
-    (Decimal('8.7890625E-11'), Decimal('4096000000000'), Decimal('180.000000000000000000')),
-    (Decimal('8.731149137020111083984375E-11'), Decimal('4123168604160'), Decimal('180.00000000000000000000000000000000000')),
-    (Decimal('8.58306884765625E-11'), Decimal('4194304000000'), Decimal('180.0000000000000000000000000')),
-    (Decimal('8.381903171539306640625E-11'), Decimal('4294967296000'), Decimal('180.00000000000000000000000000000000')),
-    (Decimal('8.192E-11'), Decimal('4394531250000'), Decimal('180.00000000000000')),
-    (Decimal('8.1854523159563541412353515625E-11'), Decimal('4398046511104'), Decimal('180.000000000000000000000000000000000000000')),
-    (Decimal('8E-11'), Decimal('4500000000000'), Decimal('180.00000000000')),
-    (Decimal('7.86432E-11'), Decimal('4577636718750'), Decimal('180.0000000000000000')),
-    (Decimal('7.8125E-11'), Decimal('4608000000000'), Decimal('180.000000000000000')),
-    (Decimal('7.68E-11'), Decimal('4687500000000'), Decimal('180.0000000000000')),
-    (Decimal('7.62939453125E-11'), Decimal('4718592000000'), Decimal('180.0000000000000000000000')),
-    (Decimal('7.5E-11'), Decimal('4800000000000'), Decimal('180.000000000000')),
-    (Decimal('7.450580596923828125E-11'), Decimal('4831838208000'), Decimal('180.00000000000000000000000000000')),
-    (Decimal('7.3728E-11'), Decimal('4882812500000'), Decimal('180.000000000000000')),
-    (Decimal('7.32421875E-11'), Decimal('4915200000000'), Decimal('180.0000000000000000000')),
-    (Decimal('7.2759576141834259033203125E-11'), Decimal('4947802324992'), Decimal('180.000000000000000000000000000000000000')),
-    (Decimal('7.2E-11'), Decimal('5000000000000'), Decimal('180.000000000000')),
-    (Decimal('7.152557373046875E-11'), Decimal('5033164800000'), Decimal('180.00000000000000000000000000')),
-    (Decimal('7.03125E-11'), Decimal('5120000000000'), Decimal('180.0000000000000000')),
-    (Decimal('6.9849193096160888671875E-11'), Decimal('5153960755200'), Decimal('180.000000000000000000000000000000000')),
-    (Decimal('6.866455078125E-11'), Decimal('5242880000000'), Decimal('180.00000000000000000000000')),
-    (Decimal('6.7055225372314453125E-11'), Decimal('5368709120000'), Decimal('180.000000000000000000000000000000')),
-    (Decimal('6.5536E-11'), Decimal('5493164062500'), Decimal('180.000000000000000')),
-    (Decimal('6.54836185276508331298828125E-11'), Decimal('5497558138880'), Decimal('180.0000000000000000000000000000000000000')),
-    (Decimal('6.4E-11'), Decimal('5625000000000'), Decimal('180.000000000000')),
-    (Decimal('6.25E-11'), Decimal('5760000000000'), Decimal('180.0000000000000')),
-    (Decimal('6.144E-11'), Decimal('5859375000000'), Decimal('180.00000000000000')),
-    (Decimal('6.103515625E-11'), Decimal('5898240000000'), Decimal('180.00000000000000000000')),
-    (Decimal('6E-11'), Decimal('6000000000000'), Decimal('180.00000000000')),
-    (Decimal('5.9604644775390625E-11'), Decimal('6039797760000'), Decimal('180.000000000000000000000000000')),
-    (Decimal('5.89824E-11'), Decimal('6103515625000'), Decimal('180.0000000000000000')),
-    (Decimal('5.859375E-11'), Decimal('6144000000000'), Decimal('180.00000000000000000')),
-    (Decimal('5.82076609134674072265625E-11'), Decimal('6184752906240'), Decimal('180.0000000000000000000000000000000000')),
-    (Decimal('5.76E-11'), Decimal('6250000000000'), Decimal('180.0000000000000')),
-    (Decimal('5.7220458984375E-11'), Decimal('6291456000000'), Decimal('180.000000000000000000000000')),
-    (Decimal('5.625E-11'), Decimal('6400000000000'), Decimal('180.00000000000000')),
-    (Decimal('5.58793544769287109375E-11'), Decimal('6442450944000'), Decimal('180.0000000000000000000000000000000')),
-    (Decimal('5.4931640625E-11'), Decimal('6553600000000'), Decimal('180.000000000000000000000')),
-    (Decimal('5.456968210637569427490234375E-11'), Decimal('6597069766656'), Decimal('180.00000000000000000000000000000000000000')),
-    (Decimal('5.36441802978515625E-11'), Decimal('6710886400000'), Decimal('180.0000000000000000000000000000')),
-    (Decimal('5.24288E-11'), Decimal('6866455078125'), Decimal('0E-16')),
-    (Decimal('5.238689482212066650390625E-11'), Decimal('6871947673600'), Decimal('180.00000000000000000000000000000000000')),
-    (Decimal('5.12E-11'), Decimal('7031250000000'), Decimal('180.0000000000000')),
-    (Decimal('5E-11'), Decimal('7200000000000'), Decimal('180.00000000000')),
-    (Decimal('4.9152E-11'), Decimal('7324218750000'), Decimal('180.000000000000000')),
-    (Decimal('4.8828125E-11'), Decimal('7372800000000'), Decimal('180.000000000000000000')),
-    (Decimal('4.8E-11'), Decimal('7500000000000'), Decimal('180.000000000000')),
-    (Decimal('4.76837158203125E-11'), Decimal('7549747200000'), Decimal('180.0000000000000000000000000')),
-    (Decimal('4.718592E-11'), Decimal('7629394531250'), Decimal('180.00000000000000000')),
-    (Decimal('4.6875E-11'), Decimal('7680000000000'), Decimal('180.000000000000000')),
-    (Decimal('4.656612873077392578125E-11'), Decimal('7730941132800'), Decimal('180.00000000000000000000000000000000')),
-    (Decimal('4.608E-11'), Decimal('7812500000000'), Decimal('180.00000000000000')),
-    (Decimal('4.57763671875E-11'), Decimal('7864320000000'), Decimal('180.0000000000000000000000')),
-    (Decimal('4.5E-11'), Decimal('8000000000000'), Decimal('180.000000000000')),
-    (Decimal('4.470348358154296875E-11'), Decimal('8053063680000'), Decimal('180.00000000000000000000000000000')),
-    (Decimal('4.39453125E-11'), Decimal('8192000000000'), Decimal('180.0000000000000000000')),
-    (Decimal('4.3655745685100555419921875E-11'), Decimal('8246337208320'), Decimal('180.000000000000000000000000000000000000')),
-    (Decimal('4.291534423828125E-11'), Decimal('8388608000000'), Decimal('180.00000000000000000000000000')),
-    (Decimal('4.1909515857696533203125E-11'), Decimal('8589934592000'), Decimal('180.000000000000000000000000000000000')),
-    (Decimal('4.096E-11'), Decimal('8789062500000'), Decimal('180.00000000000000')),
-    (Decimal('4.09272615797817707061767578125E-11'), Decimal('8796093022208'), Decimal('180.0000000000000000000000000000000000000000')),
-    (Decimal('4E-11'), Decimal('9000000000000'), Decimal('180.00000000000')),
-    (Decimal('3.93216E-11'), Decimal('9155273437500'), Decimal('180.0000000000000000')),
-    (Decimal('3.90625E-11'), Decimal('9216000000000'), Decimal('180.0000000000000000')),
-    (Decimal('3.84E-11'), Decimal('9375000000000'), Decimal('180.0000000000000')),
-    (Decimal('3.814697265625E-11'), Decimal('9437184000000'), Decimal('180.00000000000000000000000')),
-    (Decimal('3.75E-11'), Decimal('9600000000000'), Decimal('180.0000000000000')),
-    (Decimal('3.7252902984619140625E-11'), Decimal('9663676416000'), Decimal('180.000000000000000000000000000000')),
-    (Decimal('3.6864E-11'), Decimal('9765625000000'), Decimal('180.000000000000000')),
-    (Decimal('3.662109375E-11'), Decimal('9830400000000'), Decimal('180.00000000000000000000')),
-    (Decimal('3.63797880709171295166015625E-11'), Decimal('9895604649984'), Decimal('180.0000000000000000000000000000000000000')),
-    (Decimal('3.6E-11'), Decimal('10000000000000'), Decimal('180.000000000000')),
-    (Decimal('3.5762786865234375E-11'), Decimal('10066329600000'), Decimal('180.000000000000000000000000000')),
-    (Decimal('3.515625E-11'), Decimal('10240000000000'), Decimal('180.00000000000000000')),
-    (Decimal('3.49245965480804443359375E-11'), Decimal('10307921510400'), Decimal('180.0000000000000000000000000000000000')),
-    (Decimal('3.4332275390625E-11'), Decimal('10485760000000'), Decimal('180.000000000000000000000000')),
-    (Decimal('3.35276126861572265625E-11'), Decimal('10737418240000'), Decimal('180.0000000000000000000000000000000')),
-    (Decimal('3.2768E-11'), Decimal('10986328125000'), Decimal('180.000000000000000')),
-    (Decimal('3.274180926382541656494140625E-11'), Decimal('10995116277760'), Decimal('180.00000000000000000000000000000000000000')),
-    (Decimal('3.2E-11'), Decimal('11250000000000'), Decimal('180.000000000000')),
-    (Decimal('3.145728E-11'), Decimal('11444091796875'), Decimal('0E-17')),
-    (Decimal('3.125E-11'), Decimal('11520000000000'), Decimal('180.00000000000000')),
-    (Decimal('3.072E-11'), Decimal('11718750000000'), Decimal('180.00000000000000')),
-    (Decimal('3.0517578125E-11'), Decimal('11796480000000'), Decimal('180.000000000000000000000')),
-    (Decimal('3E-11'), Decimal('12000000000000'), Decimal('180.00000000000')),
-    (Decimal('2.98023223876953125E-11'), Decimal('12079595520000'), Decimal('180.0000000000000000000000000000')),
-    (Decimal('2.94912E-11'), Decimal('12207031250000'), Decimal('180.0000000000000000')),
-    (Decimal('2.9296875E-11'), Decimal('12288000000000'), Decimal('180.000000000000000000')),
-    (Decimal('2.910383045673370361328125E-11'), Decimal('12369505812480'), Decimal('180.00000000000000000000000000000000000')),
-    (Decimal('2.88E-11'), Decimal('12500000000000'), Decimal('180.0000000000000')),
-    (Decimal('2.86102294921875E-11'), Decimal('12582912000000'), Decimal('180.0000000000000000000000000')),
-    (Decimal('2.8125E-11'), Decimal('12800000000000'), Decimal('180.000000000000000')),
-    (Decimal('2.793967723846435546875E-11'), Decimal('12884901888000'), Decimal('180.00000000000000000000000000000000')),
-    (Decimal('2.74658203125E-11'), Decimal('13107200000000'), Decimal('180.0000000000000000000000')),
-    (Decimal('2.7284841053187847137451171875E-11'), Decimal('13194139533312'), Decimal('180.000000000000000000000000000000000000000')),
-    (Decimal('2.682209014892578125E-11'), Decimal('13421772800000'), Decimal('180.00000000000000000000000000000')),
-    (Decimal('2.62144E-11'), Decimal('13732910156250'), Decimal('180.0000000000000000')),
-    (Decimal('2.6193447411060333251953125E-11'), Decimal('13743895347200'), Decimal('180.000000000000000000000000000000000000')),
-    (Decimal('2.56E-11'), Decimal('14062500000000'), Decimal('180.0000000000000')),
-    (Decimal('2.5E-11'), Decimal('14400000000000'), Decimal('180.000000000000')),
-    (Decimal('2.4576E-11'), Decimal('14648437500000'), Decimal('180.000000000000000')),
-    (Decimal('2.44140625E-11'), Decimal('14745600000000'), Decimal('180.0000000000000000000')),
-    (Decimal('2.4E-11'), Decimal('15000000000000'), Decimal('180.000000000000')),
-    (Decimal('2.384185791015625E-11'), Decimal('15099494400000'), Decimal('180.00000000000000000000000000')),
-    (Decimal('2.359296E-11'), Decimal('15258789062500'), Decimal('180.00000000000000000')),
-    (Decimal('2.34375E-11'), Decimal('15360000000000'), Decimal('180.0000000000000000')),
-    (Decimal('2.3283064365386962890625E-11'), Decimal('15461882265600'), Decimal('180.000000000000000000000000000000000')),
-    (Decimal('2.304E-11'), Decimal('15625000000000'), Decimal('180.00000000000000')),
-    (Decimal('2.288818359375E-11'), Decimal('15728640000000'), Decimal('180.00000000000000000000000')),
-    (Decimal('2.25E-11'), Decimal('16000000000000'), Decimal('180.0000000000000')),
-    (Decimal('2.2351741790771484375E-11'), Decimal('16106127360000'), Decimal('180.000000000000000000000000000000')),
-    (Decimal('2.197265625E-11'), Decimal('16384000000000'), Decimal('180.00000000000000000000')),
-    (Decimal('2.18278728425502777099609375E-11'), Decimal('16492674416640'), Decimal('180.0000000000000000000000000000000000000')),
-    (Decimal('2.1457672119140625E-11'), Decimal('16777216000000'), Decimal('180.000000000000000000000000000')),
-    (Decimal('2.09547579288482666015625E-11'), Decimal('17179869184000'), Decimal('180.0000000000000000000000000000000000')),
-    (Decimal('2.048E-11'), Decimal('17578125000000'), Decimal('180.00000000000000')),
-    (Decimal('2.046363078989088535308837890625E-11'), Decimal('17592186044416'), Decimal('180.00000000000000000000000000000000000000000')),
-    (Decimal('2E-11'), Decimal('18000000000000'), Decimal('180.00000000000')),
-    (Decimal('1.96608E-11'), Decimal('18310546875000'), Decimal('180.0000000000000000')),
-    (Decimal('1.953125E-11'), Decimal('18432000000000'), Decimal('180.00000000000000000')),
-    (Decimal('1.92E-11'), Decimal('18750000000000'), Decimal('180.0000000000000')),
-    (Decimal('1.9073486328125E-11'), Decimal('18874368000000'), Decimal('180.000000000000000000000000')),
-    (Decimal('1.8874368E-11'), Decimal('19073486328125'), Decimal('0E-18')),
-    (Decimal('1.875E-11'), Decimal('19200000000000'), Decimal('180.00000000000000')),
-    (Decimal('1.86264514923095703125E-11'), Decimal('19327352832000'), Decimal('180.0000000000000000000000000000000')),
-    (Decimal('1.8432E-11'), Decimal('19531250000000'), Decimal('180.000000000000000')),
-    (Decimal('1.8310546875E-11'), Decimal('19660800000000'), Decimal('180.000000000000000000000')),
-    (Decimal('1.818989403545856475830078125E-11'), Decimal('19791209299968'), Decimal('180.00000000000000000000000000000000000000')),
-    (Decimal('1.8E-11'), Decimal('20000000000000'), Decimal('180.000000000000')),
-    (Decimal('1.78813934326171875E-11'), Decimal('20132659200000'), Decimal('180.0000000000000000000000000000')),
-    (Decimal('1.7578125E-11'), Decimal('20480000000000'), Decimal('180.000000000000000000')),
-    (Decimal('1.746229827404022216796875E-11'), Decimal('20615843020800'), Decimal('180.00000000000000000000000000000000000')),
-    (Decimal('1.71661376953125E-11'), Decimal('20971520000000'), Decimal('180.0000000000000000000000000')),
-    (Decimal('1.676380634307861328125E-11'), Decimal('21474836480000'), Decimal('180.00000000000000000000000000000000')),
-    (Decimal('1.6384E-11'), Decimal('21972656250000'), Decimal('180.000000000000000')),
-    (Decimal('1.6370904631912708282470703125E-11'), Decimal('21990232555520'), Decimal('180.000000000000000000000000000000000000000')),
-    (Decimal('1.6E-11'), Decimal('22500000000000'), Decimal('180.000000000000')),
-    (Decimal('1.572864E-11'), Decimal('22888183593750'), Decimal('180.00000000000000000')),
-    (Decimal('1.5625E-11'), Decimal('23040000000000'), Decimal('180.000000000000000')),
-    (Decimal('1.536E-11'), Decimal('23437500000000'), Decimal('180.00000000000000')),
-    (Decimal('1.52587890625E-11'), Decimal('23592960000000'), Decimal('180.0000000000000000000000')),
-    (Decimal('1.5E-11'), Decimal('24000000000000'), Decimal('180.000000000000')),
-    (Decimal('1.490116119384765625E-11'), Decimal('24159191040000'), Decimal('180.00000000000000000000000000000')),
-    (Decimal('1.47456E-11'), Decimal('24414062500000'), Decimal('180.0000000000000000')),
-    (Decimal('1.46484375E-11'), Decimal('24576000000000'), Decimal('180.0000000000000000000')),
-    (Decimal('1.4551915228366851806640625E-11'), Decimal('24739011624960'), Decimal('180.000000000000000000000000000000000000')),
-    (Decimal('1.44E-11'), Decimal('25000000000000'), Decimal('180.0000000000000')),
-    (Decimal('1.430511474609375E-11'), Decimal('25165824000000'), Decimal('180.00000000000000000000000000')),
-    (Decimal('1.40625E-11'), Decimal('25600000000000'), Decimal('180.0000000000000000')),
-    (Decimal('1.3969838619232177734375E-11'), Decimal('25769803776000'), Decimal('180.000000000000000000000000000000000')),
-    (Decimal('1.373291015625E-11'), Decimal('26214400000000'), Decimal('180.00000000000000000000000')),
-    (Decimal('1.36424205265939235687255859375E-11'), Decimal('26388279066624'), Decimal('180.0000000000000000000000000000000000000000')),
-    (Decimal('1.3411045074462890625E-11'), Decimal('26843545600000'), Decimal('180.000000000000000000000000000000')),
-    (Decimal('1.31072E-11'), Decimal('27465820312500'), Decimal('180.0000000000000000')),
-    (Decimal('1.30967237055301666259765625E-11'), Decimal('27487790694400'), Decimal('180.0000000000000000000000000000000000000')),
-    (Decimal('1.28E-11'), Decimal('28125000000000'), Decimal('180.0000000000000')),
-    (Decimal('1.25E-11'), Decimal('28800000000000'), Decimal('180.0000000000000')),
-    (Decimal('1.2288E-11'), Decimal('29296875000000'), Decimal('180.000000000000000')),
-    (Decimal('1.220703125E-11'), Decimal('29491200000000'), Decimal('180.00000000000000000000')),
-    (Decimal('1.2E-11'), Decimal('30000000000000'), Decimal('180.000000000000')),
-    (Decimal('1.1920928955078125E-11'), Decimal('30198988800000'), Decimal('180.000000000000000000000000000')),
-    (Decimal('1.179648E-11'), Decimal('30517578125000'), Decimal('180.00000000000000000')),
-    (Decimal('1.171875E-11'), Decimal('30720000000000'), Decimal('180.00000000000000000')),
-    (Decimal('1.16415321826934814453125E-11'), Decimal('30923764531200'), Decimal('180.0000000000000000000000000000000000')),
-    (Decimal('1.152E-11'), Decimal('31250000000000'), Decimal('180.00000000000000')),
-    (Decimal('1.1444091796875E-11'), Decimal('31457280000000'), Decimal('180.000000000000000000000000')),
-    (Decimal('1.125E-11'), Decimal('32000000000000'), Decimal('180.00000000000000')),
-    (Decimal('1.11758708953857421875E-11'), Decimal('32212254720000'), Decimal('180.0000000000000000000000000000000')),
-    (Decimal('1.0986328125E-11'), Decimal('32768000000000'), Decimal('180.000000000000000000000')),
-    (Decimal('1.091393642127513885498046875E-11'), Decimal('32985348833280'), Decimal('180.00000000000000000000000000000000000000')),
-    (Decimal('1.07288360595703125E-11'), Decimal('33554432000000'), Decimal('180.0000000000000000000000000000')),
-    (Decimal('1.048576E-11'), Decimal('34332275390625'), Decimal('0E-17')),
-    (Decimal('1.047737896442413330078125E-11'), Decimal('34359738368000'), Decimal('180.00000000000000000000000000000000000')),
-    (Decimal('1.024E-11'), Decimal('35156250000000'), Decimal('180.00000000000000')),
-    (Decimal('1.0231815394945442676544189453125E-11'), Decimal('35184372088832'), Decimal('180.000000000000000000000000000000000000000000')),
-    (Decimal('1E-11'), Decimal('36000000000000'), Decimal('180.00000000000')),
-    (Decimal('9.8304E-12'), Decimal('36621093750000'), Decimal('180.0000000000000000')),
-    (Decimal('9.765625E-12'), Decimal('36864000000000'), Decimal('180.000000000000000000')),
-    (Decimal('9.6E-12'), Decimal('37500000000000'), Decimal('180.0000000000000')),
-    (Decimal('9.5367431640625E-12'), Decimal('37748736000000'), Decimal('180.0000000000000000000000000')),
-    (Decimal('9.437184E-12'), Decimal('38146972656250'), Decimal('180.000000000000000000')),
-    (Decimal('9.375E-12'), Decimal('38400000000000'), Decimal('180.000000000000000')),
-    (Decimal('9.31322574615478515625E-12'), Decimal('38654705664000'), Decimal('180.00000000000000000000000000000000')),
-    (Decimal('9.216E-12'), Decimal('39062500000000'), Decimal('180.000000000000000')),
-    (Decimal('9.1552734375E-12'), Decimal('39321600000000'), Decimal('180.0000000000000000000000')),
-    (Decimal('9.094947017729282379150390625E-12'), Decimal('39582418599936'), Decimal('180.000000000000000000000000000000000000000')),
-    (Decimal('9E-12'), Decimal('40000000000000'), Decimal('180.000000000000')),
-    (Decimal('8.94069671630859375E-12'), Decimal('40265318400000'), Decimal('180.00000000000000000000000000000')),
-    (Decimal('8.7890625E-12'), Decimal('40960000000000'), Decimal('180.0000000000000000000')),
-    (Decimal('8.731149137020111083984375E-12'), Decimal('41231686041600'), Decimal('180.000000000000000000000000000000000000')),
-    (Decimal('8.58306884765625E-12'), Decimal('41943040000000'), Decimal('180.00000000000000000000000000')),
-    (Decimal('8.381903171539306640625E-12'), Decimal('42949672960000'), Decimal('180.000000000000000000000000000000000')),
-    (Decimal('8.192E-12'), Decimal('43945312500000'), Decimal('180.000000000000000')),
-    (Decimal('8.1854523159563541412353515625E-12'), Decimal('43980465111040'), Decimal('180.0000000000000000000000000000000000000000')),
-    (Decimal('8E-12'), Decimal('45000000000000'), Decimal('180.000000000000')),
-    (Decimal('7.86432E-12'), Decimal('45776367187500'), Decimal('180.00000000000000000')),
-    (Decimal('7.8125E-12'), Decimal('46080000000000'), Decimal('180.0000000000000000')),
-    (Decimal('7.68E-12'), Decimal('46875000000000'), Decimal('180.00000000000000')),
-    (Decimal('7.62939453125E-12'), Decimal('47185920000000'), Decimal('180.00000000000000000000000')),
-    (Decimal('7.5E-12'), Decimal('48000000000000'), Decimal('180.0000000000000')),
-    (Decimal('7.450580596923828125E-12'), Decimal('48318382080000'), Decimal('180.000000000000000000000000000000')),
-    (Decimal('7.3728E-12'), Decimal('48828125000000'), Decimal('180.0000000000000000')),
-    (Decimal('7.32421875E-12'), Decimal('49152000000000'), Decimal('180.00000000000000000000')),
-    (Decimal('7.2759576141834259033203125E-12'), Decimal('49478023249920'), Decimal('180.0000000000000000000000000000000000000')),
-    (Decimal('7.2E-12'), Decimal('50000000000000'), Decimal('180.0000000000000')),
-    (Decimal('7.152557373046875E-12'), Decimal('50331648000000'), Decimal('180.000000000000000000000000000')),
-    (Decimal('7.03125E-12'), Decimal('51200000000000'), Decimal('180.00000000000000000')),
-    (Decimal('6.9849193096160888671875E-12'), Decimal('51539607552000'), Decimal('180.0000000000000000000000000000000000')),
-    (Decimal('6.866455078125E-12'), Decimal('52428800000000'), Decimal('180.000000000000000000000000')),
-    (Decimal('6.82121026329696178436279296875E-12'), Decimal('52776558133248'), Decimal('180.00000000000000000000000000000000000000000')),
-    (Decimal('6.7055225372314453125E-12'), Decimal('53687091200000'), Decimal('180.0000000000000000000000000000000')),
-    (Decimal('6.5536E-12'), Decimal('54931640625000'), Decimal('180.0000000000000000')),
-    (Decimal('6.54836185276508331298828125E-12'), Decimal('54975581388800'), Decimal('180.00000000000000000000000000000000000000')),
-    (Decimal('6.4E-12'), Decimal('56250000000000'), Decimal('180.0000000000000')),
-    (Decimal('6.291456E-12'), Decimal('57220458984375'), Decimal('0E-18')),
-    (Decimal('6.25E-12'), Decimal('57600000000000'), Decimal('180.00000000000000')),
-    (Decimal('6.144E-12'), Decimal('58593750000000'), Decimal('180.000000000000000')),
-    (Decimal('6.103515625E-12'), Decimal('58982400000000'), Decimal('180.000000000000000000000')),
-    (Decimal('6E-12'), Decimal('60000000000000'), Decimal('180.000000000000')),
-    (Decimal('5.9604644775390625E-12'), Decimal('60397977600000'), Decimal('180.0000000000000000000000000000')),
-    (Decimal('5.89824E-12'), Decimal('61035156250000'), Decimal('180.00000000000000000')),
-    (Decimal('5.859375E-12'), Decimal('61440000000000'), Decimal('180.000000000000000000')),
-    (Decimal('5.82076609134674072265625E-12'), Decimal('61847529062400'), Decimal('180.00000000000000000000000000000000000')),
-    (Decimal('5.76E-12'), Decimal('62500000000000'), Decimal('180.00000000000000')),
-    (Decimal('5.7220458984375E-12'), Decimal('62914560000000'), Decimal('180.0000000000000000000000000')),
-    (Decimal('5.625E-12'), Decimal('64000000000000'), Decimal('180.000000000000000')),
-    (Decimal('5.58793544769287109375E-12'), Decimal('64424509440000'), Decimal('180.00000000000000000000000000000000')),
-    (Decimal('5.4931640625E-12'), Decimal('65536000000000'), Decimal('180.0000000000000000000000')),
-    (Decimal('5.456968210637569427490234375E-12'), Decimal('65970697666560'), Decimal('180.000000000000000000000000000000000000000')),
-    (Decimal('5.36441802978515625E-12'), Decimal('67108864000000'), Decimal('180.00000000000000000000000000000')),
-    (Decimal('5.24288E-12'), Decimal('68664550781250'), Decimal('180.00000000000000000')),
-    (Decimal('5.238689482212066650390625E-12'), Decimal('68719476736000'), Decimal('180.000000000000000000000000000000000000')),
-    (Decimal('5.12E-12'), Decimal('70312500000000'), Decimal('180.00000000000000')),
-    (Decimal('5.1159076974727213382720947265625E-12'), Decimal('70368744177664'), Decimal('180.0000000000000000000000000000000000000000000')),
-    (Decimal('5E-12'), Decimal('72000000000000'), Decimal('180.000000000000')),
-    (Decimal('4.9152E-12'), Decimal('73242187500000'), Decimal('180.0000000000000000')),
-    (Decimal('4.8828125E-12'), Decimal('73728000000000'), Decimal('180.0000000000000000000')),
-    (Decimal('4.8E-12'), Decimal('75000000000000'), Decimal('180.0000000000000')),
-    (Decimal('4.76837158203125E-12'), Decimal('75497472000000'), Decimal('180.00000000000000000000000000')),
-    (Decimal('4.718592E-12'), Decimal('76293945312500'), Decimal('180.000000000000000000')),
-    (Decimal('4.6875E-12'), Decimal('76800000000000'), Decimal('180.0000000000000000')),
-    (Decimal('4.656612873077392578125E-12'), Decimal('77309411328000'), Decimal('180.000000000000000000000000000000000')),
-    (Decimal('4.608E-12'), Decimal('78125000000000'), Decimal('180.000000000000000')),
-    (Decimal('4.57763671875E-12'), Decimal('78643200000000'), Decimal('180.00000000000000000000000')),
-    (Decimal('4.5474735088646411895751953125E-12'), Decimal('79164837199872'), Decimal('180.0000000000000000000000000000000000000000')),
-    (Decimal('4.5E-12'), Decimal('80000000000000'), Decimal('180.0000000000000')),
-    (Decimal('4.470348358154296875E-12'), Decimal('80530636800000'), Decimal('180.000000000000000000000000000000')),
-    (Decimal('4.39453125E-12'), Decimal('81920000000000'), Decimal('180.00000000000000000000')),
-    (Decimal('4.3655745685100555419921875E-12'), Decimal('82463372083200'), Decimal('180.0000000000000000000000000000000000000')),
-    (Decimal('4.291534423828125E-12'), Decimal('83886080000000'), Decimal('180.000000000000000000000000000')),
-    (Decimal('4.1909515857696533203125E-12'), Decimal('85899345920000'), Decimal('180.0000000000000000000000000000000000')),
-    (Decimal('4.096E-12'), Decimal('87890625000000'), Decimal('180.000000000000000')),
-    (Decimal('4.09272615797817707061767578125E-12'), Decimal('87960930222080'), Decimal('180.00000000000000000000000000000000000000000')),
-    (Decimal('4E-12'), Decimal('90000000000000'), Decimal('180.000000000000')),
-    (Decimal('3.93216E-12'), Decimal('91552734375000'), Decimal('180.00000000000000000')),
-    (Decimal('3.90625E-12'), Decimal('92160000000000'), Decimal('180.00000000000000000')),
-    (Decimal('3.84E-12'), Decimal('93750000000000'), Decimal('180.00000000000000')),
-    (Decimal('3.814697265625E-12'), Decimal('94371840000000'), Decimal('180.000000000000000000000000')),
-    (Decimal('3.7748736E-12'), Decimal('95367431640625'), Decimal('0E-19')),
-    (Decimal('3.75E-12'), Decimal('96000000000000'), Decimal('180.00000000000000')),
-    (Decimal('3.7252902984619140625E-12'), Decimal('96636764160000'), Decimal('180.0000000000000000000000000000000')),
-    (Decimal('3.6864E-12'), Decimal('97656250000000'), Decimal('180.0000000000000000')),
-    (Decimal('3.662109375E-12'), Decimal('98304000000000'), Decimal('180.000000000000000000000')),
-    (Decimal('3.63797880709171295166015625E-12'), Decimal('98956046499840'), Decimal('180.00000000000000000000000000000000000000')),
-    (Decimal('3.6E-12'), Decimal('100000000000000'), Decimal('180.0000000000000')),
-    (Decimal('3.5762786865234375E-12'), Decimal('100663296000000'), Decimal('180.0000000000000000000000000000')),
-    (Decimal('3.515625E-12'), Decimal('102400000000000'), Decimal('180.000000000000000000')),
-    (Decimal('3.49245965480804443359375E-12'), Decimal('103079215104000'), Decimal('180.00000000000000000000000000000000000')),
-    (Decimal('3.4332275390625E-12'), Decimal('104857600000000'), Decimal('180.0000000000000000000000000')),
-    (Decimal('3.410605131648480892181396484375E-12'), Decimal('105553116266496'), Decimal('180.000000000000000000000000000000000000000000')),
-    (Decimal('3.35276126861572265625E-12'), Decimal('107374182400000'), Decimal('180.00000000000000000000000000000000')),
-    (Decimal('3.2768E-12'), Decimal('109863281250000'), Decimal('180.0000000000000000')),
-    (Decimal('3.274180926382541656494140625E-12'), Decimal('109951162777600'), Decimal('180.000000000000000000000000000000000000000')),
-    (Decimal('3.2E-12'), Decimal('112500000000000'), Decimal('180.0000000000000')),
-    (Decimal('3.145728E-12'), Decimal('114440917968750'), Decimal('180.000000000000000000')),
-    (Decimal('3.125E-12'), Decimal('115200000000000'), Decimal('180.000000000000000')),
-    (Decimal('3.072E-12'), Decimal('117187500000000'), Decimal('180.000000000000000')),
-    (Decimal('3.0517578125E-12'), Decimal('117964800000000'), Decimal('180.0000000000000000000000')),
-    (Decimal('3E-12'), Decimal('120000000000000'), Decimal('180.000000000000')),
-    (Decimal('2.98023223876953125E-12'), Decimal('120795955200000'), Decimal('180.00000000000000000000000000000')),
-    (Decimal('2.94912E-12'), Decimal('122070312500000'), Decimal('180.00000000000000000')),
-    (Decimal('2.9296875E-12'), Decimal('122880000000000'), Decimal('180.0000000000000000000')),
-    (Decimal('2.910383045673370361328125E-12'), Decimal('123695058124800'), Decimal('180.000000000000000000000000000000000000')),
-    (Decimal('2.88E-12'), Decimal('125000000000000'), Decimal('180.00000000000000')),
-    (Decimal('2.86102294921875E-12'), Decimal('125829120000000'), Decimal('180.00000000000000000000000000')),
-    (Decimal('2.8125E-12'), Decimal('128000000000000'), Decimal('180.0000000000000000')),
-    (Decimal('2.793967723846435546875E-12'), Decimal('128849018880000'), Decimal('180.000000000000000000000000000000000')),
-    (Decimal('2.74658203125E-12'), Decimal('131072000000000'), Decimal('180.00000000000000000000000')),
-    (Decimal('2.7284841053187847137451171875E-12'), Decimal('131941395333120'), Decimal('180.0000000000000000000000000000000000000000')),
-    (Decimal('2.682209014892578125E-12'), Decimal('134217728000000'), Decimal('180.000000000000000000000000000000')),
-    (Decimal('2.62144E-12'), Decimal('137329101562500'), Decimal('180.00000000000000000')),
-    (Decimal('2.6193447411060333251953125E-12'), Decimal('137438953472000'), Decimal('180.0000000000000000000000000000000000000')),
-    (Decimal('2.56E-12'), Decimal('140625000000000'), Decimal('180.00000000000000')),
-    (Decimal('2.55795384873636066913604736328125E-12'), Decimal('140737488355328'), Decimal('180.00000000000000000000000000000000000000000000')),
-    (Decimal('2.5E-12'), Decimal('144000000000000'), Decimal('180.0000000000000')),
-    (Decimal('2.4576E-12'), Decimal('146484375000000'), Decimal('180.0000000000000000')),
-    (Decimal('2.44140625E-12'), Decimal('147456000000000'), Decimal('180.00000000000000000000')),
-    (Decimal('2.4E-12'), Decimal('150000000000000'), Decimal('180.0000000000000')),
-    (Decimal('2.384185791015625E-12'), Decimal('150994944000000'), Decimal('180.000000000000000000000000000')),
-    (Decimal('2.359296E-12'), Decimal('152587890625000'), Decimal('180.000000000000000000')),
-    (Decimal('2.34375E-12'), Decimal('153600000000000'), Decimal('180.00000000000000000')),
-    (Decimal('2.3283064365386962890625E-12'), Decimal('154618822656000'), Decimal('180.0000000000000000000000000000000000')),
-    (Decimal('2.304E-12'), Decimal('156250000000000'), Decimal('180.000000000000000')),
-    (Decimal('2.288818359375E-12'), Decimal('157286400000000'), Decimal('180.000000000000000000000000')),
-    (Decimal('2.27373675443232059478759765625E-12'), Decimal('158329674399744'), Decimal('180.00000000000000000000000000000000000000000')),
-    (Decimal('2.25E-12'), Decimal('160000000000000'), Decimal('180.00000000000000')),
-    (Decimal('2.2351741790771484375E-12'), Decimal('161061273600000'), Decimal('180.0000000000000000000000000000000')),
-    (Decimal('2.197265625E-12'), Decimal('163840000000000'), Decimal('180.000000000000000000000')),
-    (Decimal('2.18278728425502777099609375E-12'), Decimal('164926744166400'), Decimal('180.00000000000000000000000000000000000000')),
-    (Decimal('2.1457672119140625E-12'), Decimal('167772160000000'), Decimal('180.0000000000000000000000000000')),
-    (Decimal('2.097152E-12'), Decimal('171661376953125'), Decimal('0E-18')),
-    (Decimal('2.09547579288482666015625E-12'), Decimal('171798691840000'), Decimal('180.00000000000000000000000000000000000')),
-    (Decimal('2.048E-12'), Decimal('175781250000000'), Decimal('180.000000000000000')),
-    (Decimal('2.046363078989088535308837890625E-12'), Decimal('175921860444160'), Decimal('180.000000000000000000000000000000000000000000')),
-    (Decimal('2E-12'), Decimal('180000000000000'), Decimal('180.000000000000')),
-    (Decimal('1.96608E-12'), Decimal('183105468750000'), Decimal('180.00000000000000000')),
-    (Decimal('1.953125E-12'), Decimal('184320000000000'), Decimal('180.000000000000000000')),
-    (Decimal('1.92E-12'), Decimal('187500000000000'), Decimal('180.00000000000000')),
-    (Decimal('1.9073486328125E-12'), Decimal('188743680000000'), Decimal('180.0000000000000000000000000')),
-    (Decimal('1.8874368E-12'), Decimal('190734863281250'), Decimal('180.0000000000000000000')),
-    (Decimal('1.875E-12'), Decimal('192000000000000'), Decimal('180.000000000000000')),
-    (Decimal('1.86264514923095703125E-12'), Decimal('193273528320000'), Decimal('180.00000000000000000000000000000000')),
-    (Decimal('1.8432E-12'), Decimal('195312500000000'), Decimal('180.0000000000000000')),
-    (Decimal('1.8310546875E-12'), Decimal('196608000000000'), Decimal('180.0000000000000000000000')),
-    (Decimal('1.818989403545856475830078125E-12'), Decimal('197912092999680'), Decimal('180.000000000000000000000000000000000000000')),
-    (Decimal('1.8E-12'), Decimal('200000000000000'), Decimal('180.0000000000000')),
-    (Decimal('1.78813934326171875E-12'), Decimal('201326592000000'), Decimal('180.00000000000000000000000000000')),
-    (Decimal('1.7578125E-12'), Decimal('204800000000000'), Decimal('180.0000000000000000000')),
-    (Decimal('1.746229827404022216796875E-12'), Decimal('206158430208000'), Decimal('180.000000000000000000000000000000000000')),
-    (Decimal('1.71661376953125E-12'), Decimal('209715200000000'), Decimal('180.00000000000000000000000000')),
-    (Decimal('1.7053025658242404460906982421875E-12'), Decimal('211106232532992'), Decimal('180.0000000000000000000000000000000000000000000')),
-    (Decimal('1.676380634307861328125E-12'), Decimal('214748364800000'), Decimal('180.000000000000000000000000000000000')),
-    (Decimal('1.6384E-12'), Decimal('219726562500000'), Decimal('180.0000000000000000')),
-    (Decimal('1.6370904631912708282470703125E-12'), Decimal('219902325555200'), Decimal('180.0000000000000000000000000000000000000000')),
-    (Decimal('1.6E-12'), Decimal('225000000000000'), Decimal('180.0000000000000')),
-    (Decimal('1.572864E-12'), Decimal('228881835937500'), Decimal('180.000000000000000000')),
-    (Decimal('1.5625E-12'), Decimal('230400000000000'), Decimal('180.0000000000000000')),
-    (Decimal('1.536E-12'), Decimal('234375000000000'), Decimal('180.000000000000000')),
-    (Decimal('1.52587890625E-12'), Decimal('235929600000000'), Decimal('180.00000000000000000000000')),
-    (Decimal('1.5E-12'), Decimal('240000000000000'), Decimal('180.0000000000000')),
-    (Decimal('1.490116119384765625E-12'), Decimal('241591910400000'), Decimal('180.000000000000000000000000000000')),
-    (Decimal('1.47456E-12'), Decimal('244140625000000'), Decimal('180.00000000000000000')),
-    (Decimal('1.46484375E-12'), Decimal('245760000000000'), Decimal('180.00000000000000000000')),
-    (Decimal('1.4551915228366851806640625E-12'), Decimal('247390116249600'), Decimal('180.0000000000000000000000000000000000000')),
-    (Decimal('1.44E-12'), Decimal('250000000000000'), Decimal('180.00000000000000')),
-    (Decimal('1.430511474609375E-12'), Decimal('251658240000000'), Decimal('180.000000000000000000000000000')),
-    (Decimal('1.40625E-12'), Decimal('256000000000000'), Decimal('180.00000000000000000')),
-    (Decimal('1.3969838619232177734375E-12'), Decimal('257698037760000'), Decimal('180.0000000000000000000000000000000000')),
-    (Decimal('1.373291015625E-12'), Decimal('262144000000000'), Decimal('180.000000000000000000000000')),
-    (Decimal('1.36424205265939235687255859375E-12'), Decimal('263882790666240'), Decimal('180.00000000000000000000000000000000000000000')),
-    (Decimal('1.3411045074462890625E-12'), Decimal('268435456000000'), Decimal('180.0000000000000000000000000000000')),
-    (Decimal('1.31072E-12'), Decimal('274658203125000'), Decimal('180.00000000000000000')),
-    (Decimal('1.30967237055301666259765625E-12'), Decimal('274877906944000'), Decimal('180.00000000000000000000000000000000000000')),
-    (Decimal('1.28E-12'), Decimal('281250000000000'), Decimal('180.00000000000000')),
-    (Decimal('1.278976924368180334568023681640625E-12'), Decimal('281474976710656'), Decimal('180.000000000000000000000000000000000000000000000')),
-    (Decimal('1.2582912E-12'), Decimal('286102294921875'), Decimal('0E-19')),
-    (Decimal('1.25E-12'), Decimal('288000000000000'), Decimal('180.00000000000000')),
-    (Decimal('1.2288E-12'), Decimal('292968750000000'), Decimal('180.0000000000000000')),
-    (Decimal('1.220703125E-12'), Decimal('294912000000000'), Decimal('180.000000000000000000000')),
-    (Decimal('1.2E-12'), Decimal('300000000000000'), Decimal('180.0000000000000')),
-    (Decimal('1.1920928955078125E-12'), Decimal('301989888000000'), Decimal('180.0000000000000000000000000000')),
-    (Decimal('1.179648E-12'), Decimal('305175781250000'), Decimal('180.000000000000000000')),
-    (Decimal('1.171875E-12'), Decimal('307200000000000'), Decimal('180.000000000000000000')),
-    (Decimal('1.16415321826934814453125E-12'), Decimal('309237645312000'), Decimal('180.00000000000000000000000000000000000')),
-    (Decimal('1.152E-12'), Decimal('312500000000000'), Decimal('180.000000000000000')),
-    (Decimal('1.1444091796875E-12'), Decimal('314572800000000'), Decimal('180.0000000000000000000000000')),
-    (Decimal('1.136868377216160297393798828125E-12'), Decimal('316659348799488'), Decimal('180.000000000000000000000000000000000000000000')),
-    (Decimal('1.125E-12'), Decimal('320000000000000'), Decimal('180.000000000000000')),
-    (Decimal('1.11758708953857421875E-12'), Decimal('322122547200000'), Decimal('180.00000000000000000000000000000000')),
-    (Decimal('1.0986328125E-12'), Decimal('327680000000000'), Decimal('180.0000000000000000000000')),
-    (Decimal('1.091393642127513885498046875E-12'), Decimal('329853488332800'), Decimal('180.000000000000000000000000000000000000000')),
-    (Decimal('1.07288360595703125E-12'), Decimal('335544320000000'), Decimal('180.00000000000000000000000000000')),
-    (Decimal('1.048576E-12'), Decimal('343322753906250'), Decimal('180.000000000000000000')),
-    (Decimal('1.047737896442413330078125E-12'), Decimal('343597383680000'), Decimal('180.000000000000000000000000000000000000')),
-    (Decimal('1.024E-12'), Decimal('351562500000000'), Decimal('180.000000000000000')),
-    (Decimal('1.0231815394945442676544189453125E-12'), Decimal('351843720888320'), Decimal('180.0000000000000000000000000000000000000000000')),
-    (Decimal('1E-12'), Decimal('360000000000000'), Decimal('180.000000000000')),
-    ]
+def __getattr__(name:str):
+    """Materialize TURTLEFUN_QUOTIENT_LIST on first access"""
+    if name == "TURTLEFUN_QUOTIENT_LIST":
+        return quotient_list()
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
@@ -1,19 +1,41 @@
 """src/turtlefun/turtlent.py"""
 
+import copy
 from decimal import Decimal, getcontext
-import itertools
+from enum import auto, Enum
 from loguru import logger
 import math
+import numpy as np
 import os
-from PIL import Image, ImageDraw
-from sympy import nextprime
+from PIL import Image, ImageColor, ImageDraw
+from queue import Queue
+from threading import Thread
 from time import perf_counter
-from typing import Union, List, Tuple
+from typing import Callable, Iterator, Union, List, Tuple
 
-from .turtlefun_quotientlist import TURTLEFUN_QUOTIENT_LIST
+from .originreturn import dominant_angles, heading_period, heading_residues, origin_return_estimation, origin_return_steps, symmetry_order
+from .originreturnstore import OriginReturnStore
+from .pngstream import APNGStreamWriter, PNGStreamWriter
+from .raster import collapse_pixel_runs, dilate, dilate_coverage, dilate_coverage_mask, rasterize_path, rasterize_path_antialiased, rotate_half_turn, SegmentGrid, simplify_path, unique_segments
 
 DEFAULT_IMAGE_WIDTH = 2560
 DEFAULT_IMAGE_HEIGHT = 1440
+DEFAULT_STRIP_HEIGHT = 1024
+DEFAULT_PREVIEW_LEVELS = ((256, 0.25), (16, 0.25), (1, 0.25), (1, 0.5))
+DEFAULT_LOD_LEVELS = 11
+DEFAULT_ANIMATION_FRAMES = 100
+DEFAULT_ANIMATION_QUEUE_SIZE = 8
+DEFAULT_SVG_CHUNK_SIZE = 1 << 20
+# palette entries of indexed images next to background and origin mark
+INDEXED_PALETTE_COLORS = 254
+
+
+class RenderMode(Enum):
+    """How the turtle path is drawn into the image"""
+    LINE = auto()
+    DILATE = auto()
+    ANTIALIAS = auto()
+
 
 def decimal_places(number:Union[float, str, Decimal, int]) -> int:
     """Determine the number of relevant decimal places in a number"""
@@ -60,20 +82,45 @@ class TurtleNT:
         path:str | None = "./turtlefun_images",
         steplimit:int | None = 100000000,
         stepsize:Union[int, float] | None = 100,
+        *,
+        image_deduplicate:bool | None = False,
+        image_indexed:bool | None = False,
+        image_render:RenderMode | None = RenderMode.LINE,
+        image_simplify:bool | None = False,
+        origin_return_store:OriginReturnStore | None = None,
+        symmetry:bool | None = False,
     ) -> None:
         """Create a turtle that is specialized in Euler Spirals
         
         Args:
             image_background (str, Tuple(int), None): Color of background, if None, RGBA is used for Mode instead of RGB
+            image_deduplicate (bool): draw segments that connect the same pair of pixels only once,
+                    applies to single color drawings and to palettes in RenderMode.DILATE
+                    and RenderMode.ANTIALIAS, where the latest segment wins anyway
             image_fileformat (str): file format for saving of image file
             image_height (int): height of the images to be created
+            image_indexed (bool): render palette indices into "P" mode images and write indexed
+                    PNG files, palettes of more than 254 colors are resampled, anti-aliased
+                    edges are cut at half coverage, index and coverage maps take one byte per pixel
             image_linecolor (str, Tuple(int), list): Color of the foreground drawing, if list, palette mode is used (TurtlePalette)
             image_linewidth (int): width of the turtle lines
+            image_render (RenderMode.LINE, RenderMode.DILATE, RenderMode.ANTIALIAS): draw every
+                    segment as PIL line with round joins, or rasterize the path one pixel wide
+                    and grow it to image_linewidth in a single dilation pass, optionally
+                    with anti-aliased edges
+            image_simplify (bool): drop moves within one pixel before drawing, which does not
+                    change the image and does not apply to RenderMode.ANTIALIAS, reduced size
+                    images, previews and viewports start from the matching level of detail
             image_width (int): with of the images to be created
             image_x_offset (int): x-offset in image for center of the turtle
             image_y_offset (int): y_offset in image for center of the turtle
+            origin_return_store (OriginReturnStore): persistent store to take origin return
+                    estimations and steps from and to record new ones in
             path (str): path to store images in
             stepsize (float, int): stepsize to take when moving the turtle
+            symmetry (bool): if the second half of the spiral is the first half turned
+                    by 180°, only calculate and rasterize the first half and compose
+                    the second one by rotation
             theta (str, int, float, Decimal): Euler Spiral base angle theta
         """
         
@@ -87,20 +134,36 @@ class TurtleNT:
         self.image_x_offset = image_x_offset if image_x_offset is not None else int(round(self.image_width / 2, 0))
         self.image_y_offset = image_y_offset if image_y_offset is not None else int(round(self.image_height / 2, 0))
         self._image = None
+        self._image_key = None
         self._image_draw = None
         self._image_draw_num = 0
+        self._image_drawn_num = 0
+        self._image_drawn_step_num = None
+        self._image_mark_origin = False
+        self._image_bounds = None
+        self._index_map = None
+        self._coverage_map = None
+        self._segment_grid = None
+        self._lod_pyramid = None
+        self._lod_pyramid_key = None
         
         self.image_background = image_background
+        self.image_deduplicate = image_deduplicate
+        self.image_indexed = image_indexed
         self.image_linecolor = image_linecolor
         self.image_linewidth = image_linewidth
+        self.image_render = image_render
+        self.image_simplify = image_simplify
         self.image_fileformat = image_fileformat
 
         self._origin_return_estimation = None
         self._origin_return_estimation_theta = None
         self._origin_return_dominant_angles = None
+        self.origin_return_store = origin_return_store
 
         self.stepsize = stepsize
         self.steplimit = steplimit
+        self.symmetry = symmetry
         self._xpos_list = [Decimal('0')]
         self._ypos_list = [Decimal('0')]
         self._xmax = None
@@ -108,6 +171,7 @@ class TurtleNT:
         self._ymax = None
         self._ymin = None
         self._minmax_step_num = None
+        self._palette_step_num = None
         
         self._scale = None
         
@@ -115,29 +179,38 @@ class TurtleNT:
         self.set_angle('0')
         self._step_num = Decimal('0')
         
-    def _get_color(self) -> Union[str, Tuple[int, int, int]]:
-        """Get color for next drawing step"""
+    def _get_color(self, num:int | None = None) -> Union[str, Tuple[int, int, int], int]:
+        """Get color for drawing step num, defaults to the current drawing step
         
-        if type(self.image_linecolor) is str or type(self.image_linecolor) is tuple:
+        Indexed images get the palette index of the color.
+        """
+        single_color = type(self.image_linecolor) is str or type(self.image_linecolor) is tuple
+        if single_color and not self.image_indexed:
             return self.image_linecolor
         
-        fraction = self._image_draw_num / self._step_num
-        color_num = int(round(len(self.image_linecolor) * fraction, 0))
-        if color_num < 0:
-            color_num = 0
-        elif color_num > len(self.image_linecolor) - 1:
-            color_num = len(self.image_linecolor) - 1
-
-        color = self.image_linecolor[color_num]
+        if num is None:
+            num = self._image_draw_num
+        color_num = 0
+        if not single_color:
+            fraction = num / self._palette_steps()
+            color_num = int(round(len(self.image_linecolor) * fraction, 0))
+            if color_num < 0:
+                color_num = 0
+            elif color_num > len(self.image_linecolor) - 1:
+                color_num = len(self.image_linecolor) - 1
+        
+        if self.image_indexed:
+            return self._palette_index(color_num)
+        return self._parse_color(self.image_linecolor[color_num])
+        
+    def _parse_color(self, color:Union[str, list]) -> Tuple[int, int, int]:
+        """Convert a palette entry into a color tuple"""
         if type(color) is str and color.startswith("#") and len(color) == 7:
             color = color.lstrip("#")
             return tuple(int(color[i: i + 2], 16) for i in (0, 2, 4))
         elif type(color) is list and len(color) == 3:
-            for index in range(len(color)):
-                color[index] = int(round(color[index] * 255, 0))
-                if color[index] > 255:
-                    color[index] = 255 # there is something wrong, but I cannot figure it out.
-            return tuple(color)
+            # do not scale the palette entries in place, they are used for every segment
+            return tuple(min(int(round(value * 255, 0)), 255) for value in color)
         else:
             logger.critical(
                 "Palette returns invalid color code! " +
@@ -145,20 +218,94 @@ class TurtleNT:
             )
             return (255, 255, 255)
     
+    def _palette_numbers(self, steps:np.ndarray) -> np.ndarray:
+        """Palette entry of every drawing step, vectorized version of _get_color"""
+        if type(self.image_linecolor) is str or type(self.image_linecolor) is tuple:
+            return np.zeros(len(steps), dtype=np.int64)
+        
+        count = len(self.image_linecolor)
+        numbers = np.rint(count * steps.astype(np.float64) / float(max(self._palette_steps(), 1)))
+        return np.clip(numbers, 0, count - 1).astype(np.int64)
+    
+    def _palette_index(self, numbers:Union[int, np.ndarray]) -> Union[int, np.ndarray]:
+        """Index in the indexed image palette of palette entries numbers
+        
+        Index 0 is the background, palettes of more than INDEXED_PALETTE_COLORS
+        entries are mapped to the nearest entry of the resampled palette.
+        """
+        count = 1 if type(self.image_linecolor) is str or type(self.image_linecolor) is tuple else len(self.image_linecolor)
+        if count <= INDEXED_PALETTE_COLORS:
+            return numbers + 1
+        # integer rounding of numbers * (INDEXED_PALETTE_COLORS - 1) / (count - 1)
+        return (2 * numbers * (INDEXED_PALETTE_COLORS - 1) + count - 1) // (2 * (count - 1)) + 1
+    
+    def _indexed_palette(self) -> bytes:
+        """RGB palette of indexed images: background, line colors and origin mark"""
+        colors = self._palette_rgb()
+        if len(colors) > INDEXED_PALETTE_COLORS:
+            logger.warning("Palette of {} colors is resampled to {} colors for indexed images", len(colors), INDEXED_PALETTE_COLORS)
+            colors = colors[np.rint(np.arange(INDEXED_PALETTE_COLORS) * (len(colors) - 1) / (INDEXED_PALETTE_COLORS - 1)).astype(np.int64)]
+        background = (0, 0, 0)
+        if self.image_background is not None:
+            background = ImageColor.getrgb(self.image_background) if type(self.image_background) is str else self.image_background
+        return bytes(background[:3]) + colors.tobytes() + bytes(ImageColor.getrgb("red"))
+    
+    def _indexed_transparency(self) -> int | None:
+        """Palette index of the transparent background of indexed images"""
+        if self.image_indexed and self.image_background is None:
+            return 0
+        return None
+    
+    def _palette_steps(self) -> Decimal:
+        """Number of steps the palette is spread over, defaults to the current step number"""
+        if self._palette_step_num is not None:
+            return self._palette_step_num
+        return self._step_num
+    
+    def _palette_rgb(self) -> np.ndarray:
+        """Colors of all palette entries as array of shape (entries, 3)"""
+        if type(self.image_linecolor) is str or type(self.image_linecolor) is tuple:
+            colors = [ImageColor.getrgb(self.image_linecolor) if type(self.image_linecolor) is str else self.image_linecolor]
+        else:
+            colors = [self._parse_color(color) for color in self.image_linecolor]
+        return np.array([color[:3] for color in colors], dtype=np.uint8)
+    
     def _angle_cleanup(self) -> None:
         """Clean up _angle to be within 360°"""
         self._angle = self._angle % Decimal('360')
         
-    def _autoscale(self) -> Decimal:
+    def _autoscale(
+        self,
+        width:int | None = None,
+        height:int | None = None,
+        bounds:Tuple[Decimal, Decimal, Decimal, Decimal] | None = None,
+        ) -> Decimal:
         """Calculate autoscale factor to position drawing within canvas
-        boundaries, while keeping the origin at the center position."""
-        self._calculate_min_max_positions()
+        boundaries, while keeping the origin at the center position.
+        
+        Args:
+            width (int): canvas width, defaults to image_width
+            height (int): canvas height, defaults to image_height
+            bounds (Tuple(Decimal)): (xmin, ymin, xmax, ymax) to fit, defaults to the
+                    image boundaries or the reached positions
+        """
+        if width is None:
+            width = self.image_width
+        if height is None:
+            height = self.image_height
+        if bounds is not None:
+            xmin, ymin, xmax, ymax = bounds
+        elif self._image_bounds is not None:
+            xmin, ymin, xmax, ymax = self._image_bounds
+        else:
+            self._calculate_min_max_positions()
+            xmin, ymin, xmax, ymax = self._xmin, self._ymin, self._xmax, self._ymax
         
-        xmax = getcontext().abs(getcontext().max_mag(self._xmax, self._xmin))
-        xscale = ((self.image_width / Decimal('2')) / xmax) if xmax != 0 else Decimal('1')
+        xmax = getcontext().abs(getcontext().max_mag(xmax, xmin))
+        xscale = ((width / Decimal('2')) / xmax) if xmax != 0 else Decimal('1')
         
-        ymax = getcontext().abs(getcontext().max_mag(self._ymax, self._ymin))
-        yscale = ((self.image_height / Decimal('2')) / ymax) if ymax != 0 else Decimal('1')
+        ymax = getcontext().abs(getcontext().max_mag(ymax, ymin))
+        yscale = ((height / Decimal('2')) / ymax) if ymax != 0 else Decimal('1')
         
         scale = getcontext().min(xscale, yscale)
         logger.debug("Scaling factor determined for plotting is {}", scale)
@@ -189,18 +336,150 @@ class TurtleNT:
         
         logger.debug("Boundary corners at {} steps are ({}, {}), ({}, {})", self._minmax_step_num, self._xmin, self._ymin, self._xmax, self._ymax)
         
-    def _clear_image(self) -> None:
-        """Create a clean new image canvas."""
+    def _image_mode(self) -> str:
+        """PIL image mode of the canvas"""
+        if self.image_indexed:
+            return "P"
+        return "RGBA" if self.image_background is None else "RGB"
+        
+    def _indexed_image(self, pixels:np.ndarray) -> Image.Image:
+        """Create a "P" mode image of palette indices with the indexed palette attached"""
+        image = Image.fromarray(pixels, "P")
+        image.putpalette(self._indexed_palette())
+        if self.image_background is None:
+            image.info["transparency"] = 0
+        return image
+        
+    def _new_image(self, width:int, height:int) -> Image.Image:
+        """Create a clean canvas of the given size"""
+        if self.image_indexed:
+            return self._indexed_image(np.zeros((height, width), dtype=np.uint8))
+        if self.image_background is None:
+            return Image.new(self._image_mode(), (width, height))
+        return Image.new(self._image_mode(), (width, height), self.image_background)
+        
+    def _render_index_map(
+        self,
+        xpos:np.ndarray,
+        ypos:np.ndarray,
+        width:int,
+        height:int,
+        offset:Tuple[int, int],
+        steps:np.ndarray | None = None,
+        index_map:np.ndarray | None = None,
+        coverage:np.ndarray | None = None,
+        segments:np.ndarray | None = None,
+        step_numbers:bool | None = False,
+        ) -> Tuple[np.ndarray, np.ndarray | None]:
+        """Rasterize a path given in scaled coordinates into a step index map
+        
+        In RenderMode.ANTIALIAS a coverage map is rasterized alongside. Indexed
+        images rasterize their palette indices into uint8 maps instead of step
+        numbers and the coverage in units of 1 / 255, so both maps take one byte
+        per pixel. The palette index grows with the step, so the latest step
+        still wins.
+        
+        Args:
+            xpos (np.ndarray): scaled x positions
+            ypos (np.ndarray): scaled y positions
+            width (int): width of the canvas
+            height (int): height of the canvas
+            offset (Tuple(int, int)): pixel offset of the origin
+            steps (np.ndarray): turtle step of every position, defaults to the position index
+            index_map (np.ndarray): existing map to extend, a new one is created if None
+            coverage (np.ndarray): existing coverage map to extend, a new one is created if None
+            segments (np.ndarray): indices of segments to rasterize, defaults to all
+            step_numbers (bool): create a map of step numbers for indexed images as well,
+                    as needed for the half-turn composition
+            
+        Return:
+            (index_map, coverage), coverage is None if not anti-aliased
+        """
+        if index_map is None:
+            indices = self.image_indexed and not step_numbers
+            index_map = np.zeros((height, width), dtype=np.uint8 if indices else np.uint32)
+        if index_map.dtype == np.uint8:
+            if steps is None:
+                steps = np.arange(len(xpos))
+            steps = self._palette_index(self._palette_numbers(steps)) - 1
+        if self.image_render != RenderMode.ANTIALIAS:
+            rasterize_path(index_map, xpos + offset[0], ypos + offset[1], steps, segments)
+            return index_map, None
+        
+        if coverage is None:
+            coverage = np.zeros((height, width), dtype=np.uint8 if self.image_indexed else np.float32)
+        rasterize_path_antialiased(index_map, coverage, xpos + offset[0], ypos + offset[1], steps, segments)
+        return index_map, coverage
+        
+    def _index_map_image(
+        self,
+        index_map:np.ndarray,
+        linewidth:int,
+        coverage:np.ndarray | None = None,
+        ) -> Image.Image:
+        """Dilate a step index map to linewidth and color it like the drawn segments
+        
+        With a coverage map the line color is blended with the background.
+        uint8 maps of indexed images already hold the palette indices.
+        """
+        dilated = dilate(index_map, linewidth if coverage is None else linewidth + 1)
+        if self.image_indexed:
+            drawn = dilated > 0
+            if coverage is not None:
+                # the anti-aliased edge reaches half a pixel beyond linewidth
+                drawn &= dilate_coverage_mask(coverage, linewidth, 0.5)
+            if dilated.dtype == np.uint8:
+                dilated[~drawn] = 0
+                return self._indexed_image(dilated)
+            pixels = np.zeros(dilated.shape, dtype=np.uint8)
+            pixels[drawn] = self._palette_index(self._palette_numbers(dilated[drawn].astype(np.int64) - 1))
+            return self._indexed_image(pixels)
+        
+        if coverage is not None:
+            coverage = dilate_coverage(coverage, linewidth)
+        drawn = dilated > 0
+        colors = self._palette_rgb()[self._palette_numbers(dilated[drawn].astype(np.int64) - 1)]
+        
         if self.image_background is None:
-            self._image = Image.new("RGBA", (self.image_width, self.image_height))
+            pixels = np.zeros(dilated.shape + (4,), dtype=np.uint8)
+            pixels[drawn, :3] = colors
+            pixels[drawn, 3] = 255 if coverage is None else np.rint(coverage[drawn] * 255).astype(np.uint8)
+            return Image.fromarray(pixels, self._image_mode())
+        
+        pixels = np.empty(dilated.shape + (3,), dtype=np.uint8)
+        pixels[:] = ImageColor.getrgb(self.image_background)[:3] if type(self.image_background) is str else self.image_background[:3]
+        if coverage is None:
+            pixels[drawn] = colors
         else:
-            self._image = Image.new("RGB", (self.image_width, self.image_height), self.image_background)
-        self._image_draw = ImageDraw.Draw(self._image)
+            alpha = coverage[drawn][:, np.newaxis]
+            pixels[drawn] = np.rint(pixels[drawn] * (1 - alpha) + colors * alpha).astype(np.uint8)
+        return Image.fromarray(pixels, self._image_mode())
     
-    def _draw_line(self, x1:Union[int, float], y1:Union[int, float], x2:Union[int, float], y2:Union[int, float]) -> None:
-        """Draw a line"""
-        self._image_draw.line((x1 + self.image_x_offset, y1 + self.image_y_offset, x2 + self.image_x_offset, y2 + self.image_y_offset), fill=self._get_color(), width=self.image_linewidth)
-        self._draw_point(x2, y2)
+    def _draw_line(
+        self,
+        x1:Union[int, float],
+        y1:Union[int, float],
+        x2:Union[int, float],
+        y2:Union[int, float],
+        draw:ImageDraw.ImageDraw | None = None,
+        offset:Tuple[int, int] | None = None,
+        linewidth:int | None = None,
+        ) -> None:
+        """Draw a line
+        
+        Args:
+            draw (ImageDraw): canvas to draw on, defaults to the turtle image
+            offset (Tuple(int, int)): pixel offset of the origin, defaults to the image offsets
+            linewidth (int): width of the line, defaults to image_linewidth
+        """
+        if draw is None:
+            draw = self._image_draw
+        if linewidth is None:
+            linewidth = self.image_linewidth
+        x_offset, y_offset = offset if offset is not None else (self.image_x_offset, self.image_y_offset)
+        color = self._get_color()
+        draw.line((x1 + x_offset, y1 + y_offset, x2 + x_offset, y2 + y_offset), fill=color, width=linewidth)
+        self._draw_point(x2, y2, linewidth - 2, color, draw, offset)
        
     def _draw_point(
         self,
@@ -208,20 +487,209 @@ class TurtleNT:
         y:Union[int, float],
         width:int | None = None,
         color:Union[str, Tuple[int]] | None = None,
+        draw:ImageDraw.ImageDraw | None = None,
+        offset:Tuple[int, int] | None = None,
         ) -> None:
         """Draw a point of linewidth diameter at the given position"""
         if width is None:
             width = self.image_linewidth - 2
         if color is None:
             color = self._get_color()
+        if draw is None:
+            draw = self._image_draw
+        x_offset, y_offset = offset if offset is not None else (self.image_x_offset, self.image_y_offset)
+        if width < 0:
+            # thin lines do not need round joins
+            return
             
         radius = int(round((width) / 2, 0))
-        x1 = x - radius + self.image_x_offset
+        x1 = x - radius + x_offset
         x2 = x1 + width
-        y1 = y - radius + self.image_y_offset
+        y1 = y - radius + y_offset
         y2 = y1 + width
         
-        self._image_draw.ellipse((x1, y1, x2, y2), fill=color)
+        draw.ellipse((x1, y1, x2, y2), fill=color)
+        
+    def _draw_path(
+        self,
+        xpos:np.ndarray,
+        ypos:np.ndarray,
+        segments:Union[range, np.ndarray, None] = None,
+        draw:ImageDraw.ImageDraw | None = None,
+        offset:Tuple[int, int] | None = None,
+        steps:np.ndarray | None = None,
+        linewidth:int | None = None,
+        ) -> None:
+        """Draw the segments of a path given in scaled coordinates
+        
+        Segment n connects position n with position n + 1 and is drawn in
+        the color of drawing step n.
+        
+        Args:
+            xpos (np.ndarray): scaled x positions
+            ypos (np.ndarray): scaled y positions
+            segments (range, np.ndarray): indices of segments to draw, defaults to all
+            draw (ImageDraw): canvas to draw on, defaults to the turtle image
+            offset (Tuple(int, int)): pixel offset of the origin, defaults to the image offsets
+            steps (np.ndarray): turtle step of every position for the color selection
+                    of reduced paths, defaults to the position index
+            linewidth (int): width of the lines, defaults to image_linewidth
+        """
+        if segments is None:
+            segments = range(len(xpos) - 1)
+            
+        timer_start = perf_counter()
+        for count, num in enumerate(segments):
+            num = int(num)
+            self._image_draw_num = num if steps is None else int(steps[num])
+            self._draw_line(xpos[num], ypos[num], xpos[num + 1], ypos[num + 1], draw, offset, linewidth)
+            if count % 100000 == 0 and count > 0:
+                steps_per_second = count / (perf_counter() - timer_start)
+                logger.debug("Drawing step {} out of {}, remaining time estimate {}s", count, len(segments), float(len(segments) - count) / steps_per_second)
+                
+    def _render_image(
+        self,
+        xpos:np.ndarray,
+        ypos:np.ndarray,
+        width:int,
+        height:int,
+        offset:Tuple[int, int],
+        linewidth:int,
+        steps:np.ndarray | None = None,
+        mark_origin:bool | None = False,
+        segments:np.ndarray | None = None,
+        ) -> Image.Image:
+        """Draw a path given in scaled coordinates into a new canvas
+        
+        Args:
+            xpos (np.ndarray): scaled x positions
+            ypos (np.ndarray): scaled y positions
+            width (int): width of the canvas
+            height (int): height of the canvas
+            offset (Tuple(int, int)): pixel offset of the origin
+            linewidth (int): width of the lines
+            steps (np.ndarray): turtle step of every position, defaults to the position index
+            mark_origin (bool): draw a red dot at the origin position of the turtle.
+            segments (np.ndarray): indices of segments to draw, defaults to all
+        """
+        if self.image_render != RenderMode.LINE:
+            index_map, coverage = self._render_index_map(xpos, ypos, width, height, offset, steps, segments=segments)
+            image = self._index_map_image(index_map, linewidth, coverage)
+            draw = ImageDraw.Draw(image)
+        else:
+            image = self._new_image(width, height)
+            draw = ImageDraw.Draw(image)
+            self._image_draw_num = 0
+            self._draw_point(xpos[0], ypos[0], linewidth - 2, draw=draw, offset=offset)
+            self._draw_path(xpos, ypos, segments, draw, offset, steps, linewidth)
+        if mark_origin:
+            self._draw_point(0, 0, 4 * linewidth, "red", draw, offset)
+        return image
+        
+    def _sized_offset(self, width:int, height:int) -> Tuple[int, int]:
+        """Image offsets transferred to a canvas of a different size"""
+        return (
+            int(round(self.image_x_offset * width / self.image_width, 0)),
+            int(round(self.image_y_offset * height / self.image_height, 0)),
+        )
+        
+    def _simplified_positions(
+        self,
+        xpos:np.ndarray,
+        ypos:np.ndarray,
+        steps:np.ndarray | None = None,
+        ) -> Tuple[np.ndarray, np.ndarray, np.ndarray | None]:
+        """Drop moves within one pixel from scaled positions, if enabled
+        
+        The result is drawn exactly like the given positions. PIL truncates
+        coordinates, so RenderMode.LINE drops every move within a pixel,
+        RenderMode.DILATE only the interior of runs on one pixel, as the
+        segments are sampled from their sub-pixel end points. Anti-aliased
+        coverage depends on every position, so RenderMode.ANTIALIAS is not
+        simplified. Positions where the palette color changes are kept.
+        
+        Return:
+            (xpos, ypos, steps)
+        """
+        if not self.image_simplify or len(xpos) < 3:
+            return xpos, ypos, steps
+        if self.image_render == RenderMode.ANTIALIAS:
+            logger.debug("Pixel space simplification does not apply to anti-aliased rendering")
+            return xpos, ypos, steps
+        
+        if steps is None:
+            steps = np.arange(len(xpos))
+        # the color of the segment before the first position decides, if it may be dropped
+        numbers = self._palette_numbers(np.concatenate(([max(int(steps[0]) - 1, 0)], steps)))
+        keep = numbers[1:] != numbers[:-1]
+        
+        line = self.image_render == RenderMode.LINE
+        index = collapse_pixel_runs(xpos, ypos, keep, centered=not line, ends=not line)
+        logger.debug("Simplified path from {} to {} positions", len(xpos), len(index))
+        return xpos[index], ypos[index], steps[index]
+        
+    def _deduplicated_segments(self, xpos:np.ndarray, ypos:np.ndarray) -> np.ndarray | None:
+        """Segments left to draw after skipping repeated pixel segments, if enabled
+        
+        Return:
+            segment indices, None to draw all segments
+        """
+        single_color = type(self.image_linecolor) is str or type(self.image_linecolor) is tuple
+        if not self.image_deduplicate or len(xpos) < 3:
+            return None
+        if not single_color and self.image_render == RenderMode.LINE:
+            logger.debug("Segment deduplication requires a single color or an index map render mode")
+            return None
+        
+        segments = unique_segments(xpos, ypos, last=not single_color)
+        logger.debug("Deduplicated {} to {} segments", len(xpos) - 1, len(segments))
+        return segments
+        
+    def _scaled_positions(
+        self,
+        scale:Union[Decimal, float],
+        steps:np.ndarray | None = None,
+        ) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the turtle positions multiplied by scale as float arrays
+        
+        Args:
+            scale (Decimal, float): scaling factor
+            steps (np.ndarray): only return the positions of these steps, defaults to all
+        """
+        self._check_pos_list_plausibility()
+        if steps is None:
+            xlist, ylist = self._xpos_list, self._ypos_list
+        else:
+            xlist = [self._xpos_list[step] for step in steps]
+            ylist = [self._ypos_list[step] for step in steps]
+        xpos = np.fromiter(xlist, dtype=np.float64, count=len(xlist)) * float(scale)
+        ypos = np.fromiter(ylist, dtype=np.float64, count=len(ylist)) * float(scale)
+        return xpos, ypos
+           
+    def _unit_positions(
+        self,
+        steps:np.ndarray,
+        known:Tuple[np.ndarray, np.ndarray, np.ndarray] | None = None,
+        ) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the turtle positions of sorted steps as float arrays
+        
+        Args:
+            steps (np.ndarray): sorted steps to return the positions of
+            known (Tuple(np.ndarray)): (steps, x positions, y positions) converted before,
+                    only the positions of the other steps are converted
+        """
+        if known is None:
+            return self._scaled_positions(1, steps)
+        
+        known_steps, known_xpos, known_ypos = known
+        index = np.minimum(np.searchsorted(known_steps, steps), len(known_steps) - 1)
+        found = known_steps[index] == steps
+        xpos = np.empty(len(steps), dtype=np.float64)
+        ypos = np.empty(len(steps), dtype=np.float64)
+        xpos[found] = known_xpos[index[found]]
+        ypos[found] = known_ypos[index[found]]
+        xpos[~found], ypos[~found] = self._scaled_positions(1, steps[~found])
+        return xpos, ypos
            
     def rotate(self) -> None:
         """Rotate turtle by theta"""
@@ -299,28 +767,66 @@ class TurtleNT:
         
         return True
     
+    def _half_turn_steps(self, total_steps:Union[int, str, Decimal, None] | None = None) -> int | None:
+        """Number of steps to calculate, if the rest of the run is a half-turn of them
+        
+        Return:
+            half of the heading period, None if symmetry is disabled or does not apply
+        """
+        if not self.symmetry or symmetry_order(self._theta) != 2:
+            return None
+        period = heading_period(self._theta)
+        if total_steps is not None and Decimal(str(total_steps)) != period:
+            return None
+        if self._step_num > period // 2 or period >= self.steplimit:
+            return None
+        return period // 2
+    
+    def _complete_half_turn(self) -> None:
+        """Append the path calculated so far turned by 180° about the middle of its end points
+        
+        Step p + j heads in the opposite direction of step j, so position p + j
+        is position p minus position j and the turtle ends up at the origin.
+        """
+        half = int(self._step_num)
+        xhalf = self._xpos_list[half]
+        yhalf = self._ypos_list[half]
+        self._xpos_list.extend([xhalf - x for x in self._xpos_list[1:half + 1]])
+        self._ypos_list.extend([yhalf - y for y in self._ypos_list[1:half + 1]])
+        
+        self._step_num = Decimal(2 * half)
+        self._angle = self._theta * self._step_num * (self._step_num - 1) / 2
+        self._angle_cleanup()
+        logger.debug("Completed {} steps by a half-turn of the first {} steps", self._step_num, half)
+    
     def euler_spiral(
         self,
         total_steps:Union[int, str, Decimal, None] | None = None
         ) -> None:
         """Go forward in euler spiral until total number of steps reaches total_steps
         
+        Without total_steps the turtle runs exactly to its origin return. If it
+        never returns, it runs one heading period, which shows the full shape.
+        
         Return:
             duration of euler spiral run
         """
         return_value = None
-        if total_steps is not None:
+        half = self._half_turn_steps(total_steps)
+        if half is not None:
+            return_value = self._euler_spiral(half)
+            self._complete_half_turn()
+        elif total_steps is not None:
             self._euler_spiral(total_steps)
         else:
-            for total_steps in sorted(self.origin_return_estimation()):
-                if total_steps <= 1:
-                    continue
+            total_steps = self.origin_return_steps()
+            if total_steps is None:
+                logger.warning("Turtle never returns home for theta {}, one heading period drifts away", self._theta)
+                self._euler_spiral(heading_period(self._theta))
+                return_value = False
+            else:
                 return_value = self._euler_spiral(total_steps)
-                if self.is_home():
-                    break
-                if not return_value:
-                    break
-                    
+        
         if self.is_home():
             logger.success("Turtle did return home after {} steps", self._step_num)
         else:
@@ -379,45 +885,213 @@ class TurtleNT:
         autoscale:bool | None = True,
         force_redraw:bool | None = False,
         mark_origin:bool | None = False,
-    ) -> Image:
+        sizes:List[Tuple[int, int]] | None = None,
+    ) -> Union[Image.Image, List[Image.Image]]:
         """Create image from current position list.
-        Returns last image, if image exists, except force_redraw == True
+        Returns last image, if it is up to date, and draws only the new segments,
+        if the path was extended with unchanged render settings.
         
         Args:
             autoscale (bool): Scale the turtle positions to fit into image size
-            force_redraw (bool): Redraw image, even an image exists allready.
+            force_redraw (bool): Redraw image from scratch, even an image exists allready.
             mark_origin (bool): draw a red dot at the origin position of the turtle.
+            sizes (List(Tuple(int, int))): if not None, return a list of new images
+                    of these (width, height) sizes instead of the turtle image
         """
-        if type(self._image) is Image.Image and not force_redraw:
-            return self._image
+        if sizes is not None:
+            return self._get_sized_images(sizes, autoscale, mark_origin)
         
-        logger.debug("Drawing new {}x{} image.", self.image_width, self.image_height)
         self._check_pos_list_plausibility()
         
-        timer_start = perf_counter()
-        self._clear_image()
         scale = Decimal('1.0')
         if autoscale:
             scale = self._autoscale()
-        self._scale = scale
+        key = self._image_render_key(scale)
         
-        self._image_draw_num = 0
-        self._draw_point(self._xpos_list[0], self._ypos_list[0])
-        for self._image_draw_num in range(len(self._xpos_list) - 1):
-            self._draw_line(
-                self._xpos_list[self._image_draw_num] * scale,
-                self._ypos_list[self._image_draw_num] * scale,
-                self._xpos_list[self._image_draw_num + 1] * scale,
-                self._ypos_list[self._image_draw_num + 1] * scale
-                )
-            if self._image_draw_num % 100000 == 0 and self._image_draw_num > 0:
-                steps_per_second = self._image_draw_num / (perf_counter() - timer_start)
-                logger.debug("Drawing step {} out of {}, remaining time estimate {}s", self._image_draw_num, len(self._xpos_list), float(len(self._xpos_list) - self._image_draw_num) / steps_per_second)
+        extend = not force_redraw and self._image_extendable(key, mark_origin)
+        if extend and self._image_drawn_num == len(self._xpos_list) and self._image_mark_origin == mark_origin:
+            return self._image
+        steps = None
+        half = None
+        if extend:
+            logger.debug("Extending {}x{} image from step {}.", self.image_width, self.image_height, self._image_drawn_num - 1)
+            steps = np.arange(self._image_drawn_num - 1, len(self._xpos_list))
+        else:
+            logger.debug("Drawing new {}x{} image.", self.image_width, self.image_height)
+            self._scale = scale
+            self._image_key = key
+            half = self._half_turn_render_steps()
+            if half is not None:
+                steps = np.arange(half + 1)
+        xpos, ypos = self._scaled_positions(scale, steps)
+        xpos, ypos, steps = self._simplified_positions(xpos, ypos, steps)
+        segments = self._deduplicated_segments(xpos, ypos)
+        offset = (self.image_x_offset, self.image_y_offset)
+        
+        if self.image_render != RenderMode.LINE:
+            self._index_map, self._coverage_map = self._render_index_map(
+                xpos, ypos, self.image_width, self.image_height, offset, steps,
+                self._index_map if extend else None,
+                self._coverage_map if extend else None,
+                segments,
+                step_numbers=half is not None,
+            )
+            if half is not None:
+                self._compose_half_turn(half, scale, offset)
+            self._image = self._index_map_image(self._index_map, self.image_linewidth, self._coverage_map)
+            self._image_draw = ImageDraw.Draw(self._image)
+        elif extend:
+            self._draw_path(xpos, ypos, segments, steps=steps)
+        else:
+            self._image = self._render_image(xpos, ypos, self.image_width, self.image_height, offset, self.image_linewidth, steps, segments=segments)
+            self._image_draw = ImageDraw.Draw(self._image)
+        self._image_drawn_num = len(self._xpos_list)
+        self._image_drawn_step_num = self._step_num
+        self._image_mark_origin = mark_origin
         
         if mark_origin:
             self._draw_point(0, 0, 4 * self.image_linewidth, "red")
         
         return self._image
+        
+    def _half_turn_render_steps(self) -> int | None:
+        """Number of steps to rasterize, if the rest of the path is a half-turn of them
+        
+        Return:
+            half of the heading period, None if symmetry is disabled or does not apply
+        """
+        if not self.symmetry or symmetry_order(self._theta) != 2:
+            return None
+        if self.image_render == RenderMode.LINE:
+            logger.debug("Half-turn composition requires an index map render mode")
+            return None
+        period = heading_period(self._theta)
+        if len(self._xpos_list) - 1 != period:
+            return None
+        return period // 2
+        
+    def _compose_half_turn(self, half:int, scale:Decimal, offset:Tuple[int, int]) -> None:
+        """Complete index and coverage map of the first half steps by their half-turn
+        
+        The rotated pixels of step j belong to step half + j. The center of
+        rotation is the middle between origin and position half.
+        """
+        center = (
+            int(round(float(self._xpos_list[half] * scale) + 2 * offset[0])),
+            int(round(float(self._ypos_list[half] * scale) + 2 * offset[1])),
+        )
+        rotated = rotate_half_turn(self._index_map, center)
+        rotated[rotated > 0] += half
+        np.maximum(self._index_map, rotated, out=self._index_map)
+        if self._coverage_map is not None:
+            np.maximum(self._coverage_map, rotate_half_turn(self._coverage_map, center), out=self._coverage_map)
+        logger.debug("Composed steps {} to {} by a half-turn about pixel {}", half, 2 * half, (center[0] / 2, center[1] / 2))
+        
+    def _image_render_key(self, scale:Decimal) -> tuple:
+        """Everything the pixels of the turtle image depend on besides the path"""
+        return (
+            scale,
+            self.image_width,
+            self.image_height,
+            self.image_x_offset,
+            self.image_y_offset,
+            self.image_background,
+            copy.deepcopy(self.image_linecolor),
+            self.image_linewidth,
+            self.image_render,
+            self.image_simplify,
+            self.image_deduplicate,
+            self.image_indexed,
+        )
+        
+    def _image_extendable(self, key:tuple, mark_origin:bool | None = False) -> bool:
+        """Check if the existing image can be completed by drawing the new segments only
+        
+        This requires unchanged render settings, scale and canvas, a path that was
+        only extended and colors that do not depend on the total number of steps,
+        or an unchanged number of steps. An origin mark is redrawn on top after
+        extending, but cannot be removed.
+        
+        Args:
+            key (tuple): render key of the image to draw, see _image_render_key
+            mark_origin (bool): the image to draw has an origin mark
+        """
+        if type(self._image) is not Image.Image or self._image_drawn_num < 1:
+            return False
+        if self.image_render != RenderMode.LINE and self._index_map is None:
+            return False
+        if self.image_render == RenderMode.ANTIALIAS and self._coverage_map is None:
+            return False
+        if self._image_key != key:
+            return False
+        if self._image_drawn_num > len(self._xpos_list):
+            return False
+        if self._image_mark_origin and not mark_origin:
+            return False
+        if type(self.image_linecolor) is str or type(self.image_linecolor) is tuple:
+            return True
+        return self._image_drawn_step_num == self._step_num
+        
+    def set_image_bounds(
+        self,
+        bounds:Tuple[Decimal, Decimal, Decimal, Decimal] | None,
+        ) -> None:
+        """Fix the boundaries used for autoscaling instead of the reached positions
+        
+        With fixed boundaries the scale does not change while the spiral is
+        extended, so get_image only needs to draw the new segments.
+        
+        Args:
+            bounds (Tuple(Decimal)): (xmin, ymin, xmax, ymax), None to autoscale to the positions
+        """
+        if bounds is not None:
+            bounds = tuple(Decimal(str(value)) for value in bounds)
+        self._image_bounds = bounds
+      
+    def _get_sized_images(
+        self,
+        sizes:List[Tuple[int, int]],
+        autoscale:bool | None = True,
+        mark_origin:bool | None = False,
+    ) -> List[Image.Image]:
+        """Rasterize the current position list into images of several sizes
+        
+        The positions are converted and the boundaries are calculated once,
+        every size only scales the shared coordinate arrays. Offsets and line
+        width are taken relative to image_width and image_height.
+        
+        Args:
+            sizes (List(Tuple(int, int))): (width, height) of the images
+            autoscale (bool): Scale the turtle positions to fit into each image size
+            mark_origin (bool): draw a red dot at the origin position of the turtle.
+        """
+        xunit, yunit = None, None
+        
+        images = []
+        for width, height in sizes:
+            logger.debug("Drawing new {}x{} image.", width, height)
+            scale = float(self._autoscale(width, height)) if autoscale else 1.0
+            linewidth = max(1, int(round(self.image_linewidth * min(width / self.image_width, height / self.image_height), 0)))
+            level = self._lod_level(scale)
+            if level is not None:
+                xlevel, ylevel, steps = level
+                xpos, ypos, steps = self._simplified_positions(xlevel * scale, ylevel * scale, steps)
+            else:
+                if xunit is None:
+                    xunit, yunit = self._scaled_positions(1)
+                xpos, ypos, steps = self._simplified_positions(xunit * scale, yunit * scale)
+            images.append(self._render_image(
+                xpos,
+                ypos,
+                width,
+                height,
+                self._sized_offset(width, height),
+                linewidth,
+                steps,
+                mark_origin,
+                self._deduplicated_segments(xpos, ypos),
+            ))
+        return images
       
     def get_pos(self) -> Tuple[Decimal]:
         """Return the current position of the turtle"""
@@ -461,8 +1135,28 @@ class TurtleNT:
     def save_image(
         self,
         filename:str | None = None,
+        sizes:List[Tuple[int, int]] | None = None,
         ) -> None:
-        """Store the image to file"""
+        """Store the image to file
+        
+        Args:
+            filename (str): path of the image file, autogenerated if None
+            sizes (List(Tuple(int, int))): if not None, store one image per
+                    (width, height) size, with the size appended to the filename
+        """
+        
+        if sizes is not None:
+            images = self.get_image(sizes=sizes)
+            if filename is None:
+                if self._scale is None:
+                    self._scale = self._autoscale()
+                filename = self.get_filename()
+            root, extension = os.path.splitext(filename)
+            for (width, height), image in zip(sizes, images):
+                sized_filename = root + "_" + str(width) + "x" + str(height) + extension
+                logger.info("Storing image file at {}", sized_filename)
+                image.save(sized_filename)
+            return
         
         image = self.get_image()
         
@@ -472,6 +1166,559 @@ class TurtleNT:
         logger.info("Storing image file at {}", filename)
         image.save(filename)
     
+    def preview(
+        self,
+        levels:Tuple[Tuple[int, float], ...] | None = DEFAULT_PREVIEW_LEVELS,
+        callback:Callable[[Image.Image, int, float], None] | None = None,
+        ) -> Iterator[Image.Image]:
+        """Progressively render preview images of the current positions
+        
+        Every level renders every decimation-th position into a canvas of
+        resolution times the image size. The decimation is raised to at least
+        1 / resolution, which keeps the segments as long in pixels as the steps
+        of the full image, and positions converted for an earlier level are
+        reused. The default levels first add steps at a quarter resolution and
+        then raise the resolution, so the first image is available long before
+        a full get_image would finish and all of them together take less time.
+        The preview does not touch the image returned by get_image.
+        
+        Args:
+            levels (Tuple(Tuple(int, float))): (decimation, resolution) per preview image
+            callback (Callable): called with image, decimation and resolution of each preview
+            
+        Return:
+            iterator over the preview images
+        """
+        self._check_pos_list_plausibility()
+        
+        known = None
+        for decimation, resolution in levels:
+            timer_start = perf_counter()
+            width = max(1, int(round(self.image_width * resolution, 0)))
+            height = max(1, int(round(self.image_height * resolution, 0)))
+            linewidth = max(1, int(round(self.image_linewidth * resolution, 0)))
+            
+            scale = self._autoscale(width, height)
+            level = self._lod_level(float(scale)) if decimation == 1 else None
+            if level is not None:
+                xlevel, ylevel, steps = level
+                xpos, ypos = xlevel * float(scale), ylevel * float(scale)
+            else:
+                steps = np.arange(0, len(self._xpos_list), max(decimation, int(math.ceil(1 / resolution))))
+                if steps[-1] != len(self._xpos_list) - 1:
+                    steps = np.append(steps, len(self._xpos_list) - 1)
+                xunit, yunit = self._unit_positions(steps, known)
+                known = (steps, xunit, yunit)
+                xpos, ypos = xunit * float(scale), yunit * float(scale)
+            xpos, ypos, steps = self._simplified_positions(xpos, ypos, steps)
+            
+            segments = self._deduplicated_segments(xpos, ypos)
+            image = self._render_image(xpos, ypos, width, height, self._sized_offset(width, height), linewidth, steps, segments=segments)
+            logger.debug("Preview with {} positions at {}x{} took {}s", len(steps), width, height, perf_counter() - timer_start)
+            
+            if callback is not None:
+                callback(image, decimation, resolution)
+            yield image
+    
+    def save_image_strips(
+        self,
+        filename:str | None = None,
+        strip_height:int | None = DEFAULT_STRIP_HEIGHT,
+        autoscale:bool | None = True,
+        mark_origin:bool | None = False,
+        ) -> None:
+        """Render the image in horizontal strips and stream them into a PNG file
+        
+        Only one strip of image_width x strip_height pixels is held in memory,
+        which allows print resolutions far beyond the size of a full canvas.
+        Every strip draws or rasterizes only the segments crossing its rows and
+        a margin for line width and dilation, after the same simplification and
+        deduplication as get_image, so the result equals the image of get_image.
+        The half-turn composition of symmetry is not applied, the full path is
+        rasterized instead.
+        
+        Args:
+            filename (str): path of the PNG file, autogenerated if None
+            strip_height (int): number of image rows rendered at once
+            autoscale (bool): Scale the turtle positions to fit into image size
+            mark_origin (bool): draw a red dot at the origin position of the turtle.
+        """
+        scale = Decimal('1.0')
+        if autoscale:
+            scale = self._autoscale()
+        self._scale = scale
+        
+        if filename is None:
+            filename = os.path.splitext(self.get_filename())[0] + ".png"
+        
+        xpos, ypos = self._scaled_positions(scale)
+        xpos, ypos, steps = self._simplified_positions(xpos, ypos)
+        segments = self._deduplicated_segments(xpos, ypos)
+        if segments is None:
+            segments = np.arange(len(xpos) - 1)
+        ypos = ypos + self.image_y_offset
+        # rows touched by a segment including line width, round joins, dilation and anti-aliased edges
+        margin = self.image_linewidth + 2
+        segment_top = np.minimum(ypos[segments], ypos[segments + 1]) - margin
+        segment_bottom = np.maximum(ypos[segments], ypos[segments + 1]) + margin
+        origin_radius = 2 * self.image_linewidth + 1
+        
+        logger.info("Streaming {}x{} image in strips of {} rows to {}", self.image_width, self.image_height, strip_height, filename)
+        palette = self._indexed_palette() if self.image_indexed else None
+        with PNGStreamWriter(
+            filename, self.image_width, self.image_height, self._image_mode(),
+            palette=palette, transparency=self._indexed_transparency(),
+        ) as writer:
+            for top in range(0, self.image_height, strip_height):
+                height = min(strip_height, self.image_height - top)
+                # PIL rounds negative coordinates differently and dilation reaches
+                # beyond the rows of a segment, so the strip is drawn with margin
+                # rows above and below and cropped afterwards
+                offset = (self.image_x_offset, margin - top)
+                crossing = segments[(segment_bottom >= top) & (segment_top < top + height)]
+                logger.debug("Drawing {} segments into strip at row {}", len(crossing), top)
+                
+                if self.image_render != RenderMode.LINE:
+                    index_map, coverage = self._render_index_map(
+                        xpos, ypos, self.image_width, height + 2 * margin, offset, steps, segments=crossing,
+                    )
+                    # pixels beyond the image are clipped before dilation in get_image
+                    for pixels in (index_map, coverage):
+                        if pixels is not None:
+                            pixels[:max(0, margin - top)] = 0
+                            pixels[self.image_height - top + margin:] = 0
+                    strip = self._index_map_image(index_map, self.image_linewidth, coverage)
+                    draw = ImageDraw.Draw(strip)
+                else:
+                    strip = self._new_image(self.image_width, height + 2 * margin)
+                    draw = ImageDraw.Draw(strip)
+                    self._image_draw_num = 0
+                    if ypos[0] + margin >= top and ypos[0] - margin < top + height:
+                        self._draw_point(xpos[0], ypos[0], draw=draw, offset=offset)
+                    self._draw_path(xpos, ypos, crossing, draw, offset, steps)
+                
+                if mark_origin and abs(self.image_y_offset - top - height / 2) <= height / 2 + origin_radius:
+                    self._draw_point(0, self.image_y_offset, 4 * self.image_linewidth, "red", draw, offset)
+                writer.write(strip.crop((0, margin, self.image_width, margin + height)))
+    
+    def save_svg(
+        self,
+        filename:str | None = None,
+        tolerance:float | None = 1.0,
+        autoscale:bool | None = True,
+        mark_origin:bool | None = False,
+        chunk_size:int | None = DEFAULT_SVG_CHUNK_SIZE,
+        ) -> None:
+        """Stream the path as SVG vector graphic of image_width x image_height
+        
+        The positions are converted and simplified in chunks on a grid of
+        tolerance pixels, so the memory use is bounded and the file size
+        follows the visible detail instead of the step number. Every run of
+        steps in the same palette color is written as one <path> element.
+        
+        Args:
+            filename (str): path of the SVG file, autogenerated if None
+            tolerance (float): grid size in pixels the path is simplified on
+            autoscale (bool): Scale the turtle positions to fit into image size
+            mark_origin (bool): draw a red dot at the origin position of the turtle.
+            chunk_size (int): number of positions converted at once
+        """
+        scale = Decimal('1.0')
+        if autoscale:
+            scale = self._autoscale()
+        self._scale = scale
+        
+        if filename is None:
+            filename = os.path.splitext(self.get_filename())[0] + ".svg"
+        
+        self._check_pos_list_plausibility()
+        colors = ["#{:02x}{:02x}{:02x}".format(*color) for color in self._palette_rgb()]
+        total = len(self._xpos_list)
+        written = 0
+        
+        logger.info("Streaming SVG with tolerance {} pixels to {}", tolerance, filename)
+        with open(filename, "w") as file:
+            file.write(
+                '<svg xmlns="http://www.w3.org/2000/svg" width="{0}" height="{1}" viewBox="0 0 {0} {1}">\n'.format(
+                    self.image_width, self.image_height,
+                )
+            )
+            if self.image_background is not None:
+                background = ImageColor.getrgb(self.image_background) if type(self.image_background) is str else self.image_background
+                file.write('<rect width="100%" height="100%" fill="#{:02x}{:02x}{:02x}"/>\n'.format(*background[:3]))
+            file.write(
+                '<g transform="translate({} {})" fill="none" stroke-width="{}" stroke-linecap="round" stroke-linejoin="round">\n'.format(
+                    self.image_x_offset, self.image_y_offset, self.image_linewidth,
+                )
+            )
+            
+            color = None
+            for start in range(0, total, chunk_size):
+                # chunks overlap by one position to connect the segments
+                steps = np.arange(max(start - 1, 0), min(start + chunk_size, total))
+                xpos, ypos = self._scaled_positions(scale, steps)
+                numbers = self._palette_numbers(steps)
+                if len(steps) > 2:
+                    keep = np.zeros(len(steps), dtype=bool)
+                    keep[1:] = numbers[1:] != numbers[:-1]
+                    index = simplify_path(xpos / tolerance, ypos / tolerance, keep)
+                    xpos, ypos, numbers = xpos[index], ypos[index], numbers[index]
+                written += len(xpos) - (start > 0)
+                
+                points = ["{:.2f} {:.2f}".format(x, y) for x, y in zip(xpos.tolist(), ypos.tolist())]
+                first = 1 if start > 0 else 0
+                if color is None:
+                    color = int(numbers[0])
+                    file.write('<path stroke="{}" d="M{}'.format(colors[color], points[0]))
+                    first = 1
+                # a new path starts wherever the color of the following segments changes
+                changes = np.nonzero(numbers[first:] != np.concatenate(([color], numbers[first:-1])))[0] + first
+                for change in changes.tolist() + [len(points)]:
+                    if first < change:
+                        file.write(" L" + " ".join(points[first:change]))
+                    if change == len(points):
+                        break
+                    color = int(numbers[change])
+                    file.write(' L{}"/>\n<path stroke="{}" d="M{}'.format(points[change], colors[color], points[change]))
+                    first = change + 1
+            file.write('"/>\n</g>\n')
+            
+            if mark_origin:
+                file.write(
+                    '<circle cx="{}" cy="{}" r="{}" fill="red"/>\n'.format(
+                        self.image_x_offset, self.image_y_offset, 2 * self.image_linewidth,
+                    )
+                )
+            file.write("</svg>\n")
+        logger.debug("Wrote {} out of {} positions to {}", written, total, filename)
+    
+    def _get_segment_grid(self) -> SegmentGrid:
+        """Spatial index of the path segments in turtle coordinates, built once per path"""
+        if self._segment_grid is None or len(self._segment_grid) != len(self._xpos_list) - 1:
+            timer_start = perf_counter()
+            xpos, ypos = self._scaled_positions(1)
+            self._segment_grid = SegmentGrid(xpos, ypos)
+            logger.debug(
+                "Indexed {} segments in {}x{} grid cells in {}s",
+                len(self._segment_grid), self._segment_grid.columns, self._segment_grid.rows, perf_counter() - timer_start,
+            )
+        return self._segment_grid
+    
+    def render_viewport(
+        self,
+        xmin:Union[int, float, Decimal],
+        ymin:Union[int, float, Decimal],
+        xmax:Union[int, float, Decimal],
+        ymax:Union[int, float, Decimal],
+        size:Tuple[int, int] | None = None,
+        mark_origin:bool | None = False,
+        ) -> Image.Image:
+        """Render the part of the path within a rectangle in turtle coordinates
+        
+        The rectangle is scaled to fit into the image and centered. Only the
+        segments registered in the grid cells that intersect the rectangle are
+        drawn, so zooming into a long path does not touch all its segments.
+        
+        Args:
+            xmin (int, float, Decimal): left boundary of the viewport
+            ymin (int, float, Decimal): top boundary of the viewport
+            xmax (int, float, Decimal): right boundary of the viewport
+            ymax (int, float, Decimal): bottom boundary of the viewport
+            size (Tuple(int, int)): (width, height) of the image, defaults to image_width and image_height
+            mark_origin (bool): draw a red dot at the origin position of the turtle.
+        """
+        width, height = size if size is not None else (self.image_width, self.image_height)
+        xmin, ymin, xmax, ymax = (float(value) for value in (xmin, ymin, xmax, ymax))
+        if xmax <= xmin or ymax <= ymin:
+            raise ValueError("Viewport ({}, {}), ({}, {}) is empty".format(xmin, ymin, xmax, ymax))
+        
+        scale = min(width / (xmax - xmin), height / (ymax - ymin))
+        offset = (width / 2 - (xmin + xmax) / 2 * scale, height / 2 - (ymin + ymax) / 2 * scale)
+        margin = self.image_linewidth / scale
+        xmin, ymin, xmax, ymax = xmin - margin, ymin - margin, xmax + margin, ymax + margin
+        
+        level = self._lod_level(scale)
+        if level is not None:
+            # coarse levels are small enough to be culled without the grid
+            xpos, ypos, steps = level
+            segments = np.nonzero(
+                (np.maximum(xpos[:-1], xpos[1:]) >= xmin) & (np.minimum(xpos[:-1], xpos[1:]) <= xmax) &
+                (np.maximum(ypos[:-1], ypos[1:]) >= ymin) & (np.minimum(ypos[:-1], ypos[1:]) <= ymax)
+            )[0]
+        else:
+            grid = self._get_segment_grid()
+            xpos, ypos, steps = grid.xpos, grid.ypos, np.arange(len(grid.xpos))
+            segments = grid.query(xmin, ymin, xmax, ymax)
+        logger.debug("Drawing {} out of {} segments into {}x{} viewport", len(segments), len(xpos) - 1, width, height)
+        
+        positions = np.unique(np.concatenate((segments, segments + 1)))
+        if len(positions) == 0:
+            positions = np.zeros(1, dtype=np.int64)
+        return self._render_image(
+            xpos[positions] * scale,
+            ypos[positions] * scale,
+            width,
+            height,
+            offset,
+            self.image_linewidth,
+            steps[positions],
+            mark_origin,
+            np.searchsorted(positions, segments),
+        )
+    
+    def build_lod_pyramid(
+        self,
+        levels:int | None = DEFAULT_LOD_LEVELS,
+        ) -> List[Tuple[float, np.ndarray, np.ndarray, np.ndarray]]:
+        """Precompute successive pixel space decimations of the path
+        
+        Level n keeps the positions needed to draw the path at 1 / 2**n of the
+        resolution of the autoscaled image, every level is simplified from the
+        one before. Positions where the palette color changes are kept. The
+        pyramid is stored with the path and rebuilt once the path or the image
+        boundaries change.
+        
+        Args:
+            levels (int): number of levels, the default goes down to 1 / 1024
+        
+        Return:
+            list of (scale, x positions, y positions, steps) per level, positions in turtle coordinates
+        """
+        scale = float(self._autoscale())
+        key = (len(self._xpos_list), self._step_num, scale, levels)
+        if self._lod_pyramid is not None and self._lod_pyramid_key == key:
+            return self._lod_pyramid
+        
+        timer_start = perf_counter()
+        xpos, ypos = self._scaled_positions(1)
+        steps = np.arange(len(xpos))
+        numbers = self._palette_numbers(steps)
+        keep = np.zeros(len(xpos), dtype=bool)
+        keep[1:] = numbers[1:] != numbers[:-1]
+        
+        self._lod_pyramid = []
+        for level in range(levels):
+            level_scale = scale / 2 ** level
+            if len(xpos) > 2:
+                index = simplify_path(xpos * level_scale, ypos * level_scale, keep)
+                xpos, ypos, steps, keep = xpos[index], ypos[index], steps[index], keep[index]
+            self._lod_pyramid.append((level_scale, xpos, ypos, steps))
+        self._lod_pyramid_key = key
+        logger.debug(
+            "Built level of detail pyramid with {} positions in {}s",
+            [len(level_steps) for _scale, _xpos, _ypos, level_steps in self._lod_pyramid], perf_counter() - timer_start,
+        )
+        return self._lod_pyramid
+    
+    def _lod_level(self, scale:float) -> Tuple[np.ndarray, np.ndarray, np.ndarray] | None:
+        """Coarsest level of detail that still resolves scale, if simplification is enabled
+        
+        Return:
+            (x positions, y positions, steps) in turtle coordinates, None to use the full path
+        """
+        if not self.image_simplify or len(self._xpos_list) < 3:
+            return None
+        candidates = [level for level in self.build_lod_pyramid() if level[0] >= scale]
+        if not candidates:
+            return None
+        level_scale, xpos, ypos, steps = candidates[-1]
+        logger.debug("Using level of detail at scale {} with {} positions for scale {}", level_scale, len(steps), scale)
+        return xpos, ypos, steps
+    
+    def save_animation(
+        self,
+        filename:str | None = None,
+        frames:int | None = DEFAULT_ANIMATION_FRAMES,
+        total_steps:Union[int, str, Decimal, None] | None = None,
+        duration:int | None = 40,
+        mark_origin:bool | None = False,
+        ) -> None:
+        """Export the growth of the spiral as animation
+        
+        Frame n shows the path up to n / frames of total_steps. The scale is
+        fixed from the boundaries of the final path, predicted if the spiral
+        still has to be calculated, and the colors are spread over total_steps,
+        so every frame only adds its new segments to a persistent canvas.
+        PNG files are streamed as APNG frame by frame. GIF files are written by
+        PIL, which collects all frames in memory before writing, so long
+        animations should use APNG or numbered files. A filename with a format
+        field like "frame_{:05d}.png" writes numbered PNG files in a background
+        thread.
+        
+        Args:
+            filename (str): path of the animation or numbered file pattern, autogenerated APNG if None
+            frames (int): number of frames
+            total_steps (int, str, Decimal): steps of the last frame, defaults to the current
+                    step number, the spiral is advanced frame by frame if needed
+            duration (int): display duration of every frame in ms
+            mark_origin (bool): draw a red dot at the origin position of the turtle.
+        """
+        if frames < 1:
+            raise ValueError("An animation needs at least one frame, got {}".format(frames))
+        total_steps = int(self._step_num if total_steps is None else total_steps)
+        if total_steps < 1:
+            raise ValueError("An animation needs at least one step, got {}".format(total_steps))
+        
+        bounds = None
+        if total_steps != self._step_num and self._image_bounds is None:
+            bounds = self.predict_bounds(total_steps)
+        scale = self._autoscale(bounds=bounds)
+        self._scale = scale
+        
+        if filename is None:
+            filename = os.path.splitext(self.get_filename())[0] + ".png"
+        frame_steps = sorted(set(max(1, int(round(total_steps * (num + 1) / frames, 0))) for num in range(frames)))
+        if total_steps > self._step_num and total_steps >= self.steplimit:
+            logger.warning("Animation is limited to steps below step limit {}", self.steplimit)
+            frame_steps = [steps for steps in frame_steps if steps <= self._step_num or steps < self.steplimit]
+            if not frame_steps:
+                raise ValueError(
+                    "No frame of the animation up to {} steps is below step limit {}".format(total_steps, self.steplimit)
+                )
+        
+        logger.info("Writing {} frames of up to {} steps to {}", len(frame_steps), frame_steps[-1], filename)
+        images = self._animation_frames(scale, frame_steps, mark_origin)
+        if "{" in filename:
+            self._save_numbered_frames(filename, images)
+        elif os.path.splitext(filename)[1].lower() == ".png":
+            palette = self._indexed_palette() if self.image_indexed else None
+            with APNGStreamWriter(
+                filename, self.image_width, self.image_height, len(frame_steps), self._image_mode(), duration,
+                palette=palette, transparency=self._indexed_transparency(),
+            ) as writer:
+                for image in images:
+                    writer.write(image)
+        else:
+            next(images).save(filename, save_all=True, append_images=images, duration=duration, loop=0)
+    
+    def _animation_frames(
+        self,
+        scale:Decimal,
+        frame_steps:List[int],
+        mark_origin:bool | None = False,
+        ) -> Iterator[Image.Image]:
+        """Draw the new segments of every frame onto a persistent canvas
+        
+        Return:
+            iterator over copies of the canvas after each frame
+        """
+        offset = (self.image_x_offset, self.image_y_offset)
+        index_map, coverage = None, None
+        canvas, draw = None, None
+        drawn = 0
+        
+        self._palette_step_num = Decimal(frame_steps[-1])
+        try:
+            for steps in frame_steps:
+                if steps > self._step_num:
+                    self._euler_spiral(steps)
+                positions = np.arange(drawn, steps + 1)
+                xpos, ypos = self._scaled_positions(scale, positions)
+                xpos, ypos, positions = self._simplified_positions(xpos, ypos, positions)
+                
+                if self.image_render != RenderMode.LINE:
+                    index_map, coverage = self._render_index_map(
+                        xpos, ypos, self.image_width, self.image_height, offset, positions, index_map, coverage,
+                    )
+                    image = self._index_map_image(index_map, self.image_linewidth, coverage)
+                elif canvas is None:
+                    canvas = self._render_image(xpos, ypos, self.image_width, self.image_height, offset, self.image_linewidth, positions)
+                    draw = ImageDraw.Draw(canvas)
+                    image = canvas.copy()
+                else:
+                    self._draw_path(xpos, ypos, draw=draw, offset=offset, steps=positions)
+                    image = canvas.copy()
+                
+                if mark_origin:
+                    self._draw_point(0, 0, 4 * self.image_linewidth, "red", ImageDraw.Draw(image), offset)
+                logger.debug("Animation frame at step {} out of {}", steps, frame_steps[-1])
+                drawn = steps
+                yield image
+        finally:
+            self._palette_step_num = None
+    
+    def _save_numbered_frames(self, filename:str, images:Iterator[Image.Image]) -> None:
+        """Save frames as numbered files in a background thread while the next ones are drawn
+        
+        Args:
+            filename (str): file pattern, formatted with the frame number
+            images (Iterator(Image)): frames to be saved
+        """
+        queue = Queue(maxsize=DEFAULT_ANIMATION_QUEUE_SIZE)
+        errors = []
+        
+        def write_frames() -> None:
+            while True:
+                item = queue.get()
+                if item is None:
+                    return
+                num, image = item
+                try:
+                    image.save(filename.format(num))
+                except Exception as error:
+                    errors.append(error)
+        
+        writer = Thread(target=write_frames, daemon=True)
+        writer.start()
+        try:
+            for num, image in enumerate(images):
+                if errors:
+                    break
+                queue.put((num, image))
+        finally:
+            queue.put(None)
+            writer.join()
+        if errors:
+            raise errors[0]
+    
+    def predict_bounds(
+        self,
+        total_steps:Union[int, str, Decimal],
+        ) -> Tuple[Decimal, Decimal, Decimal, Decimal]:
+        """Predict the boundaries of the spiral after total_steps without running it
+        
+        The headings repeat after one heading period, so every following period
+        draws the same shape moved by the drift of the first one. Only one
+        period is calculated, the extremes of later periods follow from the drift.
+        The result can be passed to set_image_bounds to fix the scale up front.
+        
+        Return:
+            (xmin, ymin, xmax, ymax)
+        """
+        total_steps = int(total_steps)
+        period = heading_period(self._theta)
+        residues, modulus = heading_residues(self._theta, 0, min(total_steps, period))
+        angles = residues.astype(np.float64) * (2 * math.pi / modulus)
+        stepsize = float(self.stepsize)
+        
+        bounds = []
+        for positions in (
+            np.concatenate(([0.0], np.cumsum(np.cos(angles)))) * stepsize,
+            np.concatenate(([0.0], np.cumsum(np.sin(angles)))) * stepsize,
+        ):
+            if total_steps <= period:
+                bounds.append((positions.min(), positions.max()))
+                continue
+            cycles, rest = divmod(total_steps, period)
+            drift = positions[-1]
+            # extremes of the full periods are reached in the first or last one
+            candidates = [
+                (positions.min(), positions.max()),
+                (positions.min() + (cycles - 1) * drift, positions.max() + (cycles - 1) * drift),
+                (positions[:rest + 1].min() + cycles * drift, positions[:rest + 1].max() + cycles * drift),
+            ]
+            bounds.append((min(low for low, _high in candidates), max(high for _low, high in candidates)))
+        
+        (xmin, xmax), (ymin, ymax) = bounds
+        logger.debug("Predicted boundary corners at {} steps are ({}, {}), ({}, {})", total_steps, xmin, ymin, xmax, ymax)
+        return tuple(Decimal(str(float(value))) for value in (xmin, ymin, xmax, ymax))
+    
+    def origin_return_steps(self) -> int | None:
+        """Exact number of steps until the turtle is home, None if it never returns"""
+        if self.origin_return_store is not None:
+            return self.origin_return_store.return_steps(self._theta)
+        return origin_return_steps(self._theta)
+    
     def dominant_angles(self) -> List[Decimal]:
         """Return the dominant angles of theta"""
         
@@ -521,72 +1768,12 @@ class TurtleNT:
                 return self._origin_return_estimation
         
         self._origin_return_estimation_theta = self._theta
-        self._origin_return_estimation = []
-        
-        analyze = self._theta
-        theta_decimals = decimal_places(analyze)
         
-        self._origin_return_dominant_angles = []
-        quotients = []
-        int_quotients = []
-        
-        # Identify the dominant angles
-        for angle, quotient, _a in TURTLEFUN_QUOTIENT_LIST:
-            
-            angle_decimal = decimal_places(angle) 
-            if angle_decimal > theta_decimals:
-                continue
-            
-            while analyze >= angle:
-                self._origin_return_dominant_angles.append(angle)
-                quotients.append(quotient)
-                int_quotients.append(int(quotient))
-                analyze -= angle
-                
-            if analyze <= 0:
-                break
-        
-        lcm = math.lcm(*int_quotients) # least common multiple
-
-        cycle_angle_rot_sum = (Decimal(lcm) * (Decimal(lcm) + Decimal('1')) / Decimal('2'))
-        cycle_angle = Decimal(cycle_angle_rot_sum) * Decimal(str(self._theta)) % Decimal('360')
-        
-        required_cycles = Decimal('1')
-        while (required_cycles * cycle_angle) % Decimal('360') != 0:
-            required_cycles += Decimal('1')
-        steps_upper_limit = lcm * required_cycles
-        
-        # somehow the calculated steps are an upper limit for the experimental steps.
-        # let's get the prime factors of the calculated steps and create a list of the
-        # possible origin return steps.
-        
-        primes = []
-        prime = 1
-        steps = steps_upper_limit
-        while True:
-            prime = nextprime(prime)
-            while round(steps / Decimal(str(prime)), 0) == steps / Decimal(str(prime)):
-                steps /= Decimal(str(prime))
-                primes.append(Decimal(str(prime)))
-            
-            if steps == 1:
-                break
-            if prime > steps:
-                logger.critical("Failed to calculate prime factors!")
-                exit(1)
-        
-        combination = []
-        for r in range(1, len(primes) + 1):
-            combination += itertools.combinations(primes, r)
-        
-        logger.trace("Identified prime combinations for {} are {}", steps_upper_limit, combination)
-        
-        self._origin_return_estimation = [steps_upper_limit]
-        for primelist in combination:
-            prime = math.prod(primelist)
-            steps = steps_upper_limit / Decimal(str(prime))
-            if steps not in self._origin_return_estimation and \
-                (steps * (steps + Decimal('1')) / Decimal('2') * Decimal(str(self._theta))) % Decimal('360') == 0:
-                    self._origin_return_estimation.append(steps)
-
+        if self.origin_return_store is not None:
+            self._origin_return_dominant_angles = self.origin_return_store.dominant_angles(self._theta)
+            candidates = self.origin_return_store.estimation(self._theta)
+        else:
+            self._origin_return_dominant_angles = dominant_angles(self._theta)
+            candidates = origin_return_estimation(self._theta)
+        self._origin_return_estimation = [Decimal(steps) for steps in candidates]
         return self._origin_return_estimation
@@ -0,0 +1,162 @@
+"""tests/test_originreturn.py"""
+
+from decimal import Decimal
+import math
+import pytest
+
+from turtlefunt import originreturn
+from turtlefunt.originreturn import (
+    dominant_angle_decomposition, dominant_angles, estimate_origin_return, heading_period, heading_residues,
+    normalized_theta, origin_return_candidates, origin_return_estimation, origin_return_mismatches,
+    origin_return_steps, period_drift, smooth_factorization, sorted_divisors, symmetry_order, theta_fraction,
+    theta_scaled, thetas_with_return_steps, verify_origin_return,
+)
+from .turtle_originreturnsamples import TURTLE_ORIGIN_RETURN_SAMPLES
+
+
+def test_theta_fraction():
+    assert theta_fraction('1') == (1, 360)
+    assert theta_fraction('0.5') == (1, 720)
+    assert theta_fraction('361') == (1, 360)
+    assert theta_fraction(0) == (0, 1)
+
+def test_heading_period_origin_return_samples():
+    for theta, steps in TURTLE_ORIGIN_RETURN_SAMPLES:
+        assert heading_period(theta) == steps
+
+def test_heading_residues():
+    residues, modulus = heading_residues('1.3', 0, 500)
+    assert modulus == 3600
+    for step in range(500):
+        angle = Decimal('1.3') * step * (step + 1) / 2 % 360
+        assert angle == Decimal(360) * int(residues[step]) / modulus
+
+def test_heading_residues_start():
+    residues, _modulus = heading_residues('0.000000000123', 0, 100000)
+    tail, _modulus = heading_residues('0.000000000123', 99000, 100000)
+    assert (residues[99000:] == tail).all()
+
+def test_heading_residues_large_modulus():
+    # the modulus of 19 decimals exceeds int64
+    residues, modulus = heading_residues('0.0000000000000000001', 0, 1000)
+    assert modulus == 3600000000000000000000
+    assert [int(residue) for residue in residues] == [step * (step + 1) // 2 for step in range(1000)]
+    tail, _modulus = heading_residues('0.0000000000000000001', 990, 1000)
+    assert list(tail) == list(residues[990:])
+
+def test_symmetry_order():
+    assert symmetry_order('1') == 2
+    assert symmetry_order('1.3') == 2
+    assert symmetry_order('8') == 1
+    assert symmetry_order('0') == 1
+
+def test_sorted_divisors():
+    assert list(sorted_divisors({2: 2, 3: 1})) == [1, 2, 3, 4, 6, 12]
+    assert list(sorted_divisors({})) == [1]
+    divisors = list(sorted_divisors({2: 40, 5: 12}))
+    assert len(divisors) == 41 * 13
+    assert divisors == sorted(set(divisors))
+    assert divisors[-1] == 2 ** 40 * 5 ** 12
+
+def test_theta_scaled():
+    assert theta_scaled('1.3') == (13, 1)
+    assert theta_scaled('1.30') == (13, 1)
+    assert theta_scaled(10) == (10, 0)
+    assert theta_scaled('0.000000000123') == (123, 12)
+
+def test_smooth_factorization():
+    assert smooth_factorization(1) == {}
+    assert smooth_factorization(2 ** 40 * 3 ** 2 * 5 ** 12) == {2: 40, 3: 2, 5: 12}
+    assert smooth_factorization(2 * 7 ** 2 * 1000003) == {2: 1, 7: 2, 1000003: 1}
+
+def test_origin_return_candidates():
+    assert origin_return_candidates('1', [360]) == [720, 144, 80]
+    assert origin_return_candidates('8', [45]) == [45, 9]
+    assert origin_return_candidates('0', []) == [1]
+    candidates = origin_return_candidates('0.000000000123', [3000000000000])
+    assert candidates == sorted(candidates, reverse=True)
+    assert heading_period('0.000000000123') in candidates
+
+def test_origin_return_steps_samples():
+    for theta, steps in TURTLE_ORIGIN_RETURN_SAMPLES:
+        assert origin_return_steps(theta) == steps
+
+def test_origin_return_steps_never():
+    for theta in ('8', '1.6', '0'):
+        assert origin_return_steps(theta) is None
+
+def test_period_drift():
+    assert period_drift('1') == (0.0, 0.0)
+    assert period_drift('0') == (1.0, 0.0)
+    # quadratic Gauss sum of length sqrt(p)
+    assert math.isclose(math.hypot(*period_drift('8')), math.sqrt(45))
+    assert math.isclose(math.hypot(*period_drift('1.6')), math.sqrt(225))
+
+def test_dominant_angle_decomposition():
+    assert dominant_angle_decomposition('1') == [(Decimal('1'), Decimal('360'))]
+    assert [angle for angle, _quotient in dominant_angle_decomposition('400')] == [Decimal('360'), Decimal('40')]
+    assert dominant_angle_decomposition('0') == []
+    assert dominant_angle_decomposition('-1') == []
+    # theta has 12 decimal places, so 3E-12 is part of the decomposition
+    assert [angle for angle, _quotient in dominant_angle_decomposition('0.000000000123')] == [Decimal('1.2E-10'), Decimal('3E-12')]
+    for angle, _quotient in dominant_angle_decomposition('179.7444'):
+        assert theta_scaled(angle)[1] <= 4
+    # beyond the shipped table the angles are generated on demand
+    decomposition = dominant_angle_decomposition('0.12345678901234567')
+    assert sum(angle for angle, _quotient in decomposition) == Decimal('0.12345678901234567')
+    assert decomposition[-1] == (Decimal('1E-17'), Decimal('36000000000000000000'))
+
+def test_estimate_origin_return():
+    thetas = [theta for theta, _steps in TURTLE_ORIGIN_RETURN_SAMPLES[:400]]
+    estimations = estimate_origin_return(thetas, workers=1)
+    assert estimations == [origin_return_estimation(theta) for theta in thetas]
+    for (_theta, steps), candidates in zip(TURTLE_ORIGIN_RETURN_SAMPLES, estimations):
+        assert steps in candidates
+
+    assert estimate_origin_return(thetas, workers=2, chunksize=50) == estimations
+    minimal = estimate_origin_return(thetas, workers=2, minimal=True)
+    assert list(minimal) == [candidates[-1] for candidates in estimations]
+    assert len(estimate_origin_return([], minimal=True)) == 0
+    detailed = estimate_origin_return(thetas[:50], workers=2, with_dominant_angles=True)
+    assert detailed == [(dominant_angles(theta), origin_return_estimation(theta)) for theta in thetas[:50]]
+    with pytest.raises(ValueError):
+        estimate_origin_return(thetas, minimal=True, with_dominant_angles=True)
+
+def test_estimation_worker_init():
+    index = originreturn._quotient_index(3)
+    originreturn._QUOTIENT_INDICES.pop(3)
+    originreturn._estimation_worker_init({3: index})
+    assert originreturn._quotient_index(3) is index
+    # the parent builds the indices for the decimal places of the thetas
+    originreturn._QUOTIENT_INDICES.pop(7, None)
+    estimate_origin_return(['0.0000001', '1.5'], workers=2)
+    assert 7 in originreturn._QUOTIENT_INDICES
+
+def test_verify_origin_return():
+    assert verify_origin_return(['1', '1.3', '90', '0.5']) == [720, 7200, 8, 1440]
+    # the position returns after 360 steps already, but mirrored
+    assert verify_origin_return(['1'], max_steps=719) == [None]
+    assert verify_origin_return(['8', '1.6']) == [None, None]
+    assert verify_origin_return([]) == []
+
+def test_verify_origin_return_samples():
+    samples = TURTLE_ORIGIN_RETURN_SAMPLES[::20]
+    returns = verify_origin_return([theta for theta, _steps in samples], batch_size=64, chunk_size=1000)
+    assert returns == [steps for _theta, steps in samples]
+
+def test_origin_return_mismatches():
+    assert origin_return_mismatches([theta for theta, _steps in TURTLE_ORIGIN_RETURN_SAMPLES[:200]]) == []
+
+def test_thetas_with_return_steps():
+    assert list(thetas_with_return_steps(0, 12, 0)) == [('180', 4), ('90', 8), ('270', 8), ('60', 12), ('300', 12)]
+    assert list(thetas_with_return_steps(5, 7, 3)) == []
+
+    expected = {}
+    for theta in range(1, 3600):
+        steps = origin_return_steps(Decimal(theta) / 10)
+        if steps is not None and 1000 <= steps <= 8000:
+            expected[normalized_theta(Decimal(theta) / 10)] = steps
+    assert dict(thetas_with_return_steps(1000, 8000, 1)) == expected
+
+    for theta, steps in TURTLE_ORIGIN_RETURN_SAMPLES[:50]:
+        assert (normalized_theta(theta), steps) in thetas_with_return_steps(steps, steps, 4)
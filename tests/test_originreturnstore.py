@@ -0,0 +1,65 @@
+"""tests/test_originreturnstore.py"""
+
+from decimal import Decimal
+
+from turtlefunt.originreturn import dominant_angles, normalized_theta, origin_return_estimation
+from turtlefunt.originreturnstore import OriginReturnStore
+from .turtle_originreturnsamples import TURTLE_ORIGIN_RETURN_SAMPLES
+
+
+def test_origin_return_store(tmp_path):
+    filename = str(tmp_path / "originreturn.sqlite")
+    with OriginReturnStore(filename) as store:
+        assert len(store) == 0
+        assert '1.3' not in store
+        assert store.estimation('1.30') == origin_return_estimation('1.3')
+        assert store.dominant_angles('1.3') == [Decimal('1.2'), Decimal('0.1')]
+        assert '1.3' in store
+        assert store.return_steps('1.3') == 7200
+        assert store.return_steps('8') is None
+        assert len(store) == 2
+
+    with OriginReturnStore(filename) as store:
+        assert len(store) == 2
+        assert store.return_steps('1.3') == 7200
+        store.set_return_steps('1.3', 3600)
+        assert store.return_steps('1.3') == 3600
+
+def test_origin_return_store_large_steps():
+    with OriginReturnStore(":memory:") as store:
+        candidates = store.estimation('0.000000000000000123')
+        assert candidates[0] > 1 << 63
+        assert candidates == origin_return_estimation('0.000000000000000123')
+        assert store.dominant_angles('0.000000000000000123') == dominant_angles('0.000000000000000123')
+
+def test_origin_return_store_estimate():
+    thetas = [theta for theta, _steps in TURTLE_ORIGIN_RETURN_SAMPLES[:100]]
+    with OriginReturnStore(":memory:") as store:
+        store.estimation(thetas[0])
+        estimations = store.estimate(thetas + thetas[:10], workers=1)
+        assert len(store) == len(estimations) == len({normalized_theta(theta) for theta in thetas})
+        for theta, steps in TURTLE_ORIGIN_RETURN_SAMPLES[:100]:
+            assert steps in estimations[normalized_theta(theta)]
+
+def test_origin_return_store_estimate_workers():
+    thetas = [theta for theta, _steps in TURTLE_ORIGIN_RETURN_SAMPLES[:100]]
+    with OriginReturnStore(":memory:") as store:
+        estimations = store.estimate(thetas, workers=2)
+        for theta in thetas:
+            assert estimations[normalized_theta(theta)] == origin_return_estimation(theta)
+            assert store.dominant_angles(theta) == dominant_angles(theta)
+
+def test_origin_return_store_verify():
+    with OriginReturnStore(":memory:") as store:
+        assert store.verify(['1', '1.30', '8']) == {'1': 720, '1.3': 7200, '8': None}
+        assert store.return_steps('1.3') == 7200
+        assert store.return_steps('8') is None
+        assert store.verify(['0.5'], max_steps=100) == {'0.5': None}
+        assert store.return_steps('0.5') == 1440
+
+def test_origin_return_store_return_steps_not_verified():
+    with OriginReturnStore(":memory:") as store:
+        assert store.return_steps('1') == 720
+        # the calculated steps are not recorded as verified, so the theta is still simulated
+        assert store.verify(['1'], max_steps=100) == {'1': None}
+        assert store.verify(['1']) == {'1': 720}
@@ -0,0 +1,78 @@
+"""tests/test_pngstream.py"""
+
+from PIL import Image, ImageDraw
+import pytest
+
+from turtlefunt.pngstream import APNGStreamWriter, PNGStreamWriter
+
+
+def test_pngstream_strips(tmp_path):
+    image = Image.new("RGB", (50, 40), "black")
+    ImageDraw.Draw(image).line((0, 0, 49, 39), fill="white", width=3)
+    filename = str(tmp_path / "stream.png")
+    with PNGStreamWriter(filename, 50, 40) as writer:
+        for top in range(0, 40, 16):
+            writer.write(image.crop((0, top, 50, min(top + 16, 40))))
+    with Image.open(filename) as streamed:
+        assert streamed.mode == "RGB"
+        assert streamed.tobytes() == image.tobytes()
+
+def test_pngstream_rgba(tmp_path):
+    image = Image.new("RGBA", (10, 10), (255, 0, 0, 128))
+    filename = str(tmp_path / "stream.png")
+    with PNGStreamWriter(filename, 10, 10, "RGBA") as writer:
+        writer.write(image)
+    with Image.open(filename) as streamed:
+        assert streamed.mode == "RGBA"
+        assert streamed.tobytes() == image.tobytes()
+
+def test_pngstream_wrong_strip(tmp_path):
+    with pytest.raises(ValueError):
+        with PNGStreamWriter(str(tmp_path / "stream.png"), 10, 10) as writer:
+            writer.write(Image.new("RGB", (5, 10)))
+
+def test_pngstream_missing_rows(tmp_path):
+    writer = PNGStreamWriter(str(tmp_path / "stream.png"), 10, 10)
+    writer.write(Image.new("RGB", (10, 5)))
+    with pytest.raises(ValueError):
+        writer.close()
+
+def test_pngstream_unsupported_mode(tmp_path):
+    with pytest.raises(ValueError):
+        PNGStreamWriter(str(tmp_path / "stream.png"), 10, 10, "CMYK")
+
+def test_apngstream_frames(tmp_path):
+    frames = [Image.new("RGB", (20, 10), color) for color in ("red", "green", "blue")]
+    filename = str(tmp_path / "animation.png")
+    with APNGStreamWriter(filename, 20, 10, len(frames), duration=100) as writer:
+        for frame in frames:
+            writer.write(frame)
+    with Image.open(filename) as animation:
+        assert animation.n_frames == 3
+        for num, frame in enumerate(frames):
+            animation.seek(num)
+            assert animation.convert("RGB").tobytes() == frame.tobytes()
+            assert animation.info["duration"] == 100
+
+def test_apngstream_missing_frames(tmp_path):
+    writer = APNGStreamWriter(str(tmp_path / "animation.png"), 10, 10, 2)
+    writer.write(Image.new("RGB", (10, 10)))
+    with pytest.raises(ValueError):
+        writer.close()
+
+def test_pngstream_palette(tmp_path):
+    image = Image.new("P", (10, 10), 0)
+    image.putpalette(bytes((0, 0, 0, 255, 0, 0, 0, 255, 0)))
+    ImageDraw.Draw(image).line((0, 0, 9, 9), fill=2)
+    filename = str(tmp_path / "stream.png")
+    with PNGStreamWriter(filename, 10, 10, "P", palette=bytes(image.getpalette()), transparency=0) as writer:
+        writer.write(image)
+    with Image.open(filename) as streamed:
+        assert streamed.mode == "P"
+        assert streamed.info["transparency"] == 0
+        assert streamed.tobytes() == image.tobytes()
+        assert streamed.convert("RGB").getpixel((5, 5)) == (0, 255, 0)
+
+def test_pngstream_palette_missing(tmp_path):
+    with pytest.raises(ValueError):
+        PNGStreamWriter(str(tmp_path / "stream.png"), 10, 10, "P")
@@ -0,0 +1,135 @@
+"""tests/test_raster.py"""
+
+import numpy as np
+
+from turtlefunt.raster import collapse_pixel_runs, dilate, dilate_coverage, dilate_coverage_mask, disk_offsets, rasterize_path, rasterize_path_antialiased, rotate_half_turn, SegmentGrid, simplify_path, unique_segments
+
+
+def test_rasterize_path_horizontal():
+    index_map = np.zeros((5, 10), dtype=np.uint32)
+    rasterize_path(index_map, np.array([1.0, 8.0]), np.array([2.0, 2.0]))
+    assert (index_map[2, 1:9] == [1, 1, 1, 1, 1, 1, 1, 1]).all()
+    assert index_map.sum() == 8
+
+def test_rasterize_path_latest_step_wins():
+    index_map = np.zeros((10, 10), dtype=np.uint32)
+    rasterize_path(index_map, np.array([0.0, 9.0, 9.0, 0.0]), np.array([5.0, 5.0, 0.0, 9.0]))
+    assert index_map[5, 2] == 1
+    assert index_map[5, 4] == 3
+    assert index_map[5, 9] == 2
+
+def test_rasterize_path_clipped():
+    index_map = np.zeros((4, 4), dtype=np.uint32)
+    rasterize_path(index_map, np.array([-10.0, 10.0]), np.array([1.0, 1.0]), np.array([41]))
+    assert (index_map[1] == 42).all()
+    assert index_map.sum() == 4 * 42
+
+def test_disk_offsets():
+    assert disk_offsets(1) == [(0, 0)]
+    assert len(disk_offsets(3)) == 9
+    assert max(dx for dx, _dy in disk_offsets(5)) == 2
+
+def test_dilate():
+    index_map = np.zeros((7, 7), dtype=np.uint32)
+    index_map[3, 3] = 1
+    index_map[3, 4] = 2
+    dilated = dilate(index_map, 3)
+    assert (dilated[2:5, 2] == 1).all()
+    assert (dilated[2:5, 3:6] == 2).all()
+    assert dilated.sum() == 3 + 2 * 9
+
+def test_rasterize_path_antialiased():
+    index_map = np.zeros((5, 10), dtype=np.uint32)
+    coverage = np.zeros((5, 10), dtype=np.float32)
+    rasterize_path_antialiased(index_map, coverage, np.array([1.0, 8.0]), np.array([2.25, 2.25]))
+    assert np.allclose(coverage[2, 1:9], 0.75)
+    assert np.allclose(coverage[3, 1:9], 0.25)
+    assert (index_map[2:4, 1:9] == 1).all()
+    assert coverage[1].sum() == 0
+
+def test_dilate_coverage():
+    coverage = np.zeros((9, 9), dtype=np.float32)
+    coverage[4, 4] = 1
+    dilated = dilate_coverage(coverage, 3)
+    assert dilated[4, 5] == 1
+    assert 0 < dilated[5, 5] < 1
+    assert dilated[4, 7] == 0
+    assert dilated.max() == 1
+
+def test_rasterize_path_antialiased_integer_coverage():
+    index_map = np.zeros((5, 10), dtype=np.uint8)
+    coverage = np.zeros((5, 10), dtype=np.uint8)
+    rasterize_path_antialiased(index_map, coverage, np.array([1.0, 8.0]), np.array([2.25, 2.25]))
+    assert (coverage[2, 1:9] == 191).all()
+    assert (coverage[3, 1:9] == 64).all()
+
+def test_dilate_coverage_mask():
+    rng = np.random.default_rng(3)
+    coverage = (rng.random((40, 40)) * (rng.random((40, 40)) < 0.05)).astype(np.float32)
+    for linewidth in (1, 3, 6):
+        assert (dilate_coverage_mask(coverage, linewidth, 0.5) == (dilate_coverage(coverage, linewidth) >= 0.5)).all()
+    quantized = np.rint(coverage * 255).astype(np.uint8)
+    assert (dilate_coverage_mask(quantized, 3, 0.5) == (dilate_coverage(quantized / 255, 3) >= 0.5)).all()
+
+def test_simplify_path():
+    xpos = np.array([0.0, 0.2, 0.4, 1.0, 2.1, 3.0, 3.0, 3.0, 4.0])
+    ypos = np.array([0.0, 0.1, 0.2, 0.0, 0.0, 0.0, 1.0, 2.0, 3.0])
+    assert simplify_path(xpos, ypos).tolist() == [0, 5, 7, 8]
+
+def test_simplify_path_keep():
+    xpos = np.array([0.0, 0.2, 1.0, 2.0, 3.0])
+    ypos = np.zeros(5)
+    keep = np.array([False, True, False, True, False])
+    assert simplify_path(xpos, ypos, keep).tolist() == [0, 1, 3, 4]
+
+def test_collapse_pixel_runs():
+    xpos = np.array([0.1, 0.2, 0.3, 1.2, 1.3, 1.4, 5.0])
+    ypos = np.zeros(7)
+    assert collapse_pixel_runs(xpos, ypos, centered=False).tolist() == [0, 3, 6]
+    assert collapse_pixel_runs(xpos, ypos, ends=True).tolist() == [0, 2, 3, 5, 6]
+    keep = np.array([False, False, True, False, False, False, False])
+    assert collapse_pixel_runs(xpos, ypos, keep, centered=False).tolist() == [0, 2, 3, 6]
+    assert collapse_pixel_runs(xpos, ypos, keep, ends=True).tolist() == [0, 2, 3, 5, 6]
+    # pixels start at integer coordinates for PIL and are centered on them for rasterize_path
+    assert collapse_pixel_runs(np.array([0.0, -0.1, 0.4]), np.zeros(3), centered=False).tolist() == [0, 1, 2]
+    assert collapse_pixel_runs(np.array([0.0, -0.1, 0.4, 0.0]), np.zeros(4), ends=True).tolist() == [0, 3]
+
+def test_rasterize_path_collapsed_pixel_runs():
+    rng = np.random.default_rng(2)
+    xpos = np.cumsum(rng.normal(scale=0.1, size=2000)) + 30
+    ypos = np.cumsum(rng.normal(scale=0.1, size=2000)) + 30
+    index = collapse_pixel_runs(xpos, ypos, ends=True)
+    assert len(index) < len(xpos) / 2
+    full = np.zeros((60, 60), dtype=np.uint32)
+    rasterize_path(full, xpos, ypos)
+    collapsed = np.zeros((60, 60), dtype=np.uint32)
+    rasterize_path(collapsed, xpos[index], ypos[index])
+    assert ((full > 0) == (collapsed > 0)).all()
+
+def test_unique_segments():
+    xpos = np.array([0.0, 5.0, 0.1, 5.2, 5.0, 9.0])
+    ypos = np.array([0.0, 0.0, 0.0, 0.1, 3.0, 3.0])
+    assert unique_segments(xpos, ypos).tolist() == [0, 3, 4]
+    assert unique_segments(xpos, ypos, last=True).tolist() == [2, 3, 4]
+
+def test_rotate_half_turn():
+    pixels = np.arange(12).reshape(3, 4)
+    assert (rotate_half_turn(pixels, (3, 2)) == pixels[::-1, ::-1]).all()
+    rotated = rotate_half_turn(pixels, (2, 2))
+    assert rotated[0, 0] == pixels[2, 2]
+    assert (rotated[:, 3] == 0).all()
+    assert not rotate_half_turn(pixels, (20, 2)).any()
+
+def test_segment_grid_query():
+    rng = np.random.default_rng(1)
+    xpos = np.cumsum(rng.normal(size=5000))
+    ypos = np.cumsum(rng.normal(size=5000))
+    grid = SegmentGrid(xpos, ypos)
+    assert len(grid) == 4999
+    for xmin, ymin, xmax, ymax in ((0, 0, 5, 5), (-10, -3, 2, 8)):
+        inside = (np.maximum(xpos[:-1], xpos[1:]) >= xmin) & (np.minimum(xpos[:-1], xpos[1:]) <= xmax) & \
+            (np.maximum(ypos[:-1], ypos[1:]) >= ymin) & (np.minimum(ypos[:-1], ypos[1:]) <= ymax)
+        segments = grid.query(xmin, ymin, xmax, ymax)
+        assert np.isin(np.nonzero(inside)[0], segments).all()
+        assert len(segments) < len(grid) / 4
+    assert len(grid.query(1000, 1000, 2000, 2000)) == 0
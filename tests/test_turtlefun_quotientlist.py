@@ -0,0 +1,60 @@
+"""tests/test_turtlefun_quotientlist.py"""
+
+from decimal import Decimal, localcontext
+
+from turtlefunt import turtlefun_quotientlist
+from turtlefunt.turtlefun_quotientlist import (
+    generate_quotient_list, quotient_entry, quotient_exponents, quotient_list, smooth_quotients,
+)
+
+
+def test_quotient_exponents():
+    exponents = quotient_exponents()
+    assert exponents.shape == (1516, 3)
+    assert exponents[:, 1].max() == 2
+    quotients = [2 ** int(two) * 3 ** int(three) * 5 ** int(five) for two, three, five in exponents]
+    assert quotients == sorted(set(quotients))
+    assert quotients[-1] == 360000000000000
+
+def test_quotient_entry():
+    assert quotient_entry(0, 0, 0) == (Decimal('360'), Decimal('1'), Decimal('0'))
+    assert quotient_entry(4, 0, 1) == (Decimal('4.5'), Decimal('80'), Decimal('180'))
+    assert str(quotient_entry(48, 0, 0)[0]) == '1.278976924368180334568023681640625E-12'
+    assert str(quotient_entry(0, 1, 20)[0]) == '1.2582912E-12'
+    assert quotient_entry(0, 1, 20)[2] == 0
+
+def test_quotient_entry_string_form():
+    assert [str(part) for part in quotient_entry(4, 0, 0)] == ['22.5', '16', '180.0']
+    assert [str(part) for part in quotient_entry(0, 0, 2)] == ['14.4', '25', '0.0']
+    assert [str(part) for part in quotient_entry(15, 2, 13)] == ['1E-12', '360000000000000', '180.000000000000']
+    # the places of alpha follow from the decimal arithmetic of the generated table
+    with localcontext() as context:
+        context.prec = 200
+        for angle, quotient, alpha in quotient_list():
+            assert str(alpha) == str((quotient * (quotient + 1) * angle / Decimal('2')) % Decimal('360'))
+
+def test_quotient_list():
+    entries = quotient_list()
+    assert entries is turtlefun_quotientlist.TURTLEFUN_QUOTIENT_LIST
+    assert len(entries) == 1516
+    for angle, quotient, alpha in entries:
+        assert angle * quotient == 360
+        assert alpha == (180 if quotient % 2 == 0 else 0)
+    assert [angle for angle, _quotient, _alpha in entries] == sorted((angle for angle, _quotient, _alpha in entries), reverse=True)
+
+def test_smooth_quotients():
+    assert [quotient for quotient, _two, _three, _five in smooth_quotients(30)] == [
+        1, 2, 3, 4, 5, 6, 8, 9, 10, 12, 15, 16, 18, 20, 24, 25, 30,
+    ]
+    for quotient, two, three, five in smooth_quotients(10 ** 20):
+        assert quotient == 2 ** two * 3 ** three * 5 ** five
+        assert three <= 2
+    assert list(smooth_quotients(1)) == [(1, 0, 0, 0)]
+    assert list(smooth_quotients(0)) == []
+
+def test_generate_quotient_list():
+    assert generate_quotient_list() == quotient_list()
+    extended = generate_quotient_list(360 * 10 ** 20)
+    assert extended[:len(quotient_list())] == quotient_list()
+    assert extended[-1] == (Decimal('1E-20'), Decimal(360 * 10 ** 20), Decimal('180'))
+    assert str(extended[-1][2]) == '180.00000000000000000000'
@@ -3,13 +3,17 @@
 import colorcet as cc
 from decimal import Decimal, getcontext
 import logging
+import numpy as np
 from PIL import Image
 import pytest
 from random import randrange as random
+from xml.etree import ElementTree
 
-from turtlefunt.turtlent import decimal_places, TurtleNT, DEFAULT_IMAGE_HEIGHT, DEFAULT_IMAGE_WIDTH
+from turtlefunt.originreturnstore import OriginReturnStore
+from turtlefunt.turtlent import decimal_places, RenderMode, TurtleNT, DEFAULT_IMAGE_HEIGHT, DEFAULT_IMAGE_WIDTH, DEFAULT_PREVIEW_LEVELS
 from turtlefunt.turtlefun_quotientlist import TURTLEFUN_QUOTIENT_LIST
 from turtlefunt.palette import TurtlePalette
+from turtlefunt.raster import SegmentGrid
 from .turtle_originreturnsamples import TURTLE_ORIGIN_RETURN_SAMPLES
 from .turtlefun_lines_manual import THETA_LINES
 
@@ -173,6 +177,13 @@ def test_file_exists(tmp_path):
     assert t.file_exists() is True
     assert t2.file_exists() is True
     
+def test_positional_arguments(tmp_path):
+    t = TurtleNT('1', None, "jpg", 100, "red", 5, 200, 20, 30, str(tmp_path), 1000, 10)
+    assert (t.image_background, t.image_fileformat, t.image_height, t.image_linecolor, t.image_linewidth) == (None, "jpg", 100, "red", 5)
+    assert (t.image_width, t.image_x_offset, t.image_y_offset, t.steplimit, t.stepsize) == (200, 20, 30, 1000, 10)
+    with pytest.raises(TypeError):
+        TurtleNT('1', None, "jpg", 100, "red", 5, 200, 20, 30, str(tmp_path), 1000, 10, True)
+    
 def test_get_image_twice():
     t = TurtleNT('1')
     assert type(t.get_image()) is Image.Image
@@ -218,6 +229,15 @@ def test_dominant_angles():
     t = TurtleNT('1')
     assert t.dominant_angles() == [1]
     assert t.dominant_angles() == [1]
+
+def test_origin_return_store(tmp_path):
+    with OriginReturnStore(str(tmp_path / "originreturn.sqlite")) as store:
+        t = TurtleNT('1.3', origin_return_store=store)
+        assert t.origin_return_estimation() == TurtleNT('1.3').origin_return_estimation()
+        assert t.dominant_angles() == [Decimal('1.2'), Decimal('0.1')]
+        assert '1.3' in store
+        store.set_return_steps('1.3', 3600)
+        assert t.origin_return_steps() == 3600
     
 def test_use_manual_filename(tmp_path):
     t = TurtleNT('1', path=tmp_path)
@@ -268,4 +288,472 @@ def test_minus_one():
 
 def test_threehundretsixtyone():
     t = TurtleNT('361')
-    assert t.get_theta() == 1
\ No newline at end of file
+    assert t.get_theta() == 1
+
+def test_save_image_strips_equals_image(tmp_path):
+    t = TurtleNT('1.3', path=tmp_path, image_width=400, image_height=300, image_linecolor=cc.cyclic_bgrmb_35_70_c75)
+    t.euler_spiral()
+    image = t.get_image(mark_origin=True)
+    filename = str(tmp_path / "strips.png")
+    t.save_image_strips(filename, strip_height=37, mark_origin=True)
+    with Image.open(filename) as strips:
+        assert strips.size == image.size
+        assert strips.mode == image.mode
+        assert strips.tobytes() == image.tobytes()
+
+def test_save_image_strips_render_modes(tmp_path):
+    for options in (
+        {"image_render": RenderMode.DILATE},
+        {"image_render": RenderMode.ANTIALIAS},
+        {"image_render": RenderMode.ANTIALIAS, "image_background": None, "image_linewidth": 7},
+        {"image_render": RenderMode.DILATE, "image_simplify": True, "image_deduplicate": True},
+        {"image_render": RenderMode.DILATE, "image_indexed": True},
+        {"image_deduplicate": True, "image_linecolor": "white"},
+    ):
+        options = {"image_linecolor": cc.cyclic_bgrmb_35_70_c75, **options}
+        t = TurtleNT('1.3', path=tmp_path, image_width=400, image_height=300, **options)
+        t.euler_spiral()
+        image = t.get_image(mark_origin=True)
+        filename = str(tmp_path / "strips.png")
+        t.save_image_strips(filename, strip_height=37, mark_origin=True)
+        with Image.open(filename) as strips:
+            assert strips.mode == image.mode
+            assert strips.tobytes() == image.tobytes()
+
+def test_save_image_strips_simplified(tmp_path):
+    for render in (RenderMode.LINE, RenderMode.DILATE):
+        t = TurtleNT('0.001', path=tmp_path, image_width=400, image_height=300, image_linecolor=cc.cyclic_bgrmb_35_70_c75, image_render=render, image_simplify=True)
+        t.euler_spiral(30000)
+        image = t.get_image(mark_origin=True)
+        filename = str(tmp_path / "strips.png")
+        t.save_image_strips(filename, strip_height=37, mark_origin=True)
+        with Image.open(filename) as strips:
+            assert strips.tobytes() == image.tobytes()
+
+def test_save_image_strips_transparent(tmp_path):
+    t = TurtleNT('1', path=tmp_path, image_background=None, image_width=200, image_height=100)
+    t.euler_spiral()
+    t.save_image_strips(strip_height=16)
+    assert t.file_exists() is True
+
+def test_preview_levels():
+    t = TurtleNT('1.3', image_width=400, image_height=200, image_linecolor=cc.cyclic_bgrmb_35_70_c75)
+    t.euler_spiral()
+    received = []
+    images = list(t.preview(((64, 0.25), (1, 0.25), (1, 0.5)), lambda image, decimation, resolution: received.append((decimation, resolution))))
+    assert [image.size for image in images] == [(100, 50), (100, 50), (200, 100)]
+    assert received == [(64, 0.25), (1, 0.25), (1, 0.5)]
+    assert t._image is None
+
+def test_preview_full_level_equals_image():
+    t = TurtleNT('1', image_width=200, image_height=100)
+    t.euler_spiral()
+    preview = next(t.preview(((1, 1.0),)))
+    assert preview.tobytes() == t.get_image().tobytes()
+
+def test_preview_decimation_of_resolution(caplog):
+    t = TurtleNT('1', image_width=200, image_height=100)
+    t.euler_spiral()
+    with caplog.at_level(logging.DEBUG):
+        list(t.preview(((16, 0.25), (1, 0.25), (1, 0.5))))
+        assert "Preview with 46 positions at 50x25" in caplog.text
+        assert "Preview with 181 positions at 50x25" in caplog.text
+        assert "Preview with 361 positions at 100x50" in caplog.text
+
+def test_unit_positions():
+    t = TurtleNT('1.3')
+    t.euler_spiral(1000)
+    steps = np.arange(0, 1001, 3)
+    xpos, ypos = t._unit_positions(steps, (steps[::4], *t._scaled_positions(1, steps[::4])))
+    expected = t._scaled_positions(1, steps)
+    assert (xpos == expected[0]).all()
+    assert (ypos == expected[1]).all()
+
+def test_get_image_sizes():
+    t = TurtleNT('1.3', image_width=400, image_height=200, image_linecolor=cc.cyclic_bgrmb_35_70_c75)
+    t.euler_spiral()
+    images = t.get_image(sizes=[(100, 50), (400, 200), (800, 400)], mark_origin=True)
+    assert [image.size for image in images] == [(100, 50), (400, 200), (800, 400)]
+    assert images[1].tobytes() == t.get_image(mark_origin=True).tobytes()
+
+def test_save_image_sizes(tmp_path):
+    t = TurtleNT('1', path=tmp_path)
+    t.euler_spiral()
+    t.save_image(str(tmp_path / "sized.png"), sizes=[(64, 36), (256, 144)])
+    with Image.open(tmp_path / "sized_64x36.png") as image:
+        assert image.size == (64, 36)
+    with Image.open(tmp_path / "sized_256x144.png") as image:
+        assert image.size == (256, 144)
+    t.save_image(sizes=[(32, 18)])
+    assert t.file_exists() is True
+
+def test_get_image_incremental_fixed_bounds():
+    t = TurtleNT('1.3', image_width=400, image_height=200)
+    t.set_image_bounds((-20000, -20000, 20000, 20000))
+    t.euler_spiral(3000)
+    t.get_image(mark_origin=True)
+    t.euler_spiral()
+    image = t.get_image(mark_origin=True)
+    assert t._image_drawn_num == len(t._xpos_list)
+    
+    full = TurtleNT('1.3', image_width=400, image_height=200)
+    full.set_image_bounds((-20000, -20000, 20000, 20000))
+    full.euler_spiral()
+    assert image.tobytes() == full.get_image(mark_origin=True).tobytes()
+
+def test_get_image_incremental_scale_of_image(tmp_path):
+    t = TurtleNT('1', image_width=400, image_height=200)
+    t.set_image_bounds(('-5000', '-5000', '5000', '5000'))
+    t.euler_spiral(300)
+    t.get_image(autoscale=False)
+    # the autoscaled export must not pass for the scale of the cached image
+    t.save_svg(str(tmp_path / "spiral.svg"))
+    t.euler_spiral()
+    image = t.get_image()
+    
+    full = TurtleNT('1', image_width=400, image_height=200)
+    full.set_image_bounds(('-5000', '-5000', '5000', '5000'))
+    full.euler_spiral()
+    assert image.tobytes() == full.get_image().tobytes()
+
+def test_get_image_incremental_only_new_segments(caplog):
+    t = TurtleNT('1', image_width=400, image_height=200)
+    t.set_image_bounds(('-5000', '-5000', '5000', '5000'))
+    t.euler_spiral(300)
+    t.get_image()
+    t.euler_spiral()
+    with caplog.at_level(logging.DEBUG):
+        t.get_image()
+        assert "Extending 400x200 image from step 300" in caplog.text
+    assert t.get_image() is t._image
+    t.euler_spiral(800)
+    caplog.clear()
+    with caplog.at_level(logging.DEBUG):
+        t.get_image(force_redraw=True)
+        assert "Extending" not in caplog.text
+        assert "Drawing new 400x200 image." in caplog.text
+
+def test_get_image_redraw_on_render_change():
+    for render in RenderMode:
+        t = TurtleNT('1', image_width=200, image_height=100, image_render=render)
+        t.euler_spiral()
+        t.get_image()
+        t.image_linecolor = 'red'
+        t.image_linewidth = 9
+        image = t.get_image()
+        colors = {color for _count, color in image.getcolors()}
+        assert (255, 255, 255) not in colors
+        assert (255, 0, 0) in colors
+        
+        full = TurtleNT('1', image_width=200, image_height=100, image_linecolor='red', image_linewidth=9, image_render=render)
+        full.euler_spiral()
+        assert image.tobytes() == full.get_image().tobytes()
+        
+        t.image_background = 'blue'
+        t.image_x_offset = 80
+        image = t.get_image(force_redraw=True)
+        assert image.getpixel((0, 0)) == (0, 0, 255)
+        full.image_background = 'blue'
+        full.image_x_offset = 80
+        assert image.tobytes() == full.get_image().tobytes()
+
+def test_get_image_redraw_on_scale_change(caplog):
+    t = TurtleNT('1', image_width=400, image_height=200)
+    t.euler_spiral(300)
+    t.get_image()
+    t.euler_spiral()
+    with caplog.at_level(logging.DEBUG):
+        t.get_image()
+        assert "Extending" not in caplog.text
+
+def test_predict_bounds():
+    for theta, steps in (('1', 720), ('1', 300), ('8', 200), ('0', 50), ('0.0000000000000000001', 100)):
+        t = TurtleNT(theta)
+        bounds = t.predict_bounds(steps)
+        t.euler_spiral(steps)
+        for predicted, actual in zip(bounds, (t.get_xmin(), t.get_ymin(), t.get_xmax(), t.get_ymax())):
+            assert abs(predicted - actual) < Decimal('1E-6')
+
+def test_render_mode_dilate():
+    line = TurtleNT('1.3', image_width=400, image_height=300, image_linecolor=cc.cyclic_bgrmb_35_70_c75)
+    line.euler_spiral()
+    dilated = TurtleNT('1.3', image_width=400, image_height=300, image_linecolor=cc.cyclic_bgrmb_35_70_c75, image_render=RenderMode.DILATE)
+    dilated.euler_spiral()
+    line_pixels = np.asarray(line.get_image()).any(axis=2)
+    dilated_pixels = np.asarray(dilated.get_image(mark_origin=True)).any(axis=2)
+    assert (line_pixels & dilated_pixels).sum() > 0.9 * line_pixels.sum()
+    assert (dilated_pixels & ~line_pixels).sum() < 0.2 * line_pixels.sum()
+
+def test_render_mode_dilate_extend():
+    t = TurtleNT('1', image_width=200, image_height=100, image_background=None, image_render=RenderMode.DILATE)
+    t.set_image_bounds((-5000, -5000, 5000, 5000))
+    t.euler_spiral(300)
+    t.get_image()
+    t.euler_spiral()
+    image = t.get_image()
+    assert image.mode == "RGBA"
+    full = TurtleNT('1', image_width=200, image_height=100, image_background=None, image_render=RenderMode.DILATE)
+    full.set_image_bounds((-5000, -5000, 5000, 5000))
+    full.euler_spiral()
+    assert image.tobytes() == full.get_image().tobytes()
+
+def test_render_mode_antialias():
+    t = TurtleNT('1.3', image_width=400, image_height=300, image_render=RenderMode.ANTIALIAS)
+    t.euler_spiral()
+    pixels = np.asarray(t.get_image())
+    levels = np.unique(pixels)
+    assert len(levels) > 10
+    transparent = TurtleNT('1.3', image_width=400, image_height=300, image_background=None, image_render=RenderMode.ANTIALIAS)
+    transparent.euler_spiral()
+    alpha = np.asarray(transparent.get_image())[:, :, 3]
+    assert ((alpha > 0) & (alpha < 255)).any()
+    assert ((alpha > 0) == pixels.any(axis=2)).all()
+
+def test_image_simplify(caplog):
+    for theta, steps in (('0.001', 30000), ('179.7444', 20000)):
+        for render in RenderMode:
+            for linecolor in ("white", cc.cyclic_bgrmb_35_70_c75):
+                t = TurtleNT(theta, image_width=400, image_height=300, image_linecolor=linecolor, image_render=render)
+                t.euler_spiral(steps)
+                simplified = TurtleNT(theta, image_width=400, image_height=300, image_linecolor=linecolor, image_render=render, image_simplify=True)
+                simplified.euler_spiral(steps)
+                assert simplified.get_image().tobytes() == t.get_image().tobytes()
+    
+    t = TurtleNT('0.001', image_width=400, image_height=300, image_render=RenderMode.DILATE, image_simplify=True)
+    t.euler_spiral(30000)
+    with caplog.at_level(logging.DEBUG):
+        t.get_image()
+        assert "Simplified path from 30001 to" in caplog.text
+        assert "Simplified path from 30001 to 30001" not in caplog.text
+
+def test_image_simplify_extend():
+    for render in (RenderMode.LINE, RenderMode.DILATE):
+        t = TurtleNT('0.001', image_width=400, image_height=300, image_render=render, image_simplify=True)
+        t.set_image_bounds((-500000, -500000, 500000, 500000))
+        t.euler_spiral(10000)
+        t.get_image()
+        t.euler_spiral(30000)
+        full = TurtleNT('0.001', image_width=400, image_height=300, image_render=render)
+        full.set_image_bounds((-500000, -500000, 500000, 500000))
+        full.euler_spiral(30000)
+        assert t.get_image().tobytes() == full.get_image().tobytes()
+
+def test_image_deduplicate(caplog):
+    for linecolor, render in (("white", RenderMode.LINE), (cc.cyclic_bgrmb_35_70_c75, RenderMode.DILATE)):
+        t = TurtleNT('90.01', image_width=400, image_height=300, image_linecolor=linecolor, image_render=render)
+        t.euler_spiral()
+        deduplicated = TurtleNT('90.01', image_width=400, image_height=300, image_linecolor=linecolor, image_render=render, image_deduplicate=True)
+        deduplicated.euler_spiral()
+        pixels = np.asarray(t.get_image())
+        with caplog.at_level(logging.DEBUG):
+            difference = (pixels != np.asarray(deduplicated.get_image())).any(axis=2)
+            assert "Deduplicated 72000 to" in caplog.text
+        assert difference.sum() < 0.02 * pixels.any(axis=2).sum()
+
+def test_image_deduplicate_palette_line(caplog):
+    t = TurtleNT('1', image_linecolor=cc.cyclic_bgrmb_35_70_c75, image_deduplicate=True)
+    t.euler_spiral()
+    with caplog.at_level(logging.DEBUG):
+        t.get_image()
+        assert "Segment deduplication requires" in caplog.text
+
+def test_symmetry_euler_spiral(caplog):
+    t = TurtleNT('1.3')
+    t.euler_spiral()
+    symmetric = TurtleNT('1.3', symmetry=True)
+    with caplog.at_level(logging.DEBUG):
+        symmetric.euler_spiral()
+        assert "Completed 7200 steps by a half-turn of the first 3600 steps" in caplog.text
+    assert symmetric.is_home()
+    assert symmetric.get_steps() == t.get_steps()
+    assert symmetric.get_angle() == t.get_angle()
+    for symmetric_pos, pos in zip(symmetric._xpos_list + symmetric._ypos_list, t._xpos_list + t._ypos_list):
+        assert abs(symmetric_pos - pos) < Decimal('1E-9')
+
+def test_symmetry_not_applicable():
+    t = TurtleNT('8')
+    t.euler_spiral()
+    symmetric = TurtleNT('8', symmetry=True)
+    symmetric.euler_spiral()
+    assert symmetric._xpos_list == t._xpos_list
+
+def test_symmetry_image(caplog):
+    for render in (RenderMode.DILATE, RenderMode.ANTIALIAS):
+        t = TurtleNT('45.5', image_width=400, image_height=300, image_linecolor=cc.cyclic_bgrmb_35_70_c75, image_render=render)
+        t.euler_spiral()
+        symmetric = TurtleNT('45.5', image_width=400, image_height=300, image_linecolor=cc.cyclic_bgrmb_35_70_c75, image_render=render, symmetry=True)
+        symmetric.euler_spiral()
+        pixels = np.asarray(t.get_image())
+        with caplog.at_level(logging.DEBUG):
+            difference = (pixels != np.asarray(symmetric.get_image())).any(axis=2)
+            assert "Composed steps 720 to 1440 by a half-turn" in caplog.text
+        assert difference.sum() < 0.02 * pixels.any(axis=2).sum()
+
+def test_render_viewport_full_extent():
+    for render in (RenderMode.LINE, RenderMode.DILATE):
+        t = TurtleNT('1.3', image_width=400, image_height=300, image_render=render)
+        t.euler_spiral()
+        scale = float(t._autoscale())
+        viewport = t.render_viewport(-200 / scale, -150 / scale, 200 / scale, 150 / scale)
+        assert viewport.tobytes() == t.get_image().tobytes()
+
+def test_render_viewport_culling(caplog):
+    t = TurtleNT('1.3', image_linecolor=cc.cyclic_bgrmb_35_70_c75)
+    t.euler_spiral()
+    with caplog.at_level(logging.DEBUG):
+        viewport = t.render_viewport(0, 0, 2000, 1000, (400, 200), mark_origin=True)
+        assert "out of 7200 segments into 400x200 viewport" in caplog.text
+    assert np.asarray(viewport).any()
+    t._segment_grid = SegmentGrid(t._segment_grid.xpos, t._segment_grid.ypos, cell_size=1E12)
+    assert viewport.tobytes() == t.render_viewport(0, 0, 2000, 1000, (400, 200), mark_origin=True).tobytes()
+    with pytest.raises(ValueError):
+        t.render_viewport(0, 0, 0, 1000)
+
+def test_build_lod_pyramid():
+    t = TurtleNT('179.7444', image_width=800, image_height=600, image_linecolor=cc.cyclic_bgrmb_35_70_c75, image_simplify=True)
+    t.euler_spiral(20000)
+    pyramid = t.build_lod_pyramid()
+    assert len(pyramid) == 11
+    assert pyramid[-1][0] == pyramid[0][0] / 1024
+    counts = [len(steps) for _scale, _xpos, _ypos, steps in pyramid]
+    assert counts == sorted(counts, reverse=True)
+    assert counts[-1] < counts[0] / 10
+    assert t.build_lod_pyramid() is pyramid
+    t.euler_spiral(20001)
+    assert t.build_lod_pyramid() is not pyramid
+
+def test_lod_sized_images(caplog):
+    t = TurtleNT('179.7444', image_width=800, image_height=600)
+    t.euler_spiral(20000)
+    simplified = TurtleNT('179.7444', image_width=800, image_height=600, image_simplify=True)
+    simplified.euler_spiral(20000)
+    with caplog.at_level(logging.DEBUG):
+        image = simplified.get_image(sizes=[(400, 300)])[0]
+        assert "Using level of detail" in caplog.text
+    pixels = np.asarray(t.get_image(sizes=[(400, 300)])[0])
+    difference = (pixels != np.asarray(image)).any(axis=2)
+    assert difference.sum() < 0.01 * pixels.any(axis=2).sum()
+    assert len(list(simplified.preview())) == len(DEFAULT_PREVIEW_LEVELS)
+    assert np.asarray(simplified.render_viewport(-100000, -100000, 100000, 100000, (200, 200))).any()
+
+def test_save_animation(tmp_path):
+    t = TurtleNT('1.3', image_width=200, image_height=150, image_linecolor=cc.cyclic_bgrmb_35_70_c75)
+    filename = str(tmp_path / "animation.png")
+    t.save_animation(filename, frames=10, total_steps=7200)
+    assert t.get_steps() == 7200
+    with Image.open(filename) as animation:
+        assert animation.n_frames == 10
+        animation.seek(9)
+        assert animation.convert("RGB").tobytes() == t.get_image().tobytes()
+
+def test_save_animation_gif_and_numbered(tmp_path):
+    t = TurtleNT('1.3', image_width=100, image_height=100, image_render=RenderMode.DILATE)
+    t.euler_spiral()
+    t.save_animation(str(tmp_path / "animation.gif"), frames=4)
+    with Image.open(str(tmp_path / "animation.gif")) as animation:
+        # PIL merges identical frames, the second quarter retraces the first one
+        assert animation.n_frames == 2
+    t.save_animation(str(tmp_path / "frame_{:02d}.png"), frames=4, mark_origin=True)
+    assert sorted(path.name for path in tmp_path.glob("frame_*.png")) == ["frame_00.png", "frame_01.png", "frame_02.png", "frame_03.png"]
+    with Image.open(str(tmp_path / "frame_03.png")) as last:
+        assert last.tobytes() == t.get_image(mark_origin=True).tobytes()
+
+def test_save_animation_default_filename(tmp_path):
+    t = TurtleNT('1', image_width=100, image_height=100, path=tmp_path)
+    t.euler_spiral()
+    t.save_animation(frames=3)
+    assert t.file_exists() is True
+
+def test_save_animation_invalid(tmp_path):
+    filename = str(tmp_path / "animation.png")
+    with pytest.raises(ValueError):
+        TurtleNT('1', steplimit=10).save_animation(filename, frames=3, total_steps=720)
+    with pytest.raises(ValueError):
+        TurtleNT('1').save_animation(filename, frames=0, total_steps=720)
+    with pytest.raises(ValueError):
+        TurtleNT('1').save_animation(filename, frames=3)
+
+def test_save_svg(tmp_path):
+    t = TurtleNT('1.3', image_width=400, image_height=300, image_linecolor=['#ff0000', '#00ff00', '#0000ff'])
+    t.euler_spiral()
+    filename = str(tmp_path / "spiral.svg")
+    t.save_svg(filename, mark_origin=True)
+    root = ElementTree.parse(filename).getroot()
+    assert root.get("width") == "400"
+    paths = root.findall(".//{http://www.w3.org/2000/svg}path")
+    assert [path.get("stroke") for path in paths] == ['#ff0000', '#00ff00', '#0000ff']
+    # consecutive paths are connected
+    for path, following in zip(paths[:-1], paths[1:]):
+        assert path.get("d").replace("L", "").split()[-2:] == following.get("d")[1:].split()[:2]
+    assert len(root.findall(".//{http://www.w3.org/2000/svg}circle")) == 1
+
+def test_save_svg_simplified_chunks(tmp_path):
+    t = TurtleNT('179.7444', image_width=400, image_height=300)
+    t.euler_spiral(20000)
+    counts = []
+    for tolerance, chunk_size in ((1.0, 1 << 20), (1.0, 1000), (4.0, 1 << 20)):
+        filename = str(tmp_path / "spiral.svg")
+        t.save_svg(filename, tolerance=tolerance, chunk_size=chunk_size)
+        paths = ElementTree.parse(filename).getroot().findall(".//{http://www.w3.org/2000/svg}path")
+        assert len(paths) == 1
+        counts.append(len(paths[0].get("d").replace("M", "").replace("L", "").split()) // 2)
+    assert counts[0] < 20000
+    assert abs(counts[1] - counts[0]) < 0.05 * counts[0]
+    assert counts[2] < counts[0]
+
+def test_image_indexed():
+    for linecolor, render in (("white", RenderMode.LINE), (cc.cyclic_bgrmb_35_70_c75, RenderMode.DILATE)):
+        t = TurtleNT('1.3', image_width=400, image_height=300, image_linecolor=linecolor, image_render=render)
+        t.euler_spiral()
+        indexed = TurtleNT('1.3', image_width=400, image_height=300, image_linecolor=linecolor, image_render=render, image_indexed=True)
+        indexed.euler_spiral()
+        image = indexed.get_image(mark_origin=True)
+        assert image.mode == "P"
+        assert image.convert("RGB").tobytes() == t.get_image(mark_origin=True).tobytes()
+
+def test_image_indexed_byte_maps():
+    for render in (RenderMode.DILATE, RenderMode.ANTIALIAS):
+        t = TurtleNT('1.3', image_width=400, image_height=300, image_linecolor=cc.cyclic_bgrmb_35_70_c75, image_render=render, image_indexed=True)
+        t.euler_spiral()
+        t.get_image()
+        assert t._index_map.dtype == np.uint8
+        assert t._coverage_map is None or t._coverage_map.dtype == np.uint8
+    
+    # the half-turn composition needs step numbers
+    symmetric = TurtleNT('1.3', image_width=400, image_height=300, image_linecolor=cc.cyclic_bgrmb_35_70_c75, image_render=RenderMode.DILATE, image_indexed=True, symmetry=True)
+    symmetric.euler_spiral()
+    image = symmetric.get_image()
+    assert symmetric._index_map.dtype == np.uint32
+    full = TurtleNT('1.3', image_width=400, image_height=300, image_linecolor=cc.cyclic_bgrmb_35_70_c75, image_render=RenderMode.DILATE, symmetry=True)
+    full.euler_spiral()
+    assert image.convert("RGB").tobytes() == full.get_image().tobytes()
+
+def test_image_indexed_resampled_palette(caplog, tmp_path):
+    t = TurtleNT('1.3', image_width=400, image_height=300, image_linecolor=cc.fire, image_background=None, image_indexed=True)
+    t.euler_spiral()
+    with caplog.at_level(logging.WARNING):
+        image = t.get_image()
+        assert "Palette of 256 colors is resampled to 254 colors" in caplog.text
+    assert len(image.getpalette()) == 3 * 256
+    assert image.info["transparency"] == 0
+    filename = str(tmp_path / "strips.png")
+    t.save_image_strips(filename, strip_height=64)
+    with Image.open(filename) as streamed:
+        assert streamed.mode == "P"
+        assert streamed.convert("RGBA").tobytes() == image.convert("RGBA").tobytes()
+
+def test_euler_spiral_exact_origin_return():
+    t = TurtleNT('1.3')
+    assert t.origin_return_steps() == 7200
+    assert t.euler_spiral() is True
+    assert t.get_steps() == 7200
+    assert t.is_home()
+
+def test_euler_spiral_never_home(caplog):
+    t = TurtleNT('8')
+    assert t.origin_return_steps() is None
+    with caplog.at_level(logging.WARNING):
+        assert t.euler_spiral() is False
+        assert "Turtle never returns home for theta 8" in caplog.text
+    assert t.get_steps() == 45
+    assert not t.is_home()